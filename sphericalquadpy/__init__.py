@@ -1,15 +1,9 @@
 # pylint: disable=C0111
-from . import tools
-from . import quadrature
-from . import montecarlo
-from . import lebedev
-from . import levelsymmetric
-from . import ldfesa
-from . import gausslegendre
-from . import octalerp
-from . import octaslerp
-from . import icolerp
-from . import icoslerp
+# The subpackages are imported lazily (PEP 562), such that
+# `import sphericalquadpy` is cheap and only the quadratures
+# that are actually used get imported.
+import importlib
+import sys
 
 __all__ = [
     "tools",
@@ -18,9 +12,27 @@ __all__ = [
     "lebedev",
     "levelsymmetric",
     "ldfesa",
+    "ldfeLinDisc",
     "gausslegendre",
     "octalerp",
     "octaslerp",
     "icolerp",
     "icoslerp",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if sys.version_info < (3, 7):
+    # module attributes are only looked up in __getattr__ from Python 3.7 on,
+    # so the subpackages are imported eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -1,49 +1,102 @@
 """GaussLegendre quadrature."""
-from numpy import pi, inf, zeros, sqrt, cos, sin
+import math
+from numpy import (
+    pi,
+    inf,
+    arange,
+    asarray,
+    empty,
+    floor,
+    maximum,
+    outer,
+    repeat,
+    sqrt,
+    cos,
+    sin,
+)
 from numpy.polynomial.legendre import leggauss
 from sphericalquadpy.quadrature.quadrature import Quadrature
 
 
+def azimuthalangles(order):
+    """The 2*order equidistant azimuthal angles."""
+    return pi * (arange(2 * order) + 1 / 2) / order
+
+
+def tensorpoints(mu, phi):
+    """Tensor product of the polar cosines mu and the azimuthal angles phi.
+    The polar index runs slowest, i.e. point i * len(phi) + j belongs to
+    (mu[i], phi[j])."""
+    sinpolar = sqrt(1 - mu ** 2)
+    xyz = empty((len(mu), len(phi), 3))
+    xyz[:, :, 0] = outer(sinpolar, cos(phi))
+    xyz[:, :, 1] = outer(sinpolar, sin(phi))
+    xyz[:, :, 2] = mu[:, None]
+    return xyz.reshape(-1, 3)
+
+
+def tensorweights(leggaussweights, order):
+    """Weights that belong to tensorpoints, normalized to 4pi."""
+    w = repeat(2 * pi / order * leggaussweights, 2 * order)
+    w /= w.sum()
+    w *= 4 * pi
+    return w
+
+
 class GaussLegendre(Quadrature):
     """GaussLegendre Quadrature"""
 
+    cacheable = True
+
     def name(self):
         return "GaussLegendre Quadrature"
 
     def getmaximalorder(self):
         return inf
 
+    def computequadrature(self, order):
+        """Quadrature points and weights for GaussLegendre quadrature.
+        The Gauss-Legendre rule is only computed once for both."""
+        mu, leggaussweights = leggauss(order)
+        xyz = tensorpoints(mu, azimuthalangles(order))
+        return xyz, tensorweights(leggaussweights, order)
+
     def computequadpoints(self, order):
-        """Quadrature points for GaussLegendre quadrature. Read from file."""
+        """Quadrature points for GaussLegendre quadrature."""
         mu, _ = leggauss(order)
-        phi = [pi * (k + 1 / 2) / order for k in range(2 * order)]
-        xyz = zeros((2 * order * order, 3))
-        count = 0
-        for i in range(order):
-            for j in range(2 * order):
-                mui = mu[i]
-                phij = phi[j]
-                xyz[count, 0] = sqrt(1 - mui ** 2) * cos(phij)
-                xyz[count, 1] = sqrt(1 - mui ** 2) * sin(phij)
-                xyz[count, 2] = mui
-                count += 1
-
-        return xyz
+        return tensorpoints(mu, azimuthalangles(order))
 
     def computequadweights(self, order):
-        """Quadrature weights for GaussLegendre quadrature. Read from file."""
+        """Quadrature weights for GaussLegendre quadrature."""
         _, leggaussweights = leggauss(order)
-        w = zeros(2 * order * order)
-        count = 0
-        for i in range(order):
-            for j in range(2 * order):
-                w[count] = 2 * pi / order * leggaussweights[i]
-                count += 1
-
-        w /= sum(w)
-        w *= 4 * pi
-        return w
+        return tensorweights(leggaussweights, order)
 
     def nqbyorder(self, order):
         """Scales quadratically"""
         return order, 2 * order ** 2
+
+    def getcorrespondingorder(self, nquadpoints_desired):
+        """The largest order with 2 * order ** 2 <= nquadpoints_desired.
+        The floating point square root is corrected where it is off (math.isqrt
+        needs Python 3.8)."""
+        half = max(int(nquadpoints_desired), 0) // 2
+        order = int(math.sqrt(half))
+        while order ** 2 > half:
+            order -= 1
+        while (order + 1) ** 2 <= half:
+            order += 1
+        return order
+
+    def nqbyorders(self, orders):
+        """Scales quadratically"""
+        orders = asarray(orders)
+        return orders, 2 * orders ** 2
+
+    def getcorrespondingorders(self, nquadpoints_desired):
+        """Batched getcorrespondingorder. The floating point square root is
+        corrected by one where it is off."""
+        halves = maximum(asarray(nquadpoints_desired).astype(int), 0) // 2
+        orders = floor(sqrt(halves)).astype(int)
+        orders -= orders ** 2 > halves
+        orders += (orders + 1) ** 2 <= halves
+        return orders
@@ -0,0 +1,4 @@
+# pylint: disable=C0111
+from .ldfelindisc import LDFELinDisc, generateldfe
+
+__all__ = ["LDFELinDisc", "generateldfe"]
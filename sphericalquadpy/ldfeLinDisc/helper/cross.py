@@ -1,4 +1,4 @@
-from numba import jit
+from sphericalquadpy.tools.compiled import jit
 from numpy import zeros, double
 
 
@@ -1,22 +1,32 @@
+import logging
 from time import time
 
 from numpy import sqrt, linspace, array, ones, \
-    zeros, eye, transpose
-from numpy.linalg import solve, norm
-from numpy.random import rand
-from scipy.integrate import dblquad
+    zeros, transpose, outer
+from numpy.linalg import solve, norm, lstsq
+from numpy.polynomial.legendre import leggauss
 from scipy.optimize import least_squares, dual_annealing
-from numba import jit
+from sphericalquadpy.tools.compiled import jit
 from sphericalquadpy.ldfeLinDisc.helper.miscellaneous import project, EPSILON
 from sphericalquadpy.ldfeLinDisc.helper.sphericaltrigonometry import s2area
-from sphericalquadpy.ldfeLinDisc.vistools import scatterplot
 
+LOGGER = logging.getLogger(__name__)
 
-def ldfe(n=3):
+# Number of Gauss-Legendre points per direction for the integrals over a cell.
+# The integrands are analytic on the cube face and their singularities are at
+# least a = 1/sqrt(3) away from it, so 16 points give machine precision even
+# for a single cell that covers the whole face.
+GAUSSPOINTS = 16
+
+
+def ldfe(n=3, callback=None, plot=False):
     """ Return the quadrature points `p`
     and the corresponding quadrature weights `w`
     for the LDFE quadrature of order `n`.
-    Introduced by Lau & Adams in 2016. """
+    Introduced by Lau & Adams in 2016.
+    Nothing is printed, the convergence of every cell is
+    logged and passed to callback, see reportcell.
+    With plot=True, the points are shown with matplotlib. """
 
     # We will use the following coordinate system.
     #
@@ -44,48 +54,93 @@ def ldfe(n=3):
     weights = zeros(1 * 1 * 4 * n * n)
     square = zeros(1 * 1 * 4 * n * n)
     counter = 0
-    rhos0 = 0.1 * ones(4)
+    optimalrhos = {}
     for i in range(n):
         for j in range(n):
-            x0, x1, z0, z1 = x[i], x[i + 1], z[j], z[j + 1]
-
-            omegas = computeomegas(x0, x1, z0, z1)
-            areas = computeareas(omegas, x0, x1, z0, z1)
-            print("\n\nOptimiztation for:")
-            print("Domain:")
-            print([x0, x1, z0, z1])
-
-            rhos = optimizeposition_leastsquares(areas, omegas, x0, x1, z0, z1,
-                                                 rhos0)
-            rhos0 = rhos  # take the optimal parameter of this cell as the starting value for the optimizer in the next cell
-            dummy = rand()
-            for k in range(4):
-                points[counter, :] = project(omegas[k](rhos[k]))
-                weights[counter] = areas[k]
-                square[counter] = dummy
-                counter += 1
-    scatterplot(points, weights, square)
+            # take the optimal parameter of the seed cell as the starting
+            # value for the optimizer in this cell
+            seed = seedcell(i, j)
+            rhos0 = 0.1 * ones(4) if seed is None else optimalrhos[seed]
+            cellpoints, cellweights, optimalrhos[i, j], info = ldfecell(
+                x[i], x[i + 1], z[j], z[j + 1], rhos0)
+            points[counter:counter + 4, :] = cellpoints
+            weights[counter:counter + 4] = cellweights
+            square[counter:counter + 4] = i * n + j
+            counter += 4
+            reportcell(i, j, info, callback)
+    if plot:
+        # matplotlib is only imported if a plot is requested
+        from sphericalquadpy.ldfeLinDisc.vistools import scatterplot
+
+        scatterplot(points, weights, square)
     return points, weights
 
 
-def optimizeposition_leastsquares(areas, omegas, x0, x1, z0, z1, rhos0):
-    def tomin(r):
-        y = f(r, omegas, 1 / sqrt(3), x0, x1, z0, z1, areas)
-        # print(norm(y))
-        return norm(y)
+def seedcell(i, j):
+    """ The cell whose optimal rhos are the starting values for the cell
+    (i,j), i.e. the previous cell (i,j-1) in the same row and, for the first
+    cell of a row, the first cell (i-1,0) of the previous row.
+    None for the cell (0,0), which starts from 0.1. """
+    if j > 0:
+        return i, j - 1
+    if i > 0:
+        return i - 1, 0
+    return None
+
+
+def reportcell(i, j, info, callback=None):
+    """ Logs the convergence of the cell (i,j) at debug level
+    and passes it to callback as a dictionary with the keys
+    cell, residual (the norm of f) and seconds. """
+    info = dict(info, cell=(i, j))
+    LOGGER.debug("LDFE cell (%i, %i): residual %.2e after %.3f s",
+                 i, j, info["residual"], info["seconds"])
+    if callback is not None:
+        callback(info)
+
+
+def ldfecell(x0, x1, z0, z1, rhos0):
+    """ Optimizes the four quadrature points of the cell
+    [x0,x1] x [z0,z1] of the front face, starting from rhos0.
+    Returns the points on the sphere, their weights (the areas
+    of the associated quadrilaterals), the optimal rhos and
+    a dictionary with the residual and the time it took. """
+    start = time()
+    a = 1 / sqrt(3)
+    omegas = computeomegas(x0, x1, z0, z1)
+    areas = computeareas(omegas, x0, x1, z0, z1)
+    moments = computemoments(a, x0, x1, z0, z1)
+
+    rhos = optimizeposition_leastsquares(areas, omegas, x0, x1, z0, z1,
+                                         rhos0, moments)
+    points = array([project(omegas[k](rhos[k])) for k in range(4)])
+    residual = norm(f(rhos, omegas, a, x0, x1, z0, z1, areas, moments))
+    return points, array(areas), rhos, {"residual": residual,
+                                        "seconds": time() - start}
+
+
+def optimizeposition_leastsquares(areas, omegas, x0, x1, z0, z1, rhos0,
+                                  moments=None):
+    """ Same as optimizeposition, but with the rhos restricted to [0,1]
+    and starting from rhos0. The four residuals f are handed to
+    least_squares as a vector together with their Jacobian df. """
+    a = 1 / sqrt(3)
+    if moments is None:
+        moments = computemoments(a, x0, x1, z0, z1)
 
-    res = least_squares(tomin, rhos0, bounds=((0, 1)))
-    print("Optimal rho:")
-    print(res.x)
-    print("areas:")
-    print(areas)
-    print("weights:")
-    print(computeweights(res.x, omegas, 1 / sqrt(3), x0, x1, z0, z1))
+    def residual(r):
+        return f(r, omegas, a, x0, x1, z0, z1, areas, moments)
 
+    def jacobian(r):
+        return df(r, omegas, a, x0, x1, z0, z1, moments)
+
+    res = least_squares(residual, rhos0, jac=jacobian, bounds=((0, 1)),
+                        xtol=1e-15, ftol=1e-15, gtol=1e-15)
     return res.x
 
 
-def optimizeposition(areas, omegas, x0, x1, z0, z1):
+def optimizeposition(areas, omegas, x0, x1, z0, z1, tolerance=1e-13,
+                     maxiterations=50):
     """ Solves for the optimal positions of the four
     quadrature points inside one cell, such that
     the associated weights equal the areas of the
@@ -97,94 +152,88 @@ def optimizeposition(areas, omegas, x0, x1, z0, z1):
     `rhos = [rho0,rho1,rho2,rho3]` and the relation
     that quadpoint_i = (1-rho_i) * midpoint + rho_i * corner_i.
     omegai are lambdas that linearly interpolate between the midpoint
-    and the corresponding corner point with omega[i](0) = corneri
-    and omega[i](1) = midpoint.
+    and the corresponding corner point with omega[i](0) = midpoint
+    and omega[i](1) = corneri.
+    The weights always sum to the area of the cell, so the Jacobian
+    is singular and every Newton step is the least norm solution.
     """
 
     # initial position of each quadpoint is at the center
     # of the edge connecting the midpoint and a corner point
     rhos = 0.5 * ones(4)
     a = 1 / sqrt(3)
-    deltarhos = 0.25 * ones(4)  # delta for finite differences
-
-    while True:  # while method has not converged
-        # print("################## new iteration #############")
-        rhs = f(rhos, omegas, a, x0, x1, z0, z1, areas)
-        print("##")
-        print(rhs)
-        print(rhos)
-        if norm(rhs) < 1e-5:
+    moments = computemoments(a, x0, x1, z0, z1)
+
+    for _ in range(maxiterations):
+        rhs = f(rhos, omegas, a, x0, x1, z0, z1, areas, moments)
+        if norm(rhs) < tolerance:
             break
-        mat = df(rhos, omegas, a, x0, x1, z0, z1, areas, deltarhos)
-        update = solve(mat, rhs)
-
-        rhos += update
-        # for i in range(4):
-        #    rhos[i] = max(0,min(1,rhos[i]))
-        """
-        print("the norm of the rhs is ")
-        print(norm(rhs))
-        print(mat)
-        print("rhs")
-        print(rhs)
-        print(update)
-        print("rhos")
-        print(rhos)
-        """
-        # print(alpha)
+        mat = df(rhos, omegas, a, x0, x1, z0, z1, moments)
+        rhos -= lstsq(mat, rhs, rcond=None)[0]
     return rhos
 
 
-def df(rhos, omegas, a, x0, x1, z0, z1, areas, deltarhos):
-    weights = f(rhos, omegas, a, x0, x1, z0, z1, areas)
-    dweights = zeros((4, 4))
-    # print("the weights are")
-    # print(computeweights(rhos, omegas, a, x0, x1, z0, z1))
+def df(rhos, omegas, a, x0, x1, z0, z1, moments=None):
+    """ The Jacobian of f with respect to the rhos.
+    With mat as in computeweights, the weights w solve
+    mat^T w = moments. Only row j of mat depends on rho_j, so
+    d w / d rho_j = - w_j mat^-T [0, d p_j / d rho_j], where
+    p_j is the projection of q_j = omegas[j](rho_j). """
+    if moments is None:
+        moments = computemoments(a, x0, x1, z0, z1)
+    mat = ones((4, 4))
+    dmat = zeros((4, 4))
     for j in range(4):
-        rhos[j] += deltarhos[j]
-        x = f(rhos, omegas, a, x0, x1, z0, z1, areas)
-        y = (x - weights) / deltarhos[j]
-        dweights[:, j] = y
-        rhos[j] -= deltarhos[j]
-    return dweights
+        q = omegas[j](rhos[j])
+        dq = omegas[j](1) - omegas[j](0)
+        p = project(q)
+        mat[j, 1:] = p
+        dmat[1:, j] = (dq - p * p.dot(dq)) / norm(q)
+    weights = solve(transpose(mat), moments)
+    # f = areas - weights, hence the sign
+    return solve(transpose(mat), dmat) * weights
 
 
 # @jit
-def f(rhos, omegas, a, x0, x1, z0, z1, areas):
-    y = areas - computeweights(rhos, omegas, a, x0, x1, z0, z1)
+def f(rhos, omegas, a, x0, x1, z0, z1, areas, moments=None):
+    y = areas - computeweights(rhos, omegas, a, x0, x1, z0, z1, moments)
     return y
 
 
-#    return 1 / 2 * sum(y ** 2)
+def computemoments(a, x0, x1, z0, z1, npoints=GAUSSPOINTS):
+    """ Integrals of 1, x/r, a/r and z/r with r = sqrt(x^2 + a^2 + z^2),
+    i.e. of 1 and the components of the projected point, over the part of
+    the sphere above the domain [x0,x1] x [z0,z1] of the cube face y = a.
+    The surface element of the sphere on the face is a/r^3 dx dz.
+    The integrals do not depend on rho, so they are computed once per cell
+    with a tensor Gauss-Legendre rule of npoints^2 points. """
+    nodes, gaussweights = leggauss(npoints)
+    x = (x1 - x0) / 2 * nodes + (x1 + x0) / 2
+    z = (z1 - z0) / 2 * nodes + (z1 + z0) / 2
+    w = outer(gaussweights, gaussweights) * (x1 - x0) * (z1 - z0) / 4
 
-# @jit
-def computeweights(rhos, omegas, a, x0, x1, z0, z1):
+    x, z = x[:, None], z[None, :]
+    r = sqrt(x ** 2 + a ** 2 + z ** 2)
+    w = w * a / r ** 3
+    return array([w.sum(), (w * x / r).sum(), (w * a / r).sum(),
+                  (w * z / r).sum()])
+
+
+def computeweights(rhos, omegas, a, x0, x1, z0, z1, moments=None):
     """ Computes the corresponding basis functions given rho.
     From that, we compute the integral of every basis function
     over the domain [x0,x1] x [z0,z1]. The weights are returned
-    as a vector. """
-    # print(rhos)
+    as a vector.
+    The basis function i is c[0,i] + c[1:,i] . p for the projected
+    point p, so its integral is c[:,i] . moments with the moments from
+    computemoments. They can be passed in if they are already known. """
+    if moments is None:
+        moments = computemoments(a, x0, x1, z0, z1)
     mat = ones((4, 4))
     for i in range(4):
         mat[i, 1:] = project(omegas[i](rhos[i]))
-    # print(mat)
-    c = solve(mat, eye(4))
-    weights = zeros(4)
-
-    # compute the weights for integrating every basis function over the domain
-    for i in range(4):
-        # define the i-th basis function
-        def bi(x, z):
-            r = sqrt(x ** 2 + a ** 2 + z ** 2)
-            return (c[0, i]
-                    + c[1, i] * x / r
-                    + c[2, i] * a / r
-                    + c[3, i] * z / r
-                    ) * abs(a ** 1 / r ** 3)
-
-        val, err = dblquad(bi, z0, z1, x0, x1)
-        weights[i] = val
-    return weights
+    # c = inv(mat), hence the weights c^T moments solve mat^T weights = moments
+    return solve(transpose(mat), moments)
 
 
 # @jit
@@ -258,5 +307,5 @@ def computeareas(omegas, x0, x1, z0, z1):
 
 if __name__ == '__main__':
     t = time()
-    ldfe()
+    ldfe(plot=True)
     print("Finished in {:2.4f} seconds.".format(time() - t))
@@ -0,0 +1,109 @@
+"""LDFE quadrature with linear discontinuous basis functions.
+The generation optimizes the points in the part of the front face of the cube
+in the first octant, which is 1/24 of the sphere, see ldfe.py. The other 23
+parts follow by symmetry. Generating a high order takes a while, so if
+generated quadratures are kept (see datastore.cachedirectory), every order is
+generated once, written to the cache directory and read from there
+afterwards."""
+import logging
+from time import time
+from numpy import inf, asarray, column_stack, floor, maximum, sqrt
+from sphericalquadpy.quadrature.quadrature import Quadrature
+from sphericalquadpy.quadrature.datastore import (
+    cachedtable,
+    loadorgenerate,
+    normalizeweights,
+)
+from sphericalquadpy.tools.symmetry import expandsymmetry
+
+LOGGER = logging.getLogger(__name__)
+
+
+def generateldfe(order, workers=1, callback=None):
+    """Generates the LDFE quadrature on the full sphere.
+
+    Args:
+        order: The number of cells per direction of the front face.
+        workers: The number of worker processes, see ldfeparallel. With one
+        worker, the cells are optimized in this process.
+        callback: Called with the convergence of every cell, see reportcell.
+    Returns:
+        xyzw: An (96 order^2,4) numpy.ndarray of the quadrature points and the
+        quadrature weights. The weights sum to 4pi.
+    """
+    # the optimization needs scipy, which reading a table does not
+    from sphericalquadpy.ldfeLinDisc.ldfe import ldfe
+    from sphericalquadpy.ldfeLinDisc.parallel import ldfeparallel
+
+    start = time()
+    if workers == 1:
+        points, weights = ldfe(order, callback=callback)
+    else:
+        points, weights = ldfeparallel(order, workers=workers, callback=callback)
+    xyz, weights, _ = expandsymmetry(points, weights, "pyritohedral")
+    LOGGER.info(
+        "Generated LDFE order %i with %i points in %.2f s",
+        order,
+        len(weights),
+        time() - start,
+    )
+    return normalizeweights(column_stack((xyz, weights)))
+
+
+class LDFELinDisc(Quadrature):
+    """LDFE Quadrature with linear discontinuous basis functions
+
+    The class attribute workers is the number of worker processes that
+    generate a table that is not in the cache directory yet, see
+    generateldfe.
+    """
+
+    cacheable = True
+    filename = "{}_ldfelindisc.npy"
+    workers = 1
+    # increase when generateldfe changes, such that kept tables are generated
+    # again
+    generatorversion = 1
+
+    def name(self):
+        return "LDFELinDisc Quadrature"
+
+    def getmaximalorder(self):
+        return inf
+
+    def checkorder(self, order):
+        """Raises a ValueError if the order is not a positive integer."""
+        if order < 1 or order != int(order):
+            raise ValueError(
+                "Order has to be a positive integer. You chose %s." % order
+            )
+
+    def computequadrature(self, order):
+        """Quadrature points and weights, generated or read from the cache
+        directory if they were kept there before."""
+        self.checkorder(order)
+        binary = cachedtable(self.filename.format(int(order)), self.generatorversion)
+        xyzw = loadorgenerate(
+            binary, lambda: generateldfe(int(order), workers=self.workers)
+        )
+        return xyzw[:, 0:3], xyzw[:, 3]
+
+    def nqbyorder(self, order):
+        """Four points per cell and 24 front faces with order^2 cells."""
+        order = max(1, order)
+        return order, 96 * order ** 2
+
+    def nqbyorders(self, orders):
+        """Batched nqbyorder."""
+        orders = maximum(1, asarray(orders))
+        return orders, 96 * orders ** 2
+
+    def getcorrespondingorders(self, nquadpoints_desired):
+        """Batched getcorrespondingorder, the largest order (at least 1) with
+        96 order^2 <= nquadpoints_desired. The floating point square root is
+        corrected by one where it is off."""
+        cells = maximum(asarray(nquadpoints_desired).astype(int), 0) // 96
+        orders = floor(sqrt(cells)).astype(int)
+        orders -= orders ** 2 > cells
+        orders += (orders + 1) ** 2 <= cells
+        return maximum(orders, 1)
@@ -0,0 +1,87 @@
+"""Parallel construction of the LDFE quadrature.
+Every cell of the front face is an independent optimization problem, the
+cells are only coupled through the starting values of the optimizer: a cell
+starts from the optimal rhos of a neighbor. ldfeparallel solves the cells
+in a pool of workers and submits a cell as soon as that neighbor is solved,
+so the cells are solved in a wavefront that starts at the corner (0, 0).
+The worker processes are started with spawn instead of fork, since forking a
+process that already runs threads (e.g. of numba or of BLAS) can deadlock.
+Before Python 3.7 the process pool has no start method and uses the default
+one of the platform."""
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import get_context
+from numpy import sqrt, linspace, ones, zeros
+from sphericalquadpy.ldfeLinDisc.ldfe import ldfecell, reportcell
+
+
+def dependentcells(i, j, n):
+    """The cells that start from the optimal rhos of cell (i,j), i.e. the
+    next cell (i,j+1) in the same row and, for the first cell of a row, the
+    first cell (i+1,0) of the next row. This inverts seedcell, so the cells
+    start from the same values as in ldfe."""
+    cells = []
+    if j + 1 < n:
+        cells.append((i, j + 1))
+    if j == 0 and i + 1 < n:
+        cells.append((i + 1, 0))
+    return cells
+
+
+def ldfeparallel(n=3, workers=None, executor=None, callback=None):
+    """ Return the quadrature points `p`
+    and the corresponding quadrature weights `w`
+    for the LDFE quadrature of order `n`, see ldfe.
+    The points and weights are in the same order as for ldfe.
+
+    Args:
+        n: The number of cells per direction of the front face.
+        workers: The number of worker processes. By default the number
+        of processors.
+        executor: An existing concurrent.futures executor to use instead
+        of a new process pool, in which case workers is ignored.
+        callback: Called with the convergence of every cell as it is
+        finished, see reportcell.
+    Returns:
+        points: An (4n^2,3) numpy.ndarray of points on the sphere.
+        weights: An (4n^2) numpy.ndarray of the weights.
+    """
+    a = 1 / sqrt(3)
+    x = linspace(0, a, n + 1)
+    z = linspace(0, a, n + 1)
+
+    points = zeros((4 * n * n, 3))
+    weights = zeros(4 * n * n)
+
+    ownexecutor = executor is None
+    if ownexecutor and sys.version_info < (3, 7):
+        executor = ProcessPoolExecutor(max_workers=workers)
+    elif ownexecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn"))
+
+    def submit(i, j, rhos0):
+        return executor.submit(ldfecell, x[i], x[i + 1], z[j], z[j + 1], rhos0)
+
+    pending = {}
+    try:
+        pending[submit(0, 0, 0.1 * ones(4))] = (0, 0)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, j = pending.pop(future)
+                cellpoints, cellweights, rhos, info = future.result()
+                counter = 4 * (i * n + j)
+                points[counter:counter + 4, :] = cellpoints
+                weights[counter:counter + 4] = cellweights
+                reportcell(i, j, info, callback)
+                for cell in dependentcells(i, j, n):
+                    pending[submit(*cell, rhos)] = cell
+    finally:
+        # the cells that were not started are cancelled if a cell failed
+        # (shutdown(cancel_futures=True) needs Python 3.9)
+        for future in pending:
+            future.cancel()
+        if ownexecutor:
+            executor.shutdown()
+    return points, weights
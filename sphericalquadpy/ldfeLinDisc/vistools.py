@@ -7,7 +7,7 @@ def scatterplot(points, weights, square=1):
     area = 1e7 * weights**2
     plt.close("all")
 
-    cm = plt.cm.get_cmap('Dark2')
+    cm = plt.get_cmap('Dark2')
     plt.subplot(1, 2, 1)
     plt.scatter(x, z, s=area, c=square, alpha=0.99, cmap=cm)
     plt.title("quadrature points for 1/3rd octant\ncircle area = weights")
@@ -1,5 +1,19 @@
 # pylint: disable=C0111
+import sys
+
 from .ldfesa import LDFESA
-from .writtendict import ldfesadictionary
 
 __all__ = ["LDFESA", "ldfesadictionary"]
+
+
+def __getattr__(name):
+    if name == "ldfesadictionary":
+        from .writtendict import ldfesadictionary
+
+        return ldfesadictionary
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # module attributes are only looked up in __getattr__ from Python 3.7 on
+    ldfesadictionary = __getattr__("ldfesadictionary")
@@ -1,34 +1,24 @@
-"""This file can be used to create a new python file that will return
-the dictionary of LDFESA quadratures."""
-import numpy as np
-import sys
+"""This file can be used to create the binary archive that holds
+the dictionary of LDFESA quadratures, see writtendict.py."""
+from sphericalquadpy.quadrature.datastore import (
+    loadtexttable,
+    resource,
+    writearchive,
+)
+from sphericalquadpy.ldfesa.ldfesa import AVAILABLEORDERS
 
 
 def createdict():
     """Create a dictionary based on the quadrature files stored in data/"""
-    orders = [1, 2, 3]
-
     D = dict()
-    for order in orders:
-        xyzw = np.loadtxt("data/" + str(order) + "_ldfesa.txt", delimiter=",")
-        xyzw[:, 3] = xyzw[:, 3] / sum(xyzw[:, 3]) * 4 * np.pi
-
-        D[order] = xyzw
+    for order in AVAILABLEORDERS:
+        table = resource(__package__, "data", str(order) + "_ldfesa.txt")
+        D[order] = loadtexttable(table, ",")
     return D
 
 
 def writedict():
-    """Dump a dictionary to a python file and add a function definition
-    first. That way, we can read the dictionary later from that file without
-    using the files in data/"""
-    d = createdict()
-    np.set_printoptions(threshold=sys.maxsize)
-    np.set_printoptions(precision=15)
-    with open("writtendict.py", "w") as f:
-        mystring = (
-            "from numpy import array\n"
-            "def ldfesadictionary():\n"
-            "\treturn (" + str(d) + ")"
-        )
-
-        print(mystring, file=f)
+    """Dump the dictionary to the binary archive writtendict.npz, with one
+    entry per order. That way, we can read the dictionary later from that
+    archive without using the files in data/ and without parsing text."""
+    return writearchive(resource(__package__, "writtendict.npz"), createdict())
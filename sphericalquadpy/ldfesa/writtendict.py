@@ -1,1344 +1,9 @@
-from numpy import array
+"""The dictionary of LDFESA quadratures. It is written to the binary
+archive writtendict.npz by createxyzwdict.writedict, and every order is only
+decoded when it is accessed."""
+from sphericalquadpy.quadrature.datastore import TableArchive, resource
+
+
 def ldfesadictionary():
-	return ({1: array([[ 0.2097691065     ,  0.2097691065     ,  0.9549836878     ,
-         0.339836909477261],
-       [ 0.9549836878     ,  0.2097691065     ,  0.2097691065     ,
-         0.339836909477261],
-       [ 0.2097691065     ,  0.9549836878     ,  0.2097691065     ,
-         0.339836909477261],
-       [ 0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.551285598363113],
-       [-0.2097691065     ,  0.2097691065     ,  0.9549836878     ,
-         0.339836909477261],
-       [-0.9549836878     ,  0.2097691065     ,  0.2097691065     ,
-         0.339836909477261],
-       [-0.2097691065     ,  0.9549836878     ,  0.2097691065     ,
-         0.339836909477261],
-       [-0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.551285598363113],
-       [-0.2097691065     , -0.2097691065     ,  0.9549836878     ,
-         0.339836909477261],
-       [-0.9549836878     , -0.2097691065     ,  0.2097691065     ,
-         0.339836909477261],
-       [-0.2097691065     , -0.9549836878     ,  0.2097691065     ,
-         0.339836909477261],
-       [-0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.551285598363113],
-       [ 0.2097691065     , -0.2097691065     ,  0.9549836878     ,
-         0.339836909477261],
-       [ 0.9549836878     , -0.2097691065     ,  0.2097691065     ,
-         0.339836909477261],
-       [ 0.2097691065     , -0.9549836878     ,  0.2097691065     ,
-         0.339836909477261],
-       [ 0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.551285598363113],
-       [ 0.2097691065     ,  0.2097691065     , -0.9549836878     ,
-         0.339836909477261],
-       [ 0.9549836878     ,  0.2097691065     , -0.2097691065     ,
-         0.339836909477261],
-       [ 0.2097691065     ,  0.9549836878     , -0.2097691065     ,
-         0.339836909477261],
-       [ 0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.551285598363113],
-       [-0.2097691065     ,  0.2097691065     , -0.9549836878     ,
-         0.339836909477261],
-       [-0.9549836878     ,  0.2097691065     , -0.2097691065     ,
-         0.339836909477261],
-       [-0.2097691065     ,  0.9549836878     , -0.2097691065     ,
-         0.339836909477261],
-       [-0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.551285598363113],
-       [-0.2097691065     , -0.2097691065     , -0.9549836878     ,
-         0.339836909477261],
-       [-0.9549836878     , -0.2097691065     , -0.2097691065     ,
-         0.339836909477261],
-       [-0.2097691065     , -0.9549836878     , -0.2097691065     ,
-         0.339836909477261],
-       [-0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.551285598363113],
-       [ 0.2097691065     , -0.2097691065     , -0.9549836878     ,
-         0.339836909477261],
-       [ 0.9549836878     , -0.2097691065     , -0.2097691065     ,
-         0.339836909477261],
-       [ 0.2097691065     , -0.9549836878     , -0.2097691065     ,
-         0.339836909477261],
-       [ 0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.551285598363113]]), 2: array([[ 0.1227852912     ,  0.1227852912     ,  0.9848083796     ,
-         0.052655908296477],
-       [ 0.531419325      ,  0.1031295016     ,  0.8408078299     ,
-         0.099572004193338],
-       [ 0.1031295016     ,  0.531419325      ,  0.8408078299     ,
-         0.099572004193338],
-       [ 0.2357022604     ,  0.2357022604     ,  0.9428090416     ,
-         0.088036992794109],
-       [ 0.8408078299     ,  0.1031295016     ,  0.531419325      ,
-         0.099572004193338],
-       [ 0.9848083796     ,  0.1227852912     ,  0.1227852912     ,
-         0.052655908296477],
-       [ 0.8408078299     ,  0.531419325      ,  0.1031295016     ,
-         0.099572004193338],
-       [ 0.9428090416     ,  0.2357022604     ,  0.2357022604     ,
-         0.088036992794109],
-       [ 0.1031295016     ,  0.8408078299     ,  0.531419325      ,
-         0.099572004193338],
-       [ 0.531419325      ,  0.8408078299     ,  0.1031295016     ,
-         0.099572004193338],
-       [ 0.1227852912     ,  0.9848083796     ,  0.1227852912     ,
-         0.052655908296477],
-       [ 0.2357022604     ,  0.9428090416     ,  0.2357022604     ,
-         0.088036992794109],
-       [ 0.686947072      ,  0.686947072      ,  0.2370810843     ,
-         0.132024927791166],
-       [ 0.2370810843     ,  0.686947072      ,  0.686947072      ,
-         0.132024927791166],
-       [ 0.686947072      ,  0.2370810843     ,  0.686947072      ,
-         0.132024927791166],
-       [ 0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.155210814989615],
-       [-0.1227852912     ,  0.1227852912     ,  0.9848083796     ,
-         0.052655908296477],
-       [-0.531419325      ,  0.1031295016     ,  0.8408078299     ,
-         0.099572004193338],
-       [-0.1031295016     ,  0.531419325      ,  0.8408078299     ,
-         0.099572004193338],
-       [-0.2357022604     ,  0.2357022604     ,  0.9428090416     ,
-         0.088036992794109],
-       [-0.8408078299     ,  0.1031295016     ,  0.531419325      ,
-         0.099572004193338],
-       [-0.9848083796     ,  0.1227852912     ,  0.1227852912     ,
-         0.052655908296477],
-       [-0.8408078299     ,  0.531419325      ,  0.1031295016     ,
-         0.099572004193338],
-       [-0.9428090416     ,  0.2357022604     ,  0.2357022604     ,
-         0.088036992794109],
-       [-0.1031295016     ,  0.8408078299     ,  0.531419325      ,
-         0.099572004193338],
-       [-0.531419325      ,  0.8408078299     ,  0.1031295016     ,
-         0.099572004193338],
-       [-0.1227852912     ,  0.9848083796     ,  0.1227852912     ,
-         0.052655908296477],
-       [-0.2357022604     ,  0.9428090416     ,  0.2357022604     ,
-         0.088036992794109],
-       [-0.686947072      ,  0.686947072      ,  0.2370810843     ,
-         0.132024927791166],
-       [-0.2370810843     ,  0.686947072      ,  0.686947072      ,
-         0.132024927791166],
-       [-0.686947072      ,  0.2370810843     ,  0.686947072      ,
-         0.132024927791166],
-       [-0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.155210814989615],
-       [-0.1227852912     , -0.1227852912     ,  0.9848083796     ,
-         0.052655908296477],
-       [-0.531419325      , -0.1031295016     ,  0.8408078299     ,
-         0.099572004193338],
-       [-0.1031295016     , -0.531419325      ,  0.8408078299     ,
-         0.099572004193338],
-       [-0.2357022604     , -0.2357022604     ,  0.9428090416     ,
-         0.088036992794109],
-       [-0.8408078299     , -0.1031295016     ,  0.531419325      ,
-         0.099572004193338],
-       [-0.9848083796     , -0.1227852912     ,  0.1227852912     ,
-         0.052655908296477],
-       [-0.8408078299     , -0.531419325      ,  0.1031295016     ,
-         0.099572004193338],
-       [-0.9428090416     , -0.2357022604     ,  0.2357022604     ,
-         0.088036992794109],
-       [-0.1031295016     , -0.8408078299     ,  0.531419325      ,
-         0.099572004193338],
-       [-0.531419325      , -0.8408078299     ,  0.1031295016     ,
-         0.099572004193338],
-       [-0.1227852912     , -0.9848083796     ,  0.1227852912     ,
-         0.052655908296477],
-       [-0.2357022604     , -0.9428090416     ,  0.2357022604     ,
-         0.088036992794109],
-       [-0.686947072      , -0.686947072      ,  0.2370810843     ,
-         0.132024927791166],
-       [-0.2370810843     , -0.686947072      ,  0.686947072      ,
-         0.132024927791166],
-       [-0.686947072      , -0.2370810843     ,  0.686947072      ,
-         0.132024927791166],
-       [-0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.155210814989615],
-       [ 0.1227852912     , -0.1227852912     ,  0.9848083796     ,
-         0.052655908296477],
-       [ 0.531419325      , -0.1031295016     ,  0.8408078299     ,
-         0.099572004193338],
-       [ 0.1031295016     , -0.531419325      ,  0.8408078299     ,
-         0.099572004193338],
-       [ 0.2357022604     , -0.2357022604     ,  0.9428090416     ,
-         0.088036992794109],
-       [ 0.8408078299     , -0.1031295016     ,  0.531419325      ,
-         0.099572004193338],
-       [ 0.9848083796     , -0.1227852912     ,  0.1227852912     ,
-         0.052655908296477],
-       [ 0.8408078299     , -0.531419325      ,  0.1031295016     ,
-         0.099572004193338],
-       [ 0.9428090416     , -0.2357022604     ,  0.2357022604     ,
-         0.088036992794109],
-       [ 0.1031295016     , -0.8408078299     ,  0.531419325      ,
-         0.099572004193338],
-       [ 0.531419325      , -0.8408078299     ,  0.1031295016     ,
-         0.099572004193338],
-       [ 0.1227852912     , -0.9848083796     ,  0.1227852912     ,
-         0.052655908296477],
-       [ 0.2357022604     , -0.9428090416     ,  0.2357022604     ,
-         0.088036992794109],
-       [ 0.686947072      , -0.686947072      ,  0.2370810843     ,
-         0.132024927791166],
-       [ 0.2370810843     , -0.686947072      ,  0.686947072      ,
-         0.132024927791166],
-       [ 0.686947072      , -0.2370810843     ,  0.686947072      ,
-         0.132024927791166],
-       [ 0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.155210814989615],
-       [ 0.1227852912     ,  0.1227852912     , -0.9848083796     ,
-         0.052655908296477],
-       [ 0.531419325      ,  0.1031295016     , -0.8408078299     ,
-         0.099572004193338],
-       [ 0.1031295016     ,  0.531419325      , -0.8408078299     ,
-         0.099572004193338],
-       [ 0.2357022604     ,  0.2357022604     , -0.9428090416     ,
-         0.088036992794109],
-       [ 0.8408078299     ,  0.1031295016     , -0.531419325      ,
-         0.099572004193338],
-       [ 0.9848083796     ,  0.1227852912     , -0.1227852912     ,
-         0.052655908296477],
-       [ 0.8408078299     ,  0.531419325      , -0.1031295016     ,
-         0.099572004193338],
-       [ 0.9428090416     ,  0.2357022604     , -0.2357022604     ,
-         0.088036992794109],
-       [ 0.1031295016     ,  0.8408078299     , -0.531419325      ,
-         0.099572004193338],
-       [ 0.531419325      ,  0.8408078299     , -0.1031295016     ,
-         0.099572004193338],
-       [ 0.1227852912     ,  0.9848083796     , -0.1227852912     ,
-         0.052655908296477],
-       [ 0.2357022604     ,  0.9428090416     , -0.2357022604     ,
-         0.088036992794109],
-       [ 0.686947072      ,  0.686947072      , -0.2370810843     ,
-         0.132024927791166],
-       [ 0.2370810843     ,  0.686947072      , -0.686947072      ,
-         0.132024927791166],
-       [ 0.686947072      ,  0.2370810843     , -0.686947072      ,
-         0.132024927791166],
-       [ 0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.155210814989615],
-       [-0.1227852912     ,  0.1227852912     , -0.9848083796     ,
-         0.052655908296477],
-       [-0.531419325      ,  0.1031295016     , -0.8408078299     ,
-         0.099572004193338],
-       [-0.1031295016     ,  0.531419325      , -0.8408078299     ,
-         0.099572004193338],
-       [-0.2357022604     ,  0.2357022604     , -0.9428090416     ,
-         0.088036992794109],
-       [-0.8408078299     ,  0.1031295016     , -0.531419325      ,
-         0.099572004193338],
-       [-0.9848083796     ,  0.1227852912     , -0.1227852912     ,
-         0.052655908296477],
-       [-0.8408078299     ,  0.531419325      , -0.1031295016     ,
-         0.099572004193338],
-       [-0.9428090416     ,  0.2357022604     , -0.2357022604     ,
-         0.088036992794109],
-       [-0.1031295016     ,  0.8408078299     , -0.531419325      ,
-         0.099572004193338],
-       [-0.531419325      ,  0.8408078299     , -0.1031295016     ,
-         0.099572004193338],
-       [-0.1227852912     ,  0.9848083796     , -0.1227852912     ,
-         0.052655908296477],
-       [-0.2357022604     ,  0.9428090416     , -0.2357022604     ,
-         0.088036992794109],
-       [-0.686947072      ,  0.686947072      , -0.2370810843     ,
-         0.132024927791166],
-       [-0.2370810843     ,  0.686947072      , -0.686947072      ,
-         0.132024927791166],
-       [-0.686947072      ,  0.2370810843     , -0.686947072      ,
-         0.132024927791166],
-       [-0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.155210814989615],
-       [-0.1227852912     , -0.1227852912     , -0.9848083796     ,
-         0.052655908296477],
-       [-0.531419325      , -0.1031295016     , -0.8408078299     ,
-         0.099572004193338],
-       [-0.1031295016     , -0.531419325      , -0.8408078299     ,
-         0.099572004193338],
-       [-0.2357022604     , -0.2357022604     , -0.9428090416     ,
-         0.088036992794109],
-       [-0.8408078299     , -0.1031295016     , -0.531419325      ,
-         0.099572004193338],
-       [-0.9848083796     , -0.1227852912     , -0.1227852912     ,
-         0.052655908296477],
-       [-0.8408078299     , -0.531419325      , -0.1031295016     ,
-         0.099572004193338],
-       [-0.9428090416     , -0.2357022604     , -0.2357022604     ,
-         0.088036992794109],
-       [-0.1031295016     , -0.8408078299     , -0.531419325      ,
-         0.099572004193338],
-       [-0.531419325      , -0.8408078299     , -0.1031295016     ,
-         0.099572004193338],
-       [-0.1227852912     , -0.9848083796     , -0.1227852912     ,
-         0.052655908296477],
-       [-0.2357022604     , -0.9428090416     , -0.2357022604     ,
-         0.088036992794109],
-       [-0.686947072      , -0.686947072      , -0.2370810843     ,
-         0.132024927791166],
-       [-0.2370810843     , -0.686947072      , -0.686947072      ,
-         0.132024927791166],
-       [-0.686947072      , -0.2370810843     , -0.686947072      ,
-         0.132024927791166],
-       [-0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.155210814989615],
-       [ 0.1227852912     , -0.1227852912     , -0.9848083796     ,
-         0.052655908296477],
-       [ 0.531419325      , -0.1031295016     , -0.8408078299     ,
-         0.099572004193338],
-       [ 0.1031295016     , -0.531419325      , -0.8408078299     ,
-         0.099572004193338],
-       [ 0.2357022604     , -0.2357022604     , -0.9428090416     ,
-         0.088036992794109],
-       [ 0.8408078299     , -0.1031295016     , -0.531419325      ,
-         0.099572004193338],
-       [ 0.9848083796     , -0.1227852912     , -0.1227852912     ,
-         0.052655908296477],
-       [ 0.8408078299     , -0.531419325      , -0.1031295016     ,
-         0.099572004193338],
-       [ 0.9428090416     , -0.2357022604     , -0.2357022604     ,
-         0.088036992794109],
-       [ 0.1031295016     , -0.8408078299     , -0.531419325      ,
-         0.099572004193338],
-       [ 0.531419325      , -0.8408078299     , -0.1031295016     ,
-         0.099572004193338],
-       [ 0.1227852912     , -0.9848083796     , -0.1227852912     ,
-         0.052655908296477],
-       [ 0.2357022604     , -0.9428090416     , -0.2357022604     ,
-         0.088036992794109],
-       [ 0.686947072      , -0.686947072      , -0.2370810843     ,
-         0.132024927791166],
-       [ 0.2370810843     , -0.686947072      , -0.686947072      ,
-         0.132024927791166],
-       [ 0.686947072      , -0.2370810843     , -0.686947072      ,
-         0.132024927791166],
-       [ 0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.155210814989615]]), 3: array([[ 0.0438752388     ,  0.0438752388     ,  0.998073107      ,
-         0.01010118190061 ],
-       [ 0.2231940545     ,  0.0434603636     ,  0.9738047088     ,
-         0.014711409100889],
-       [ 0.0434603636     ,  0.2231940545     ,  0.9738047088     ,
-         0.014711409100889],
-       [ 0.0990147543     ,  0.0990147543     ,  0.990147543      ,
-         0.013131908200793],
-       [ 0.3917547244     ,  0.0513254349     ,  0.9186369988     ,
-         0.020163559601218],
-       [ 0.6256627238     ,  0.050922383      ,  0.7784298728     ,
-         0.024290017701467],
-       [ 0.4500607531     ,  0.286782825      ,  0.8456955302     ,
-         0.030009672601813],
-       [ 0.4923659639     ,  0.123091491      ,  0.8616404369     ,
-         0.025108754201517],
-       [ 0.0513254349     ,  0.3917547244     ,  0.9186369988     ,
-         0.020163559601218],
-       [ 0.286782825      ,  0.4500607531     ,  0.8456955302     ,
-         0.030009672601813],
-       [ 0.050922383      ,  0.6256627238     ,  0.7784298728     ,
-         0.024290017701467],
-       [ 0.123091491      ,  0.4923659639     ,  0.8616404369     ,
-         0.025108754201517],
-       [ 0.3350525762     ,  0.3350525762     ,  0.8806131628     ,
-         0.027879776501684],
-       [ 0.094795808      ,  0.2862222069     ,  0.9534624288     ,
-         0.019047575201151],
-       [ 0.2862222069     ,  0.094795808      ,  0.9534624288     ,
-         0.019047575201151],
-       [ 0.2357022604     ,  0.2357022604     ,  0.9428090416     ,
-         0.022062066001333],
-       [ 0.7784298728     ,  0.050922383      ,  0.6256627238     ,
-         0.024290017701467],
-       [ 0.9186369988     ,  0.0513254349     ,  0.3917547244     ,
-         0.020163559601218],
-       [ 0.8456955302     ,  0.286782825      ,  0.4500607531     ,
-         0.030009672601813],
-       [ 0.8616404369     ,  0.123091491      ,  0.4923659639     ,
-         0.025108754201517],
-       [ 0.9738047088     ,  0.0434603636     ,  0.2231940545     ,
-         0.014711409100889],
-       [ 0.998073107      ,  0.0438752388     ,  0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.9738047088     ,  0.2231940545     ,  0.0434603636     ,
-         0.014711409100889],
-       [ 0.990147543      ,  0.0990147543     ,  0.0990147543     ,
-         0.013131908200793],
-       [ 0.8456955302     ,  0.4500607531     ,  0.286782825      ,
-         0.030009672601813],
-       [ 0.9186369988     ,  0.3917547244     ,  0.0513254349     ,
-         0.020163559601218],
-       [ 0.7784298728     ,  0.6256627238     ,  0.050922383      ,
-         0.024290017701467],
-       [ 0.8616404369     ,  0.4923659639     ,  0.123091491      ,
-         0.025108754201517],
-       [ 0.9534624288     ,  0.2862222069     ,  0.094795808      ,
-         0.019047575201151],
-       [ 0.8806131628     ,  0.3350525762     ,  0.3350525762     ,
-         0.027879776501684],
-       [ 0.9534624288     ,  0.094795808      ,  0.2862222069     ,
-         0.019047575201151],
-       [ 0.9428090416     ,  0.2357022604     ,  0.2357022604     ,
-         0.022062066001333],
-       [ 0.050922383      ,  0.7784298728     ,  0.6256627238     ,
-         0.024290017701467],
-       [ 0.286782825      ,  0.8456955302     ,  0.4500607531     ,
-         0.030009672601813],
-       [ 0.0513254349     ,  0.9186369988     ,  0.3917547244     ,
-         0.020163559601218],
-       [ 0.123091491      ,  0.8616404369     ,  0.4923659639     ,
-         0.025108754201517],
-       [ 0.4500607531     ,  0.8456955302     ,  0.286782825      ,
-         0.030009672601813],
-       [ 0.6256627238     ,  0.7784298728     ,  0.050922383      ,
-         0.024290017701467],
-       [ 0.3917547244     ,  0.9186369988     ,  0.0513254349     ,
-         0.020163559601218],
-       [ 0.4923659639     ,  0.8616404369     ,  0.123091491      ,
-         0.025108754201517],
-       [ 0.0434603636     ,  0.9738047088     ,  0.2231940545     ,
-         0.014711409100889],
-       [ 0.2231940545     ,  0.9738047088     ,  0.0434603636     ,
-         0.014711409100889],
-       [ 0.0438752388     ,  0.998073107      ,  0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.0990147543     ,  0.990147543      ,  0.0990147543     ,
-         0.013131908200793],
-       [ 0.2862222069     ,  0.9534624288     ,  0.094795808      ,
-         0.019047575201151],
-       [ 0.094795808      ,  0.9534624288     ,  0.2862222069     ,
-         0.019047575201151],
-       [ 0.3350525762     ,  0.8806131628     ,  0.3350525762     ,
-         0.027879776501684],
-       [ 0.2357022604     ,  0.9428090416     ,  0.2357022604     ,
-         0.022062066001333],
-       [ 0.7025054644     ,  0.7025054644     ,  0.1138953242     ,
-         0.027870591701684],
-       [ 0.5299153609     ,  0.7697669725     ,  0.3558771113     ,
-         0.035192803102126],
-       [ 0.7697669725     ,  0.5299153609     ,  0.3558771113     ,
-         0.035192803102126],
-       [ 0.6804138174     ,  0.6804138174     ,  0.272165527      ,
-         0.03376872990204 ],
-       [ 0.3558771113     ,  0.7697669725     ,  0.5299153609     ,
-         0.035192803102126],
-       [ 0.1138953242     ,  0.7025054644     ,  0.7025054644     ,
-         0.027870591701684],
-       [ 0.3558771113     ,  0.5299153609     ,  0.7697669725     ,
-         0.035192803102126],
-       [ 0.272165527      ,  0.6804138174     ,  0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.7697669725     ,  0.3558771113     ,  0.5299153609     ,
-         0.035192803102126],
-       [ 0.5299153609     ,  0.3558771113     ,  0.7697669725     ,
-         0.035192803102126],
-       [ 0.7025054644     ,  0.1138953242     ,  0.7025054644     ,
-         0.027870591701684],
-       [ 0.6804138174     ,  0.272165527      ,  0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.48508158       ,  0.48508158       ,  0.7275931015     ,
-         0.038361433502317],
-       [ 0.7275931015     ,  0.48508158       ,  0.48508158       ,
-         0.038361433502317],
-       [ 0.48508158       ,  0.7275931015     ,  0.48508158       ,
-         0.038361433502317],
-       [ 0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.040126514602424],
-       [-0.0438752388     ,  0.0438752388     ,  0.998073107      ,
-         0.01010118190061 ],
-       [-0.2231940545     ,  0.0434603636     ,  0.9738047088     ,
-         0.014711409100889],
-       [-0.0434603636     ,  0.2231940545     ,  0.9738047088     ,
-         0.014711409100889],
-       [-0.0990147543     ,  0.0990147543     ,  0.990147543      ,
-         0.013131908200793],
-       [-0.3917547244     ,  0.0513254349     ,  0.9186369988     ,
-         0.020163559601218],
-       [-0.6256627238     ,  0.050922383      ,  0.7784298728     ,
-         0.024290017701467],
-       [-0.4500607531     ,  0.286782825      ,  0.8456955302     ,
-         0.030009672601813],
-       [-0.4923659639     ,  0.123091491      ,  0.8616404369     ,
-         0.025108754201517],
-       [-0.0513254349     ,  0.3917547244     ,  0.9186369988     ,
-         0.020163559601218],
-       [-0.286782825      ,  0.4500607531     ,  0.8456955302     ,
-         0.030009672601813],
-       [-0.050922383      ,  0.6256627238     ,  0.7784298728     ,
-         0.024290017701467],
-       [-0.123091491      ,  0.4923659639     ,  0.8616404369     ,
-         0.025108754201517],
-       [-0.3350525762     ,  0.3350525762     ,  0.8806131628     ,
-         0.027879776501684],
-       [-0.094795808      ,  0.2862222069     ,  0.9534624288     ,
-         0.019047575201151],
-       [-0.2862222069     ,  0.094795808      ,  0.9534624288     ,
-         0.019047575201151],
-       [-0.2357022604     ,  0.2357022604     ,  0.9428090416     ,
-         0.022062066001333],
-       [-0.7784298728     ,  0.050922383      ,  0.6256627238     ,
-         0.024290017701467],
-       [-0.9186369988     ,  0.0513254349     ,  0.3917547244     ,
-         0.020163559601218],
-       [-0.8456955302     ,  0.286782825      ,  0.4500607531     ,
-         0.030009672601813],
-       [-0.8616404369     ,  0.123091491      ,  0.4923659639     ,
-         0.025108754201517],
-       [-0.9738047088     ,  0.0434603636     ,  0.2231940545     ,
-         0.014711409100889],
-       [-0.998073107      ,  0.0438752388     ,  0.0438752388     ,
-         0.01010118190061 ],
-       [-0.9738047088     ,  0.2231940545     ,  0.0434603636     ,
-         0.014711409100889],
-       [-0.990147543      ,  0.0990147543     ,  0.0990147543     ,
-         0.013131908200793],
-       [-0.8456955302     ,  0.4500607531     ,  0.286782825      ,
-         0.030009672601813],
-       [-0.9186369988     ,  0.3917547244     ,  0.0513254349     ,
-         0.020163559601218],
-       [-0.7784298728     ,  0.6256627238     ,  0.050922383      ,
-         0.024290017701467],
-       [-0.8616404369     ,  0.4923659639     ,  0.123091491      ,
-         0.025108754201517],
-       [-0.9534624288     ,  0.2862222069     ,  0.094795808      ,
-         0.019047575201151],
-       [-0.8806131628     ,  0.3350525762     ,  0.3350525762     ,
-         0.027879776501684],
-       [-0.9534624288     ,  0.094795808      ,  0.2862222069     ,
-         0.019047575201151],
-       [-0.9428090416     ,  0.2357022604     ,  0.2357022604     ,
-         0.022062066001333],
-       [-0.050922383      ,  0.7784298728     ,  0.6256627238     ,
-         0.024290017701467],
-       [-0.286782825      ,  0.8456955302     ,  0.4500607531     ,
-         0.030009672601813],
-       [-0.0513254349     ,  0.9186369988     ,  0.3917547244     ,
-         0.020163559601218],
-       [-0.123091491      ,  0.8616404369     ,  0.4923659639     ,
-         0.025108754201517],
-       [-0.4500607531     ,  0.8456955302     ,  0.286782825      ,
-         0.030009672601813],
-       [-0.6256627238     ,  0.7784298728     ,  0.050922383      ,
-         0.024290017701467],
-       [-0.3917547244     ,  0.9186369988     ,  0.0513254349     ,
-         0.020163559601218],
-       [-0.4923659639     ,  0.8616404369     ,  0.123091491      ,
-         0.025108754201517],
-       [-0.0434603636     ,  0.9738047088     ,  0.2231940545     ,
-         0.014711409100889],
-       [-0.2231940545     ,  0.9738047088     ,  0.0434603636     ,
-         0.014711409100889],
-       [-0.0438752388     ,  0.998073107      ,  0.0438752388     ,
-         0.01010118190061 ],
-       [-0.0990147543     ,  0.990147543      ,  0.0990147543     ,
-         0.013131908200793],
-       [-0.2862222069     ,  0.9534624288     ,  0.094795808      ,
-         0.019047575201151],
-       [-0.094795808      ,  0.9534624288     ,  0.2862222069     ,
-         0.019047575201151],
-       [-0.3350525762     ,  0.8806131628     ,  0.3350525762     ,
-         0.027879776501684],
-       [-0.2357022604     ,  0.9428090416     ,  0.2357022604     ,
-         0.022062066001333],
-       [-0.7025054644     ,  0.7025054644     ,  0.1138953242     ,
-         0.027870591701684],
-       [-0.5299153609     ,  0.7697669725     ,  0.3558771113     ,
-         0.035192803102126],
-       [-0.7697669725     ,  0.5299153609     ,  0.3558771113     ,
-         0.035192803102126],
-       [-0.6804138174     ,  0.6804138174     ,  0.272165527      ,
-         0.03376872990204 ],
-       [-0.3558771113     ,  0.7697669725     ,  0.5299153609     ,
-         0.035192803102126],
-       [-0.1138953242     ,  0.7025054644     ,  0.7025054644     ,
-         0.027870591701684],
-       [-0.3558771113     ,  0.5299153609     ,  0.7697669725     ,
-         0.035192803102126],
-       [-0.272165527      ,  0.6804138174     ,  0.6804138174     ,
-         0.03376872990204 ],
-       [-0.7697669725     ,  0.3558771113     ,  0.5299153609     ,
-         0.035192803102126],
-       [-0.5299153609     ,  0.3558771113     ,  0.7697669725     ,
-         0.035192803102126],
-       [-0.7025054644     ,  0.1138953242     ,  0.7025054644     ,
-         0.027870591701684],
-       [-0.6804138174     ,  0.272165527      ,  0.6804138174     ,
-         0.03376872990204 ],
-       [-0.48508158       ,  0.48508158       ,  0.7275931015     ,
-         0.038361433502317],
-       [-0.7275931015     ,  0.48508158       ,  0.48508158       ,
-         0.038361433502317],
-       [-0.48508158       ,  0.7275931015     ,  0.48508158       ,
-         0.038361433502317],
-       [-0.5773502692     ,  0.5773502692     ,  0.5773502692     ,
-         0.040126514602424],
-       [-0.0438752388     , -0.0438752388     ,  0.998073107      ,
-         0.01010118190061 ],
-       [-0.2231940545     , -0.0434603636     ,  0.9738047088     ,
-         0.014711409100889],
-       [-0.0434603636     , -0.2231940545     ,  0.9738047088     ,
-         0.014711409100889],
-       [-0.0990147543     , -0.0990147543     ,  0.990147543      ,
-         0.013131908200793],
-       [-0.3917547244     , -0.0513254349     ,  0.9186369988     ,
-         0.020163559601218],
-       [-0.6256627238     , -0.050922383      ,  0.7784298728     ,
-         0.024290017701467],
-       [-0.4500607531     , -0.286782825      ,  0.8456955302     ,
-         0.030009672601813],
-       [-0.4923659639     , -0.123091491      ,  0.8616404369     ,
-         0.025108754201517],
-       [-0.0513254349     , -0.3917547244     ,  0.9186369988     ,
-         0.020163559601218],
-       [-0.286782825      , -0.4500607531     ,  0.8456955302     ,
-         0.030009672601813],
-       [-0.050922383      , -0.6256627238     ,  0.7784298728     ,
-         0.024290017701467],
-       [-0.123091491      , -0.4923659639     ,  0.8616404369     ,
-         0.025108754201517],
-       [-0.3350525762     , -0.3350525762     ,  0.8806131628     ,
-         0.027879776501684],
-       [-0.094795808      , -0.2862222069     ,  0.9534624288     ,
-         0.019047575201151],
-       [-0.2862222069     , -0.094795808      ,  0.9534624288     ,
-         0.019047575201151],
-       [-0.2357022604     , -0.2357022604     ,  0.9428090416     ,
-         0.022062066001333],
-       [-0.7784298728     , -0.050922383      ,  0.6256627238     ,
-         0.024290017701467],
-       [-0.9186369988     , -0.0513254349     ,  0.3917547244     ,
-         0.020163559601218],
-       [-0.8456955302     , -0.286782825      ,  0.4500607531     ,
-         0.030009672601813],
-       [-0.8616404369     , -0.123091491      ,  0.4923659639     ,
-         0.025108754201517],
-       [-0.9738047088     , -0.0434603636     ,  0.2231940545     ,
-         0.014711409100889],
-       [-0.998073107      , -0.0438752388     ,  0.0438752388     ,
-         0.01010118190061 ],
-       [-0.9738047088     , -0.2231940545     ,  0.0434603636     ,
-         0.014711409100889],
-       [-0.990147543      , -0.0990147543     ,  0.0990147543     ,
-         0.013131908200793],
-       [-0.8456955302     , -0.4500607531     ,  0.286782825      ,
-         0.030009672601813],
-       [-0.9186369988     , -0.3917547244     ,  0.0513254349     ,
-         0.020163559601218],
-       [-0.7784298728     , -0.6256627238     ,  0.050922383      ,
-         0.024290017701467],
-       [-0.8616404369     , -0.4923659639     ,  0.123091491      ,
-         0.025108754201517],
-       [-0.9534624288     , -0.2862222069     ,  0.094795808      ,
-         0.019047575201151],
-       [-0.8806131628     , -0.3350525762     ,  0.3350525762     ,
-         0.027879776501684],
-       [-0.9534624288     , -0.094795808      ,  0.2862222069     ,
-         0.019047575201151],
-       [-0.9428090416     , -0.2357022604     ,  0.2357022604     ,
-         0.022062066001333],
-       [-0.050922383      , -0.7784298728     ,  0.6256627238     ,
-         0.024290017701467],
-       [-0.286782825      , -0.8456955302     ,  0.4500607531     ,
-         0.030009672601813],
-       [-0.0513254349     , -0.9186369988     ,  0.3917547244     ,
-         0.020163559601218],
-       [-0.123091491      , -0.8616404369     ,  0.4923659639     ,
-         0.025108754201517],
-       [-0.4500607531     , -0.8456955302     ,  0.286782825      ,
-         0.030009672601813],
-       [-0.6256627238     , -0.7784298728     ,  0.050922383      ,
-         0.024290017701467],
-       [-0.3917547244     , -0.9186369988     ,  0.0513254349     ,
-         0.020163559601218],
-       [-0.4923659639     , -0.8616404369     ,  0.123091491      ,
-         0.025108754201517],
-       [-0.0434603636     , -0.9738047088     ,  0.2231940545     ,
-         0.014711409100889],
-       [-0.2231940545     , -0.9738047088     ,  0.0434603636     ,
-         0.014711409100889],
-       [-0.0438752388     , -0.998073107      ,  0.0438752388     ,
-         0.01010118190061 ],
-       [-0.0990147543     , -0.990147543      ,  0.0990147543     ,
-         0.013131908200793],
-       [-0.2862222069     , -0.9534624288     ,  0.094795808      ,
-         0.019047575201151],
-       [-0.094795808      , -0.9534624288     ,  0.2862222069     ,
-         0.019047575201151],
-       [-0.3350525762     , -0.8806131628     ,  0.3350525762     ,
-         0.027879776501684],
-       [-0.2357022604     , -0.9428090416     ,  0.2357022604     ,
-         0.022062066001333],
-       [-0.7025054644     , -0.7025054644     ,  0.1138953242     ,
-         0.027870591701684],
-       [-0.5299153609     , -0.7697669725     ,  0.3558771113     ,
-         0.035192803102126],
-       [-0.7697669725     , -0.5299153609     ,  0.3558771113     ,
-         0.035192803102126],
-       [-0.6804138174     , -0.6804138174     ,  0.272165527      ,
-         0.03376872990204 ],
-       [-0.3558771113     , -0.7697669725     ,  0.5299153609     ,
-         0.035192803102126],
-       [-0.1138953242     , -0.7025054644     ,  0.7025054644     ,
-         0.027870591701684],
-       [-0.3558771113     , -0.5299153609     ,  0.7697669725     ,
-         0.035192803102126],
-       [-0.272165527      , -0.6804138174     ,  0.6804138174     ,
-         0.03376872990204 ],
-       [-0.7697669725     , -0.3558771113     ,  0.5299153609     ,
-         0.035192803102126],
-       [-0.5299153609     , -0.3558771113     ,  0.7697669725     ,
-         0.035192803102126],
-       [-0.7025054644     , -0.1138953242     ,  0.7025054644     ,
-         0.027870591701684],
-       [-0.6804138174     , -0.272165527      ,  0.6804138174     ,
-         0.03376872990204 ],
-       [-0.48508158       , -0.48508158       ,  0.7275931015     ,
-         0.038361433502317],
-       [-0.7275931015     , -0.48508158       ,  0.48508158       ,
-         0.038361433502317],
-       [-0.48508158       , -0.7275931015     ,  0.48508158       ,
-         0.038361433502317],
-       [-0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.040126514602424],
-       [ 0.0438752388     , -0.0438752388     ,  0.998073107      ,
-         0.01010118190061 ],
-       [ 0.2231940545     , -0.0434603636     ,  0.9738047088     ,
-         0.014711409100889],
-       [ 0.0434603636     , -0.2231940545     ,  0.9738047088     ,
-         0.014711409100889],
-       [ 0.0990147543     , -0.0990147543     ,  0.990147543      ,
-         0.013131908200793],
-       [ 0.3917547244     , -0.0513254349     ,  0.9186369988     ,
-         0.020163559601218],
-       [ 0.6256627238     , -0.050922383      ,  0.7784298728     ,
-         0.024290017701467],
-       [ 0.4500607531     , -0.286782825      ,  0.8456955302     ,
-         0.030009672601813],
-       [ 0.4923659639     , -0.123091491      ,  0.8616404369     ,
-         0.025108754201517],
-       [ 0.0513254349     , -0.3917547244     ,  0.9186369988     ,
-         0.020163559601218],
-       [ 0.286782825      , -0.4500607531     ,  0.8456955302     ,
-         0.030009672601813],
-       [ 0.050922383      , -0.6256627238     ,  0.7784298728     ,
-         0.024290017701467],
-       [ 0.123091491      , -0.4923659639     ,  0.8616404369     ,
-         0.025108754201517],
-       [ 0.3350525762     , -0.3350525762     ,  0.8806131628     ,
-         0.027879776501684],
-       [ 0.094795808      , -0.2862222069     ,  0.9534624288     ,
-         0.019047575201151],
-       [ 0.2862222069     , -0.094795808      ,  0.9534624288     ,
-         0.019047575201151],
-       [ 0.2357022604     , -0.2357022604     ,  0.9428090416     ,
-         0.022062066001333],
-       [ 0.7784298728     , -0.050922383      ,  0.6256627238     ,
-         0.024290017701467],
-       [ 0.9186369988     , -0.0513254349     ,  0.3917547244     ,
-         0.020163559601218],
-       [ 0.8456955302     , -0.286782825      ,  0.4500607531     ,
-         0.030009672601813],
-       [ 0.8616404369     , -0.123091491      ,  0.4923659639     ,
-         0.025108754201517],
-       [ 0.9738047088     , -0.0434603636     ,  0.2231940545     ,
-         0.014711409100889],
-       [ 0.998073107      , -0.0438752388     ,  0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.9738047088     , -0.2231940545     ,  0.0434603636     ,
-         0.014711409100889],
-       [ 0.990147543      , -0.0990147543     ,  0.0990147543     ,
-         0.013131908200793],
-       [ 0.8456955302     , -0.4500607531     ,  0.286782825      ,
-         0.030009672601813],
-       [ 0.9186369988     , -0.3917547244     ,  0.0513254349     ,
-         0.020163559601218],
-       [ 0.7784298728     , -0.6256627238     ,  0.050922383      ,
-         0.024290017701467],
-       [ 0.8616404369     , -0.4923659639     ,  0.123091491      ,
-         0.025108754201517],
-       [ 0.9534624288     , -0.2862222069     ,  0.094795808      ,
-         0.019047575201151],
-       [ 0.8806131628     , -0.3350525762     ,  0.3350525762     ,
-         0.027879776501684],
-       [ 0.9534624288     , -0.094795808      ,  0.2862222069     ,
-         0.019047575201151],
-       [ 0.9428090416     , -0.2357022604     ,  0.2357022604     ,
-         0.022062066001333],
-       [ 0.050922383      , -0.7784298728     ,  0.6256627238     ,
-         0.024290017701467],
-       [ 0.286782825      , -0.8456955302     ,  0.4500607531     ,
-         0.030009672601813],
-       [ 0.0513254349     , -0.9186369988     ,  0.3917547244     ,
-         0.020163559601218],
-       [ 0.123091491      , -0.8616404369     ,  0.4923659639     ,
-         0.025108754201517],
-       [ 0.4500607531     , -0.8456955302     ,  0.286782825      ,
-         0.030009672601813],
-       [ 0.6256627238     , -0.7784298728     ,  0.050922383      ,
-         0.024290017701467],
-       [ 0.3917547244     , -0.9186369988     ,  0.0513254349     ,
-         0.020163559601218],
-       [ 0.4923659639     , -0.8616404369     ,  0.123091491      ,
-         0.025108754201517],
-       [ 0.0434603636     , -0.9738047088     ,  0.2231940545     ,
-         0.014711409100889],
-       [ 0.2231940545     , -0.9738047088     ,  0.0434603636     ,
-         0.014711409100889],
-       [ 0.0438752388     , -0.998073107      ,  0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.0990147543     , -0.990147543      ,  0.0990147543     ,
-         0.013131908200793],
-       [ 0.2862222069     , -0.9534624288     ,  0.094795808      ,
-         0.019047575201151],
-       [ 0.094795808      , -0.9534624288     ,  0.2862222069     ,
-         0.019047575201151],
-       [ 0.3350525762     , -0.8806131628     ,  0.3350525762     ,
-         0.027879776501684],
-       [ 0.2357022604     , -0.9428090416     ,  0.2357022604     ,
-         0.022062066001333],
-       [ 0.7025054644     , -0.7025054644     ,  0.1138953242     ,
-         0.027870591701684],
-       [ 0.5299153609     , -0.7697669725     ,  0.3558771113     ,
-         0.035192803102126],
-       [ 0.7697669725     , -0.5299153609     ,  0.3558771113     ,
-         0.035192803102126],
-       [ 0.6804138174     , -0.6804138174     ,  0.272165527      ,
-         0.03376872990204 ],
-       [ 0.3558771113     , -0.7697669725     ,  0.5299153609     ,
-         0.035192803102126],
-       [ 0.1138953242     , -0.7025054644     ,  0.7025054644     ,
-         0.027870591701684],
-       [ 0.3558771113     , -0.5299153609     ,  0.7697669725     ,
-         0.035192803102126],
-       [ 0.272165527      , -0.6804138174     ,  0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.7697669725     , -0.3558771113     ,  0.5299153609     ,
-         0.035192803102126],
-       [ 0.5299153609     , -0.3558771113     ,  0.7697669725     ,
-         0.035192803102126],
-       [ 0.7025054644     , -0.1138953242     ,  0.7025054644     ,
-         0.027870591701684],
-       [ 0.6804138174     , -0.272165527      ,  0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.48508158       , -0.48508158       ,  0.7275931015     ,
-         0.038361433502317],
-       [ 0.7275931015     , -0.48508158       ,  0.48508158       ,
-         0.038361433502317],
-       [ 0.48508158       , -0.7275931015     ,  0.48508158       ,
-         0.038361433502317],
-       [ 0.5773502692     , -0.5773502692     ,  0.5773502692     ,
-         0.040126514602424],
-       [ 0.0438752388     ,  0.0438752388     , -0.998073107      ,
-         0.01010118190061 ],
-       [ 0.2231940545     ,  0.0434603636     , -0.9738047088     ,
-         0.014711409100889],
-       [ 0.0434603636     ,  0.2231940545     , -0.9738047088     ,
-         0.014711409100889],
-       [ 0.0990147543     ,  0.0990147543     , -0.990147543      ,
-         0.013131908200793],
-       [ 0.3917547244     ,  0.0513254349     , -0.9186369988     ,
-         0.020163559601218],
-       [ 0.6256627238     ,  0.050922383      , -0.7784298728     ,
-         0.024290017701467],
-       [ 0.4500607531     ,  0.286782825      , -0.8456955302     ,
-         0.030009672601813],
-       [ 0.4923659639     ,  0.123091491      , -0.8616404369     ,
-         0.025108754201517],
-       [ 0.0513254349     ,  0.3917547244     , -0.9186369988     ,
-         0.020163559601218],
-       [ 0.286782825      ,  0.4500607531     , -0.8456955302     ,
-         0.030009672601813],
-       [ 0.050922383      ,  0.6256627238     , -0.7784298728     ,
-         0.024290017701467],
-       [ 0.123091491      ,  0.4923659639     , -0.8616404369     ,
-         0.025108754201517],
-       [ 0.3350525762     ,  0.3350525762     , -0.8806131628     ,
-         0.027879776501684],
-       [ 0.094795808      ,  0.2862222069     , -0.9534624288     ,
-         0.019047575201151],
-       [ 0.2862222069     ,  0.094795808      , -0.9534624288     ,
-         0.019047575201151],
-       [ 0.2357022604     ,  0.2357022604     , -0.9428090416     ,
-         0.022062066001333],
-       [ 0.7784298728     ,  0.050922383      , -0.6256627238     ,
-         0.024290017701467],
-       [ 0.9186369988     ,  0.0513254349     , -0.3917547244     ,
-         0.020163559601218],
-       [ 0.8456955302     ,  0.286782825      , -0.4500607531     ,
-         0.030009672601813],
-       [ 0.8616404369     ,  0.123091491      , -0.4923659639     ,
-         0.025108754201517],
-       [ 0.9738047088     ,  0.0434603636     , -0.2231940545     ,
-         0.014711409100889],
-       [ 0.998073107      ,  0.0438752388     , -0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.9738047088     ,  0.2231940545     , -0.0434603636     ,
-         0.014711409100889],
-       [ 0.990147543      ,  0.0990147543     , -0.0990147543     ,
-         0.013131908200793],
-       [ 0.8456955302     ,  0.4500607531     , -0.286782825      ,
-         0.030009672601813],
-       [ 0.9186369988     ,  0.3917547244     , -0.0513254349     ,
-         0.020163559601218],
-       [ 0.7784298728     ,  0.6256627238     , -0.050922383      ,
-         0.024290017701467],
-       [ 0.8616404369     ,  0.4923659639     , -0.123091491      ,
-         0.025108754201517],
-       [ 0.9534624288     ,  0.2862222069     , -0.094795808      ,
-         0.019047575201151],
-       [ 0.8806131628     ,  0.3350525762     , -0.3350525762     ,
-         0.027879776501684],
-       [ 0.9534624288     ,  0.094795808      , -0.2862222069     ,
-         0.019047575201151],
-       [ 0.9428090416     ,  0.2357022604     , -0.2357022604     ,
-         0.022062066001333],
-       [ 0.050922383      ,  0.7784298728     , -0.6256627238     ,
-         0.024290017701467],
-       [ 0.286782825      ,  0.8456955302     , -0.4500607531     ,
-         0.030009672601813],
-       [ 0.0513254349     ,  0.9186369988     , -0.3917547244     ,
-         0.020163559601218],
-       [ 0.123091491      ,  0.8616404369     , -0.4923659639     ,
-         0.025108754201517],
-       [ 0.4500607531     ,  0.8456955302     , -0.286782825      ,
-         0.030009672601813],
-       [ 0.6256627238     ,  0.7784298728     , -0.050922383      ,
-         0.024290017701467],
-       [ 0.3917547244     ,  0.9186369988     , -0.0513254349     ,
-         0.020163559601218],
-       [ 0.4923659639     ,  0.8616404369     , -0.123091491      ,
-         0.025108754201517],
-       [ 0.0434603636     ,  0.9738047088     , -0.2231940545     ,
-         0.014711409100889],
-       [ 0.2231940545     ,  0.9738047088     , -0.0434603636     ,
-         0.014711409100889],
-       [ 0.0438752388     ,  0.998073107      , -0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.0990147543     ,  0.990147543      , -0.0990147543     ,
-         0.013131908200793],
-       [ 0.2862222069     ,  0.9534624288     , -0.094795808      ,
-         0.019047575201151],
-       [ 0.094795808      ,  0.9534624288     , -0.2862222069     ,
-         0.019047575201151],
-       [ 0.3350525762     ,  0.8806131628     , -0.3350525762     ,
-         0.027879776501684],
-       [ 0.2357022604     ,  0.9428090416     , -0.2357022604     ,
-         0.022062066001333],
-       [ 0.7025054644     ,  0.7025054644     , -0.1138953242     ,
-         0.027870591701684],
-       [ 0.5299153609     ,  0.7697669725     , -0.3558771113     ,
-         0.035192803102126],
-       [ 0.7697669725     ,  0.5299153609     , -0.3558771113     ,
-         0.035192803102126],
-       [ 0.6804138174     ,  0.6804138174     , -0.272165527      ,
-         0.03376872990204 ],
-       [ 0.3558771113     ,  0.7697669725     , -0.5299153609     ,
-         0.035192803102126],
-       [ 0.1138953242     ,  0.7025054644     , -0.7025054644     ,
-         0.027870591701684],
-       [ 0.3558771113     ,  0.5299153609     , -0.7697669725     ,
-         0.035192803102126],
-       [ 0.272165527      ,  0.6804138174     , -0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.7697669725     ,  0.3558771113     , -0.5299153609     ,
-         0.035192803102126],
-       [ 0.5299153609     ,  0.3558771113     , -0.7697669725     ,
-         0.035192803102126],
-       [ 0.7025054644     ,  0.1138953242     , -0.7025054644     ,
-         0.027870591701684],
-       [ 0.6804138174     ,  0.272165527      , -0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.48508158       ,  0.48508158       , -0.7275931015     ,
-         0.038361433502317],
-       [ 0.7275931015     ,  0.48508158       , -0.48508158       ,
-         0.038361433502317],
-       [ 0.48508158       ,  0.7275931015     , -0.48508158       ,
-         0.038361433502317],
-       [ 0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.040126514602424],
-       [-0.0438752388     ,  0.0438752388     , -0.998073107      ,
-         0.01010118190061 ],
-       [-0.2231940545     ,  0.0434603636     , -0.9738047088     ,
-         0.014711409100889],
-       [-0.0434603636     ,  0.2231940545     , -0.9738047088     ,
-         0.014711409100889],
-       [-0.0990147543     ,  0.0990147543     , -0.990147543      ,
-         0.013131908200793],
-       [-0.3917547244     ,  0.0513254349     , -0.9186369988     ,
-         0.020163559601218],
-       [-0.6256627238     ,  0.050922383      , -0.7784298728     ,
-         0.024290017701467],
-       [-0.4500607531     ,  0.286782825      , -0.8456955302     ,
-         0.030009672601813],
-       [-0.4923659639     ,  0.123091491      , -0.8616404369     ,
-         0.025108754201517],
-       [-0.0513254349     ,  0.3917547244     , -0.9186369988     ,
-         0.020163559601218],
-       [-0.286782825      ,  0.4500607531     , -0.8456955302     ,
-         0.030009672601813],
-       [-0.050922383      ,  0.6256627238     , -0.7784298728     ,
-         0.024290017701467],
-       [-0.123091491      ,  0.4923659639     , -0.8616404369     ,
-         0.025108754201517],
-       [-0.3350525762     ,  0.3350525762     , -0.8806131628     ,
-         0.027879776501684],
-       [-0.094795808      ,  0.2862222069     , -0.9534624288     ,
-         0.019047575201151],
-       [-0.2862222069     ,  0.094795808      , -0.9534624288     ,
-         0.019047575201151],
-       [-0.2357022604     ,  0.2357022604     , -0.9428090416     ,
-         0.022062066001333],
-       [-0.7784298728     ,  0.050922383      , -0.6256627238     ,
-         0.024290017701467],
-       [-0.9186369988     ,  0.0513254349     , -0.3917547244     ,
-         0.020163559601218],
-       [-0.8456955302     ,  0.286782825      , -0.4500607531     ,
-         0.030009672601813],
-       [-0.8616404369     ,  0.123091491      , -0.4923659639     ,
-         0.025108754201517],
-       [-0.9738047088     ,  0.0434603636     , -0.2231940545     ,
-         0.014711409100889],
-       [-0.998073107      ,  0.0438752388     , -0.0438752388     ,
-         0.01010118190061 ],
-       [-0.9738047088     ,  0.2231940545     , -0.0434603636     ,
-         0.014711409100889],
-       [-0.990147543      ,  0.0990147543     , -0.0990147543     ,
-         0.013131908200793],
-       [-0.8456955302     ,  0.4500607531     , -0.286782825      ,
-         0.030009672601813],
-       [-0.9186369988     ,  0.3917547244     , -0.0513254349     ,
-         0.020163559601218],
-       [-0.7784298728     ,  0.6256627238     , -0.050922383      ,
-         0.024290017701467],
-       [-0.8616404369     ,  0.4923659639     , -0.123091491      ,
-         0.025108754201517],
-       [-0.9534624288     ,  0.2862222069     , -0.094795808      ,
-         0.019047575201151],
-       [-0.8806131628     ,  0.3350525762     , -0.3350525762     ,
-         0.027879776501684],
-       [-0.9534624288     ,  0.094795808      , -0.2862222069     ,
-         0.019047575201151],
-       [-0.9428090416     ,  0.2357022604     , -0.2357022604     ,
-         0.022062066001333],
-       [-0.050922383      ,  0.7784298728     , -0.6256627238     ,
-         0.024290017701467],
-       [-0.286782825      ,  0.8456955302     , -0.4500607531     ,
-         0.030009672601813],
-       [-0.0513254349     ,  0.9186369988     , -0.3917547244     ,
-         0.020163559601218],
-       [-0.123091491      ,  0.8616404369     , -0.4923659639     ,
-         0.025108754201517],
-       [-0.4500607531     ,  0.8456955302     , -0.286782825      ,
-         0.030009672601813],
-       [-0.6256627238     ,  0.7784298728     , -0.050922383      ,
-         0.024290017701467],
-       [-0.3917547244     ,  0.9186369988     , -0.0513254349     ,
-         0.020163559601218],
-       [-0.4923659639     ,  0.8616404369     , -0.123091491      ,
-         0.025108754201517],
-       [-0.0434603636     ,  0.9738047088     , -0.2231940545     ,
-         0.014711409100889],
-       [-0.2231940545     ,  0.9738047088     , -0.0434603636     ,
-         0.014711409100889],
-       [-0.0438752388     ,  0.998073107      , -0.0438752388     ,
-         0.01010118190061 ],
-       [-0.0990147543     ,  0.990147543      , -0.0990147543     ,
-         0.013131908200793],
-       [-0.2862222069     ,  0.9534624288     , -0.094795808      ,
-         0.019047575201151],
-       [-0.094795808      ,  0.9534624288     , -0.2862222069     ,
-         0.019047575201151],
-       [-0.3350525762     ,  0.8806131628     , -0.3350525762     ,
-         0.027879776501684],
-       [-0.2357022604     ,  0.9428090416     , -0.2357022604     ,
-         0.022062066001333],
-       [-0.7025054644     ,  0.7025054644     , -0.1138953242     ,
-         0.027870591701684],
-       [-0.5299153609     ,  0.7697669725     , -0.3558771113     ,
-         0.035192803102126],
-       [-0.7697669725     ,  0.5299153609     , -0.3558771113     ,
-         0.035192803102126],
-       [-0.6804138174     ,  0.6804138174     , -0.272165527      ,
-         0.03376872990204 ],
-       [-0.3558771113     ,  0.7697669725     , -0.5299153609     ,
-         0.035192803102126],
-       [-0.1138953242     ,  0.7025054644     , -0.7025054644     ,
-         0.027870591701684],
-       [-0.3558771113     ,  0.5299153609     , -0.7697669725     ,
-         0.035192803102126],
-       [-0.272165527      ,  0.6804138174     , -0.6804138174     ,
-         0.03376872990204 ],
-       [-0.7697669725     ,  0.3558771113     , -0.5299153609     ,
-         0.035192803102126],
-       [-0.5299153609     ,  0.3558771113     , -0.7697669725     ,
-         0.035192803102126],
-       [-0.7025054644     ,  0.1138953242     , -0.7025054644     ,
-         0.027870591701684],
-       [-0.6804138174     ,  0.272165527      , -0.6804138174     ,
-         0.03376872990204 ],
-       [-0.48508158       ,  0.48508158       , -0.7275931015     ,
-         0.038361433502317],
-       [-0.7275931015     ,  0.48508158       , -0.48508158       ,
-         0.038361433502317],
-       [-0.48508158       ,  0.7275931015     , -0.48508158       ,
-         0.038361433502317],
-       [-0.5773502692     ,  0.5773502692     , -0.5773502692     ,
-         0.040126514602424],
-       [-0.0438752388     , -0.0438752388     , -0.998073107      ,
-         0.01010118190061 ],
-       [-0.2231940545     , -0.0434603636     , -0.9738047088     ,
-         0.014711409100889],
-       [-0.0434603636     , -0.2231940545     , -0.9738047088     ,
-         0.014711409100889],
-       [-0.0990147543     , -0.0990147543     , -0.990147543      ,
-         0.013131908200793],
-       [-0.3917547244     , -0.0513254349     , -0.9186369988     ,
-         0.020163559601218],
-       [-0.6256627238     , -0.050922383      , -0.7784298728     ,
-         0.024290017701467],
-       [-0.4500607531     , -0.286782825      , -0.8456955302     ,
-         0.030009672601813],
-       [-0.4923659639     , -0.123091491      , -0.8616404369     ,
-         0.025108754201517],
-       [-0.0513254349     , -0.3917547244     , -0.9186369988     ,
-         0.020163559601218],
-       [-0.286782825      , -0.4500607531     , -0.8456955302     ,
-         0.030009672601813],
-       [-0.050922383      , -0.6256627238     , -0.7784298728     ,
-         0.024290017701467],
-       [-0.123091491      , -0.4923659639     , -0.8616404369     ,
-         0.025108754201517],
-       [-0.3350525762     , -0.3350525762     , -0.8806131628     ,
-         0.027879776501684],
-       [-0.094795808      , -0.2862222069     , -0.9534624288     ,
-         0.019047575201151],
-       [-0.2862222069     , -0.094795808      , -0.9534624288     ,
-         0.019047575201151],
-       [-0.2357022604     , -0.2357022604     , -0.9428090416     ,
-         0.022062066001333],
-       [-0.7784298728     , -0.050922383      , -0.6256627238     ,
-         0.024290017701467],
-       [-0.9186369988     , -0.0513254349     , -0.3917547244     ,
-         0.020163559601218],
-       [-0.8456955302     , -0.286782825      , -0.4500607531     ,
-         0.030009672601813],
-       [-0.8616404369     , -0.123091491      , -0.4923659639     ,
-         0.025108754201517],
-       [-0.9738047088     , -0.0434603636     , -0.2231940545     ,
-         0.014711409100889],
-       [-0.998073107      , -0.0438752388     , -0.0438752388     ,
-         0.01010118190061 ],
-       [-0.9738047088     , -0.2231940545     , -0.0434603636     ,
-         0.014711409100889],
-       [-0.990147543      , -0.0990147543     , -0.0990147543     ,
-         0.013131908200793],
-       [-0.8456955302     , -0.4500607531     , -0.286782825      ,
-         0.030009672601813],
-       [-0.9186369988     , -0.3917547244     , -0.0513254349     ,
-         0.020163559601218],
-       [-0.7784298728     , -0.6256627238     , -0.050922383      ,
-         0.024290017701467],
-       [-0.8616404369     , -0.4923659639     , -0.123091491      ,
-         0.025108754201517],
-       [-0.9534624288     , -0.2862222069     , -0.094795808      ,
-         0.019047575201151],
-       [-0.8806131628     , -0.3350525762     , -0.3350525762     ,
-         0.027879776501684],
-       [-0.9534624288     , -0.094795808      , -0.2862222069     ,
-         0.019047575201151],
-       [-0.9428090416     , -0.2357022604     , -0.2357022604     ,
-         0.022062066001333],
-       [-0.050922383      , -0.7784298728     , -0.6256627238     ,
-         0.024290017701467],
-       [-0.286782825      , -0.8456955302     , -0.4500607531     ,
-         0.030009672601813],
-       [-0.0513254349     , -0.9186369988     , -0.3917547244     ,
-         0.020163559601218],
-       [-0.123091491      , -0.8616404369     , -0.4923659639     ,
-         0.025108754201517],
-       [-0.4500607531     , -0.8456955302     , -0.286782825      ,
-         0.030009672601813],
-       [-0.6256627238     , -0.7784298728     , -0.050922383      ,
-         0.024290017701467],
-       [-0.3917547244     , -0.9186369988     , -0.0513254349     ,
-         0.020163559601218],
-       [-0.4923659639     , -0.8616404369     , -0.123091491      ,
-         0.025108754201517],
-       [-0.0434603636     , -0.9738047088     , -0.2231940545     ,
-         0.014711409100889],
-       [-0.2231940545     , -0.9738047088     , -0.0434603636     ,
-         0.014711409100889],
-       [-0.0438752388     , -0.998073107      , -0.0438752388     ,
-         0.01010118190061 ],
-       [-0.0990147543     , -0.990147543      , -0.0990147543     ,
-         0.013131908200793],
-       [-0.2862222069     , -0.9534624288     , -0.094795808      ,
-         0.019047575201151],
-       [-0.094795808      , -0.9534624288     , -0.2862222069     ,
-         0.019047575201151],
-       [-0.3350525762     , -0.8806131628     , -0.3350525762     ,
-         0.027879776501684],
-       [-0.2357022604     , -0.9428090416     , -0.2357022604     ,
-         0.022062066001333],
-       [-0.7025054644     , -0.7025054644     , -0.1138953242     ,
-         0.027870591701684],
-       [-0.5299153609     , -0.7697669725     , -0.3558771113     ,
-         0.035192803102126],
-       [-0.7697669725     , -0.5299153609     , -0.3558771113     ,
-         0.035192803102126],
-       [-0.6804138174     , -0.6804138174     , -0.272165527      ,
-         0.03376872990204 ],
-       [-0.3558771113     , -0.7697669725     , -0.5299153609     ,
-         0.035192803102126],
-       [-0.1138953242     , -0.7025054644     , -0.7025054644     ,
-         0.027870591701684],
-       [-0.3558771113     , -0.5299153609     , -0.7697669725     ,
-         0.035192803102126],
-       [-0.272165527      , -0.6804138174     , -0.6804138174     ,
-         0.03376872990204 ],
-       [-0.7697669725     , -0.3558771113     , -0.5299153609     ,
-         0.035192803102126],
-       [-0.5299153609     , -0.3558771113     , -0.7697669725     ,
-         0.035192803102126],
-       [-0.7025054644     , -0.1138953242     , -0.7025054644     ,
-         0.027870591701684],
-       [-0.6804138174     , -0.272165527      , -0.6804138174     ,
-         0.03376872990204 ],
-       [-0.48508158       , -0.48508158       , -0.7275931015     ,
-         0.038361433502317],
-       [-0.7275931015     , -0.48508158       , -0.48508158       ,
-         0.038361433502317],
-       [-0.48508158       , -0.7275931015     , -0.48508158       ,
-         0.038361433502317],
-       [-0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.040126514602424],
-       [ 0.0438752388     , -0.0438752388     , -0.998073107      ,
-         0.01010118190061 ],
-       [ 0.2231940545     , -0.0434603636     , -0.9738047088     ,
-         0.014711409100889],
-       [ 0.0434603636     , -0.2231940545     , -0.9738047088     ,
-         0.014711409100889],
-       [ 0.0990147543     , -0.0990147543     , -0.990147543      ,
-         0.013131908200793],
-       [ 0.3917547244     , -0.0513254349     , -0.9186369988     ,
-         0.020163559601218],
-       [ 0.6256627238     , -0.050922383      , -0.7784298728     ,
-         0.024290017701467],
-       [ 0.4500607531     , -0.286782825      , -0.8456955302     ,
-         0.030009672601813],
-       [ 0.4923659639     , -0.123091491      , -0.8616404369     ,
-         0.025108754201517],
-       [ 0.0513254349     , -0.3917547244     , -0.9186369988     ,
-         0.020163559601218],
-       [ 0.286782825      , -0.4500607531     , -0.8456955302     ,
-         0.030009672601813],
-       [ 0.050922383      , -0.6256627238     , -0.7784298728     ,
-         0.024290017701467],
-       [ 0.123091491      , -0.4923659639     , -0.8616404369     ,
-         0.025108754201517],
-       [ 0.3350525762     , -0.3350525762     , -0.8806131628     ,
-         0.027879776501684],
-       [ 0.094795808      , -0.2862222069     , -0.9534624288     ,
-         0.019047575201151],
-       [ 0.2862222069     , -0.094795808      , -0.9534624288     ,
-         0.019047575201151],
-       [ 0.2357022604     , -0.2357022604     , -0.9428090416     ,
-         0.022062066001333],
-       [ 0.7784298728     , -0.050922383      , -0.6256627238     ,
-         0.024290017701467],
-       [ 0.9186369988     , -0.0513254349     , -0.3917547244     ,
-         0.020163559601218],
-       [ 0.8456955302     , -0.286782825      , -0.4500607531     ,
-         0.030009672601813],
-       [ 0.8616404369     , -0.123091491      , -0.4923659639     ,
-         0.025108754201517],
-       [ 0.9738047088     , -0.0434603636     , -0.2231940545     ,
-         0.014711409100889],
-       [ 0.998073107      , -0.0438752388     , -0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.9738047088     , -0.2231940545     , -0.0434603636     ,
-         0.014711409100889],
-       [ 0.990147543      , -0.0990147543     , -0.0990147543     ,
-         0.013131908200793],
-       [ 0.8456955302     , -0.4500607531     , -0.286782825      ,
-         0.030009672601813],
-       [ 0.9186369988     , -0.3917547244     , -0.0513254349     ,
-         0.020163559601218],
-       [ 0.7784298728     , -0.6256627238     , -0.050922383      ,
-         0.024290017701467],
-       [ 0.8616404369     , -0.4923659639     , -0.123091491      ,
-         0.025108754201517],
-       [ 0.9534624288     , -0.2862222069     , -0.094795808      ,
-         0.019047575201151],
-       [ 0.8806131628     , -0.3350525762     , -0.3350525762     ,
-         0.027879776501684],
-       [ 0.9534624288     , -0.094795808      , -0.2862222069     ,
-         0.019047575201151],
-       [ 0.9428090416     , -0.2357022604     , -0.2357022604     ,
-         0.022062066001333],
-       [ 0.050922383      , -0.7784298728     , -0.6256627238     ,
-         0.024290017701467],
-       [ 0.286782825      , -0.8456955302     , -0.4500607531     ,
-         0.030009672601813],
-       [ 0.0513254349     , -0.9186369988     , -0.3917547244     ,
-         0.020163559601218],
-       [ 0.123091491      , -0.8616404369     , -0.4923659639     ,
-         0.025108754201517],
-       [ 0.4500607531     , -0.8456955302     , -0.286782825      ,
-         0.030009672601813],
-       [ 0.6256627238     , -0.7784298728     , -0.050922383      ,
-         0.024290017701467],
-       [ 0.3917547244     , -0.9186369988     , -0.0513254349     ,
-         0.020163559601218],
-       [ 0.4923659639     , -0.8616404369     , -0.123091491      ,
-         0.025108754201517],
-       [ 0.0434603636     , -0.9738047088     , -0.2231940545     ,
-         0.014711409100889],
-       [ 0.2231940545     , -0.9738047088     , -0.0434603636     ,
-         0.014711409100889],
-       [ 0.0438752388     , -0.998073107      , -0.0438752388     ,
-         0.01010118190061 ],
-       [ 0.0990147543     , -0.990147543      , -0.0990147543     ,
-         0.013131908200793],
-       [ 0.2862222069     , -0.9534624288     , -0.094795808      ,
-         0.019047575201151],
-       [ 0.094795808      , -0.9534624288     , -0.2862222069     ,
-         0.019047575201151],
-       [ 0.3350525762     , -0.8806131628     , -0.3350525762     ,
-         0.027879776501684],
-       [ 0.2357022604     , -0.9428090416     , -0.2357022604     ,
-         0.022062066001333],
-       [ 0.7025054644     , -0.7025054644     , -0.1138953242     ,
-         0.027870591701684],
-       [ 0.5299153609     , -0.7697669725     , -0.3558771113     ,
-         0.035192803102126],
-       [ 0.7697669725     , -0.5299153609     , -0.3558771113     ,
-         0.035192803102126],
-       [ 0.6804138174     , -0.6804138174     , -0.272165527      ,
-         0.03376872990204 ],
-       [ 0.3558771113     , -0.7697669725     , -0.5299153609     ,
-         0.035192803102126],
-       [ 0.1138953242     , -0.7025054644     , -0.7025054644     ,
-         0.027870591701684],
-       [ 0.3558771113     , -0.5299153609     , -0.7697669725     ,
-         0.035192803102126],
-       [ 0.272165527      , -0.6804138174     , -0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.7697669725     , -0.3558771113     , -0.5299153609     ,
-         0.035192803102126],
-       [ 0.5299153609     , -0.3558771113     , -0.7697669725     ,
-         0.035192803102126],
-       [ 0.7025054644     , -0.1138953242     , -0.7025054644     ,
-         0.027870591701684],
-       [ 0.6804138174     , -0.272165527      , -0.6804138174     ,
-         0.03376872990204 ],
-       [ 0.48508158       , -0.48508158       , -0.7275931015     ,
-         0.038361433502317],
-       [ 0.7275931015     , -0.48508158       , -0.48508158       ,
-         0.038361433502317],
-       [ 0.48508158       , -0.7275931015     , -0.48508158       ,
-         0.038361433502317],
-       [ 0.5773502692     , -0.5773502692     , -0.5773502692     ,
-         0.040126514602424]])})
+    """Returns the dictionary {order: xyzw} of LDFESA quadratures."""
+    return TableArchive(resource(__package__, "writtendict.npz"))
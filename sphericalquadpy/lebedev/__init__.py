@@ -1,5 +1,21 @@
 # pylint: disable=C0111
+import sys
+
 from .lebedev import Lebedev
-from .writtendict import lebedevdictionary
 
 __all__ = ["Lebedev", "lebedevdictionary"]
+
+
+def __getattr__(name):
+    # opening the archive of the written dictionary is deferred until the
+    # dictionary is requested
+    if name == "lebedevdictionary":
+        from .writtendict import lebedevdictionary
+
+        return lebedevdictionary
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # module attributes are only looked up in __getattr__ from Python 3.7 on
+    lebedevdictionary = __getattr__("lebedevdictionary")
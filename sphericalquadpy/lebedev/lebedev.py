@@ -1,10 +1,5 @@
 """Lebedev quadrature."""
-from numpy import pi
-from sphericalquadpy.quadrature.quadrature import Quadrature
-from sphericalquadpy.tools.findnearest import find_nearest
-from sphericalquadpy.lebedev.writtendict import lebedevdictionary
-import os
-from numpy import loadtxt
+from sphericalquadpy.quadrature.tabulated import TabulatedQuadrature
 
 AVAILABLEORDERS = [
     3,
@@ -83,56 +78,17 @@ NUMBERQUADPOINTS = [
 #    NUMBERQUADPOINTS[i] = tmp.shape[0]
 
 
-class Lebedev(Quadrature):
+class Lebedev(TabulatedQuadrature):
     """Lebedev Quadrature"""
 
+    availableorders = AVAILABLEORDERS
+    numberquadpoints = NUMBERQUADPOINTS
+    filename = "{}_lebedev.txt"
+    delimiter = ","
+    archive = "writtendict.npz"
+
     def name(self):
         return "Lebedev Quadrature"
 
     def getmaximalorder(self):
         return 131
-
-    def computequadpoints(self, order):
-        """Quadrature points for Lebedev quadrature. Read from file."""
-        if order not in AVAILABLEORDERS:
-            neighbor = find_nearest(AVAILABLEORDERS, order)
-            raise ValueError(
-                "Order not available. Next closest would be" "%i.",
-                AVAILABLEORDERS[neighbor],
-            )
-        filename = "data/" + str(order) + "_lebedev.txt"
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__))
-        )
-        path = os.path.join(__location__, filename)
-        xyzw = loadtxt(path, delimiter=",")
-        # d = lebedevdictionary()
-        # xyzw = d[order]
-        return xyzw[:, 0:3]
-
-    def computequadweights(self, order):
-        """Quadrature weights for Lebedev quadrature. Read from file."""
-        if order not in AVAILABLEORDERS:
-            neighbor = find_nearest(AVAILABLEORDERS, order)
-            raise ValueError(
-                "Order not available. Next closest would be %i. You chose %i",
-                AVAILABLEORDERS[neighbor],
-                order,
-            )
-        filename = "data/" + str(order) + "_lebedev.txt"
-        __location__ = os.path.realpath(
-            os.path.join(os.getcwd(), os.path.dirname(__file__))
-        )
-        path = os.path.join(__location__, filename)
-        xyzw = loadtxt(path, delimiter=",")
-        # d = lebedevdictionary()
-        # xyzw = d[order]
-        w = xyzw[:, 3]
-        w /= sum(w)
-        w *= 4 * pi
-        return w
-
-    def nqbyorder(self, order):
-        """Scaling was derived from files in data/"""
-        idx = find_nearest(AVAILABLEORDERS, order)
-        return AVAILABLEORDERS[idx], NUMBERQUADPOINTS[idx]
@@ -0,0 +1,9 @@
+"""The dictionary of Lebedev quadratures. It is written to the binary
+archive writtendict.npz by createxyzwdict.writedict, and every order is only
+decoded when it is accessed."""
+from sphericalquadpy.quadrature.datastore import TableArchive, resource
+
+
+def lebedevdictionary():
+    """Returns the dictionary {order: xyzw} of Lebedev quadratures."""
+    return TableArchive(resource(__package__, "writtendict.npz"))
@@ -1,5 +1,19 @@
 # pylint: disable=C0111
+import sys
+
 from .levelsymmetric import Levelsymmetric
-from .writtendict import levelsymmetricdictionary
 
 __all__ = ["Levelsymmetric", "levelsymmetricdictionary"]
+
+
+def __getattr__(name):
+    if name == "levelsymmetricdictionary":
+        from .writtendict import levelsymmetricdictionary
+
+        return levelsymmetricdictionary
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # module attributes are only looked up in __getattr__ from Python 3.7 on
+    levelsymmetricdictionary = __getattr__("levelsymmetricdictionary")
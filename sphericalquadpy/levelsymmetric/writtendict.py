@@ -1,3497 +1,9 @@
-from numpy import array
+"""The dictionary of Levelsymmetric quadratures. It is written to the binary
+archive writtendict.npz by createxyzwdict.writedict, and every order is only
+decoded when it is accessed."""
+from sphericalquadpy.quadrature.datastore import TableArchive, resource
+
+
 def levelsymmetricdictionary():
-	return ({2: array([[ 0.5773503        ,  0.5773503        ,  0.5773503        ,
-         1.570796326794897],
-       [-0.5773503        ,  0.5773503        ,  0.5773503        ,
-         1.570796326794897],
-       [-0.5773503        , -0.5773503        ,  0.5773503        ,
-         1.570796326794897],
-       [ 0.5773503        , -0.5773503        ,  0.5773503        ,
-         1.570796326794897],
-       [ 0.5773503        ,  0.5773503        , -0.5773503        ,
-         1.570796326794897],
-       [-0.5773503        ,  0.5773503        , -0.5773503        ,
-         1.570796326794897],
-       [-0.5773503        , -0.5773503        , -0.5773503        ,
-         1.570796326794897],
-       [ 0.5773503        , -0.5773503        , -0.5773503        ,
-         1.570796326794897]]), 4: array([[ 0.8688903        ,  0.3500212        ,  0.3500212        ,
-         0.523598775598299],
-       [ 0.3500212        ,  0.3500212        ,  0.8688903        ,
-         0.523598775598299],
-       [ 0.3500212        ,  0.8688903        ,  0.3500212        ,
-         0.523598775598299],
-       [-0.8688903        ,  0.3500212        ,  0.3500212        ,
-         0.523598775598299],
-       [-0.3500212        ,  0.3500212        ,  0.8688903        ,
-         0.523598775598299],
-       [-0.3500212        ,  0.8688903        ,  0.3500212        ,
-         0.523598775598299],
-       [-0.8688903        , -0.3500212        ,  0.3500212        ,
-         0.523598775598299],
-       [-0.3500212        , -0.3500212        ,  0.8688903        ,
-         0.523598775598299],
-       [-0.3500212        , -0.8688903        ,  0.3500212        ,
-         0.523598775598299],
-       [ 0.8688903        , -0.3500212        ,  0.3500212        ,
-         0.523598775598299],
-       [ 0.3500212        , -0.3500212        ,  0.8688903        ,
-         0.523598775598299],
-       [ 0.3500212        , -0.8688903        ,  0.3500212        ,
-         0.523598775598299],
-       [ 0.8688903        ,  0.3500212        , -0.3500212        ,
-         0.523598775598299],
-       [ 0.3500212        ,  0.3500212        , -0.8688903        ,
-         0.523598775598299],
-       [ 0.3500212        ,  0.8688903        , -0.3500212        ,
-         0.523598775598299],
-       [-0.8688903        ,  0.3500212        , -0.3500212        ,
-         0.523598775598299],
-       [-0.3500212        ,  0.3500212        , -0.8688903        ,
-         0.523598775598299],
-       [-0.3500212        ,  0.8688903        , -0.3500212        ,
-         0.523598775598299],
-       [-0.8688903        , -0.3500212        , -0.3500212        ,
-         0.523598775598299],
-       [-0.3500212        , -0.3500212        , -0.8688903        ,
-         0.523598775598299],
-       [-0.3500212        , -0.8688903        , -0.3500212        ,
-         0.523598775598299],
-       [ 0.8688903        , -0.3500212        , -0.3500212        ,
-         0.523598775598299],
-       [ 0.3500212        , -0.3500212        , -0.8688903        ,
-         0.523598775598299],
-       [ 0.3500212        , -0.8688903        , -0.3500212        ,
-         0.523598775598299]]), 6: array([[ 0.926181         ,  0.2666354        ,  0.2666354        ,
-         0.276658258598536],
-       [ 0.6815077        ,  0.2666354        ,  0.6815078        ,
-         0.246940516999762],
-       [ 0.6815077        ,  0.6815077        ,  0.2666355        ,
-         0.246940516999762],
-       [ 0.2666354        ,  0.2666354        ,  0.9261809        ,
-         0.276658258598536],
-       [ 0.2666354        ,  0.6815077        ,  0.6815078        ,
-         0.246940516999762],
-       [ 0.2666354        ,  0.926181         ,  0.2666353        ,
-         0.276658258598536],
-       [-0.926181         ,  0.2666354        ,  0.2666354        ,
-         0.276658258598536],
-       [-0.6815077        ,  0.2666354        ,  0.6815078        ,
-         0.246940516999762],
-       [-0.6815077        ,  0.6815077        ,  0.2666355        ,
-         0.246940516999762],
-       [-0.2666354        ,  0.2666354        ,  0.9261809        ,
-         0.276658258598536],
-       [-0.2666354        ,  0.6815077        ,  0.6815078        ,
-         0.246940516999762],
-       [-0.2666354        ,  0.926181         ,  0.2666353        ,
-         0.276658258598536],
-       [-0.926181         , -0.2666354        ,  0.2666354        ,
-         0.276658258598536],
-       [-0.6815077        , -0.2666354        ,  0.6815078        ,
-         0.246940516999762],
-       [-0.6815077        , -0.6815077        ,  0.2666355        ,
-         0.246940516999762],
-       [-0.2666354        , -0.2666354        ,  0.9261809        ,
-         0.276658258598536],
-       [-0.2666354        , -0.6815077        ,  0.6815078        ,
-         0.246940516999762],
-       [-0.2666354        , -0.926181         ,  0.2666353        ,
-         0.276658258598536],
-       [ 0.926181         , -0.2666354        ,  0.2666354        ,
-         0.276658258598536],
-       [ 0.6815077        , -0.2666354        ,  0.6815078        ,
-         0.246940516999762],
-       [ 0.6815077        , -0.6815077        ,  0.2666355        ,
-         0.246940516999762],
-       [ 0.2666354        , -0.2666354        ,  0.9261809        ,
-         0.276658258598536],
-       [ 0.2666354        , -0.6815077        ,  0.6815078        ,
-         0.246940516999762],
-       [ 0.2666354        , -0.926181         ,  0.2666353        ,
-         0.276658258598536],
-       [ 0.926181         ,  0.2666354        , -0.2666354        ,
-         0.276658258598536],
-       [ 0.6815077        ,  0.2666354        , -0.6815078        ,
-         0.246940516999762],
-       [ 0.6815077        ,  0.6815077        , -0.2666355        ,
-         0.246940516999762],
-       [ 0.2666354        ,  0.2666354        , -0.9261809        ,
-         0.276658258598536],
-       [ 0.2666354        ,  0.6815077        , -0.6815078        ,
-         0.246940516999762],
-       [ 0.2666354        ,  0.926181         , -0.2666353        ,
-         0.276658258598536],
-       [-0.926181         ,  0.2666354        , -0.2666354        ,
-         0.276658258598536],
-       [-0.6815077        ,  0.2666354        , -0.6815078        ,
-         0.246940516999762],
-       [-0.6815077        ,  0.6815077        , -0.2666355        ,
-         0.246940516999762],
-       [-0.2666354        ,  0.2666354        , -0.9261809        ,
-         0.276658258598536],
-       [-0.2666354        ,  0.6815077        , -0.6815078        ,
-         0.246940516999762],
-       [-0.2666354        ,  0.926181         , -0.2666353        ,
-         0.276658258598536],
-       [-0.926181         , -0.2666354        , -0.2666354        ,
-         0.276658258598536],
-       [-0.6815077        , -0.2666354        , -0.6815078        ,
-         0.246940516999762],
-       [-0.6815077        , -0.6815077        , -0.2666355        ,
-         0.246940516999762],
-       [-0.2666354        , -0.2666354        , -0.9261809        ,
-         0.276658258598536],
-       [-0.2666354        , -0.6815077        , -0.6815078        ,
-         0.246940516999762],
-       [-0.2666354        , -0.926181         , -0.2666353        ,
-         0.276658258598536],
-       [ 0.926181         , -0.2666354        , -0.2666354        ,
-         0.276658258598536],
-       [ 0.6815077        , -0.2666354        , -0.6815078        ,
-         0.246940516999762],
-       [ 0.6815077        , -0.6815077        , -0.2666355        ,
-         0.246940516999762],
-       [ 0.2666354        , -0.2666354        , -0.9261809        ,
-         0.276658258598536],
-       [ 0.2666354        , -0.6815077        , -0.6815078        ,
-         0.246940516999762],
-       [ 0.2666354        , -0.926181         , -0.2666353        ,
-         0.276658258598536]]), 8: array([[ 0.9511898        ,  0.2182179        ,  0.2182177        ,
-         0.190047010041251],
-       [ 0.7867958        ,  0.2182179        ,  0.5773503        ,
-         0.142535202553074],
-       [ 0.7867958        ,  0.5773503        ,  0.2182179        ,
-         0.142535202553074],
-       [ 0.5773503        ,  0.2182179        ,  0.7867958        ,
-         0.142535202553074],
-       [ 0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.145444081352695],
-       [ 0.5773503        ,  0.7867958        ,  0.2182179        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.2182179        ,  0.9511898        ,
-         0.190047010041251],
-       [ 0.2182179        ,  0.5773503        ,  0.7867958        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.7867958        ,  0.5773503        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.9511898        ,  0.2182177        ,
-         0.190047010041251],
-       [-0.9511898        ,  0.2182179        ,  0.2182177        ,
-         0.190047010041251],
-       [-0.7867958        ,  0.2182179        ,  0.5773503        ,
-         0.142535202553074],
-       [-0.7867958        ,  0.5773503        ,  0.2182179        ,
-         0.142535202553074],
-       [-0.5773503        ,  0.2182179        ,  0.7867958        ,
-         0.142535202553074],
-       [-0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.145444081352695],
-       [-0.5773503        ,  0.7867958        ,  0.2182179        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.2182179        ,  0.9511898        ,
-         0.190047010041251],
-       [-0.2182179        ,  0.5773503        ,  0.7867958        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.7867958        ,  0.5773503        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.9511898        ,  0.2182177        ,
-         0.190047010041251],
-       [-0.9511898        , -0.2182179        ,  0.2182177        ,
-         0.190047010041251],
-       [-0.7867958        , -0.2182179        ,  0.5773503        ,
-         0.142535202553074],
-       [-0.7867958        , -0.5773503        ,  0.2182179        ,
-         0.142535202553074],
-       [-0.5773503        , -0.2182179        ,  0.7867958        ,
-         0.142535202553074],
-       [-0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.145444081352695],
-       [-0.5773503        , -0.7867958        ,  0.2182179        ,
-         0.142535202553074],
-       [-0.2182179        , -0.2182179        ,  0.9511898        ,
-         0.190047010041251],
-       [-0.2182179        , -0.5773503        ,  0.7867958        ,
-         0.142535202553074],
-       [-0.2182179        , -0.7867958        ,  0.5773503        ,
-         0.142535202553074],
-       [-0.2182179        , -0.9511898        ,  0.2182177        ,
-         0.190047010041251],
-       [ 0.9511898        , -0.2182179        ,  0.2182177        ,
-         0.190047010041251],
-       [ 0.7867958        , -0.2182179        ,  0.5773503        ,
-         0.142535202553074],
-       [ 0.7867958        , -0.5773503        ,  0.2182179        ,
-         0.142535202553074],
-       [ 0.5773503        , -0.2182179        ,  0.7867958        ,
-         0.142535202553074],
-       [ 0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.145444081352695],
-       [ 0.5773503        , -0.7867958        ,  0.2182179        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.2182179        ,  0.9511898        ,
-         0.190047010041251],
-       [ 0.2182179        , -0.5773503        ,  0.7867958        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.7867958        ,  0.5773503        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.9511898        ,  0.2182177        ,
-         0.190047010041251],
-       [ 0.9511898        ,  0.2182179        , -0.2182177        ,
-         0.190047010041251],
-       [ 0.7867958        ,  0.2182179        , -0.5773503        ,
-         0.142535202553074],
-       [ 0.7867958        ,  0.5773503        , -0.2182179        ,
-         0.142535202553074],
-       [ 0.5773503        ,  0.2182179        , -0.7867958        ,
-         0.142535202553074],
-       [ 0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.145444081352695],
-       [ 0.5773503        ,  0.7867958        , -0.2182179        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.2182179        , -0.9511898        ,
-         0.190047010041251],
-       [ 0.2182179        ,  0.5773503        , -0.7867958        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.7867958        , -0.5773503        ,
-         0.142535202553074],
-       [ 0.2182179        ,  0.9511898        , -0.2182177        ,
-         0.190047010041251],
-       [-0.9511898        ,  0.2182179        , -0.2182177        ,
-         0.190047010041251],
-       [-0.7867958        ,  0.2182179        , -0.5773503        ,
-         0.142535202553074],
-       [-0.7867958        ,  0.5773503        , -0.2182179        ,
-         0.142535202553074],
-       [-0.5773503        ,  0.2182179        , -0.7867958        ,
-         0.142535202553074],
-       [-0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.145444081352695],
-       [-0.5773503        ,  0.7867958        , -0.2182179        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.2182179        , -0.9511898        ,
-         0.190047010041251],
-       [-0.2182179        ,  0.5773503        , -0.7867958        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.7867958        , -0.5773503        ,
-         0.142535202553074],
-       [-0.2182179        ,  0.9511898        , -0.2182177        ,
-         0.190047010041251],
-       [-0.9511898        , -0.2182179        , -0.2182177        ,
-         0.190047010041251],
-       [-0.7867958        , -0.2182179        , -0.5773503        ,
-         0.142535202553074],
-       [-0.7867958        , -0.5773503        , -0.2182179        ,
-         0.142535202553074],
-       [-0.5773503        , -0.2182179        , -0.7867958        ,
-         0.142535202553074],
-       [-0.5773503        , -0.5773503        , -0.5773503        ,
-         0.145444081352695],
-       [-0.5773503        , -0.7867958        , -0.2182179        ,
-         0.142535202553074],
-       [-0.2182179        , -0.2182179        , -0.9511898        ,
-         0.190047010041251],
-       [-0.2182179        , -0.5773503        , -0.7867958        ,
-         0.142535202553074],
-       [-0.2182179        , -0.7867958        , -0.5773503        ,
-         0.142535202553074],
-       [-0.2182179        , -0.9511898        , -0.2182177        ,
-         0.190047010041251],
-       [ 0.9511898        , -0.2182179        , -0.2182177        ,
-         0.190047010041251],
-       [ 0.7867958        , -0.2182179        , -0.5773503        ,
-         0.142535202553074],
-       [ 0.7867958        , -0.5773503        , -0.2182179        ,
-         0.142535202553074],
-       [ 0.5773503        , -0.2182179        , -0.7867958        ,
-         0.142535202553074],
-       [ 0.5773503        , -0.5773503        , -0.5773503        ,
-         0.145444081352695],
-       [ 0.5773503        , -0.7867958        , -0.2182179        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.2182179        , -0.9511898        ,
-         0.190047010041251],
-       [ 0.2182179        , -0.5773503        , -0.7867958        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.7867958        , -0.5773503        ,
-         0.142535202553074],
-       [ 0.2182179        , -0.9511898        , -0.2182177        ,
-         0.190047010041251]]), 10: array([[ 0.963491         ,  0.1893213        ,  0.1893213        ,
-         0.140277060860624],
-       [ 0.8397599        ,  0.1893213        ,  0.5088818        ,
-         0.113928524977506],
-       [ 0.8397599        ,  0.5088817        ,  0.1893215        ,
-         0.113928524977506],
-       [ 0.6943189        ,  0.1893213        ,  0.6943189        ,
-         0.070754581824036],
-       [ 0.6943189        ,  0.5088817        ,  0.5088817        ,
-         0.084710082958626],
-       [ 0.6943189        ,  0.6943189        ,  0.1893212        ,
-         0.070754581824036],
-       [ 0.5088817        ,  0.1893213        ,  0.83976          ,
-         0.113928524977506],
-       [ 0.5088817        ,  0.5088817        ,  0.6943189        ,
-         0.084710082958626],
-       [ 0.5088817        ,  0.6943189        ,  0.5088818        ,
-         0.084710082958626],
-       [ 0.5088817        ,  0.8397599        ,  0.1893216        ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.1893213        ,  0.963491         ,
-         0.140277060860624],
-       [ 0.1893213        ,  0.5088817        ,  0.83976          ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.6943189        ,  0.6943189        ,
-         0.070754581824036],
-       [ 0.1893213        ,  0.8397599        ,  0.5088818        ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.963491         ,  0.1893214        ,
-         0.140277060860624],
-       [-0.963491         ,  0.1893213        ,  0.1893213        ,
-         0.140277060860624],
-       [-0.8397599        ,  0.1893213        ,  0.5088818        ,
-         0.113928524977506],
-       [-0.8397599        ,  0.5088817        ,  0.1893215        ,
-         0.113928524977506],
-       [-0.6943189        ,  0.1893213        ,  0.6943189        ,
-         0.070754581824036],
-       [-0.6943189        ,  0.5088817        ,  0.5088817        ,
-         0.084710082958626],
-       [-0.6943189        ,  0.6943189        ,  0.1893212        ,
-         0.070754581824036],
-       [-0.5088817        ,  0.1893213        ,  0.83976          ,
-         0.113928524977506],
-       [-0.5088817        ,  0.5088817        ,  0.6943189        ,
-         0.084710082958626],
-       [-0.5088817        ,  0.6943189        ,  0.5088818        ,
-         0.084710082958626],
-       [-0.5088817        ,  0.8397599        ,  0.1893216        ,
-         0.113928524977506],
-       [-0.1893213        ,  0.1893213        ,  0.963491         ,
-         0.140277060860624],
-       [-0.1893213        ,  0.5088817        ,  0.83976          ,
-         0.113928524977506],
-       [-0.1893213        ,  0.6943189        ,  0.6943189        ,
-         0.070754581824036],
-       [-0.1893213        ,  0.8397599        ,  0.5088818        ,
-         0.113928524977506],
-       [-0.1893213        ,  0.963491         ,  0.1893214        ,
-         0.140277060860624],
-       [-0.963491         , -0.1893213        ,  0.1893213        ,
-         0.140277060860624],
-       [-0.8397599        , -0.1893213        ,  0.5088818        ,
-         0.113928524977506],
-       [-0.8397599        , -0.5088817        ,  0.1893215        ,
-         0.113928524977506],
-       [-0.6943189        , -0.1893213        ,  0.6943189        ,
-         0.070754581824036],
-       [-0.6943189        , -0.5088817        ,  0.5088817        ,
-         0.084710082958626],
-       [-0.6943189        , -0.6943189        ,  0.1893212        ,
-         0.070754581824036],
-       [-0.5088817        , -0.1893213        ,  0.83976          ,
-         0.113928524977506],
-       [-0.5088817        , -0.5088817        ,  0.6943189        ,
-         0.084710082958626],
-       [-0.5088817        , -0.6943189        ,  0.5088818        ,
-         0.084710082958626],
-       [-0.5088817        , -0.8397599        ,  0.1893216        ,
-         0.113928524977506],
-       [-0.1893213        , -0.1893213        ,  0.963491         ,
-         0.140277060860624],
-       [-0.1893213        , -0.5088817        ,  0.83976          ,
-         0.113928524977506],
-       [-0.1893213        , -0.6943189        ,  0.6943189        ,
-         0.070754581824036],
-       [-0.1893213        , -0.8397599        ,  0.5088818        ,
-         0.113928524977506],
-       [-0.1893213        , -0.963491         ,  0.1893214        ,
-         0.140277060860624],
-       [ 0.963491         , -0.1893213        ,  0.1893213        ,
-         0.140277060860624],
-       [ 0.8397599        , -0.1893213        ,  0.5088818        ,
-         0.113928524977506],
-       [ 0.8397599        , -0.5088817        ,  0.1893215        ,
-         0.113928524977506],
-       [ 0.6943189        , -0.1893213        ,  0.6943189        ,
-         0.070754581824036],
-       [ 0.6943189        , -0.5088817        ,  0.5088817        ,
-         0.084710082958626],
-       [ 0.6943189        , -0.6943189        ,  0.1893212        ,
-         0.070754581824036],
-       [ 0.5088817        , -0.1893213        ,  0.83976          ,
-         0.113928524977506],
-       [ 0.5088817        , -0.5088817        ,  0.6943189        ,
-         0.084710082958626],
-       [ 0.5088817        , -0.6943189        ,  0.5088818        ,
-         0.084710082958626],
-       [ 0.5088817        , -0.8397599        ,  0.1893216        ,
-         0.113928524977506],
-       [ 0.1893213        , -0.1893213        ,  0.963491         ,
-         0.140277060860624],
-       [ 0.1893213        , -0.5088817        ,  0.83976          ,
-         0.113928524977506],
-       [ 0.1893213        , -0.6943189        ,  0.6943189        ,
-         0.070754581824036],
-       [ 0.1893213        , -0.8397599        ,  0.5088818        ,
-         0.113928524977506],
-       [ 0.1893213        , -0.963491         ,  0.1893214        ,
-         0.140277060860624],
-       [ 0.963491         ,  0.1893213        , -0.1893213        ,
-         0.140277060860624],
-       [ 0.8397599        ,  0.1893213        , -0.5088818        ,
-         0.113928524977506],
-       [ 0.8397599        ,  0.5088817        , -0.1893215        ,
-         0.113928524977506],
-       [ 0.6943189        ,  0.1893213        , -0.6943189        ,
-         0.070754581824036],
-       [ 0.6943189        ,  0.5088817        , -0.5088817        ,
-         0.084710082958626],
-       [ 0.6943189        ,  0.6943189        , -0.1893212        ,
-         0.070754581824036],
-       [ 0.5088817        ,  0.1893213        , -0.83976          ,
-         0.113928524977506],
-       [ 0.5088817        ,  0.5088817        , -0.6943189        ,
-         0.084710082958626],
-       [ 0.5088817        ,  0.6943189        , -0.5088818        ,
-         0.084710082958626],
-       [ 0.5088817        ,  0.8397599        , -0.1893216        ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.1893213        , -0.963491         ,
-         0.140277060860624],
-       [ 0.1893213        ,  0.5088817        , -0.83976          ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.6943189        , -0.6943189        ,
-         0.070754581824036],
-       [ 0.1893213        ,  0.8397599        , -0.5088818        ,
-         0.113928524977506],
-       [ 0.1893213        ,  0.963491         , -0.1893214        ,
-         0.140277060860624],
-       [-0.963491         ,  0.1893213        , -0.1893213        ,
-         0.140277060860624],
-       [-0.8397599        ,  0.1893213        , -0.5088818        ,
-         0.113928524977506],
-       [-0.8397599        ,  0.5088817        , -0.1893215        ,
-         0.113928524977506],
-       [-0.6943189        ,  0.1893213        , -0.6943189        ,
-         0.070754581824036],
-       [-0.6943189        ,  0.5088817        , -0.5088817        ,
-         0.084710082958626],
-       [-0.6943189        ,  0.6943189        , -0.1893212        ,
-         0.070754581824036],
-       [-0.5088817        ,  0.1893213        , -0.83976          ,
-         0.113928524977506],
-       [-0.5088817        ,  0.5088817        , -0.6943189        ,
-         0.084710082958626],
-       [-0.5088817        ,  0.6943189        , -0.5088818        ,
-         0.084710082958626],
-       [-0.5088817        ,  0.8397599        , -0.1893216        ,
-         0.113928524977506],
-       [-0.1893213        ,  0.1893213        , -0.963491         ,
-         0.140277060860624],
-       [-0.1893213        ,  0.5088817        , -0.83976          ,
-         0.113928524977506],
-       [-0.1893213        ,  0.6943189        , -0.6943189        ,
-         0.070754581824036],
-       [-0.1893213        ,  0.8397599        , -0.5088818        ,
-         0.113928524977506],
-       [-0.1893213        ,  0.963491         , -0.1893214        ,
-         0.140277060860624],
-       [-0.963491         , -0.1893213        , -0.1893213        ,
-         0.140277060860624],
-       [-0.8397599        , -0.1893213        , -0.5088818        ,
-         0.113928524977506],
-       [-0.8397599        , -0.5088817        , -0.1893215        ,
-         0.113928524977506],
-       [-0.6943189        , -0.1893213        , -0.6943189        ,
-         0.070754581824036],
-       [-0.6943189        , -0.5088817        , -0.5088817        ,
-         0.084710082958626],
-       [-0.6943189        , -0.6943189        , -0.1893212        ,
-         0.070754581824036],
-       [-0.5088817        , -0.1893213        , -0.83976          ,
-         0.113928524977506],
-       [-0.5088817        , -0.5088817        , -0.6943189        ,
-         0.084710082958626],
-       [-0.5088817        , -0.6943189        , -0.5088818        ,
-         0.084710082958626],
-       [-0.5088817        , -0.8397599        , -0.1893216        ,
-         0.113928524977506],
-       [-0.1893213        , -0.1893213        , -0.963491         ,
-         0.140277060860624],
-       [-0.1893213        , -0.5088817        , -0.83976          ,
-         0.113928524977506],
-       [-0.1893213        , -0.6943189        , -0.6943189        ,
-         0.070754581824036],
-       [-0.1893213        , -0.8397599        , -0.5088818        ,
-         0.113928524977506],
-       [-0.1893213        , -0.963491         , -0.1893214        ,
-         0.140277060860624],
-       [ 0.963491         , -0.1893213        , -0.1893213        ,
-         0.140277060860624],
-       [ 0.8397599        , -0.1893213        , -0.5088818        ,
-         0.113928524977506],
-       [ 0.8397599        , -0.5088817        , -0.1893215        ,
-         0.113928524977506],
-       [ 0.6943189        , -0.1893213        , -0.6943189        ,
-         0.070754581824036],
-       [ 0.6943189        , -0.5088817        , -0.5088817        ,
-         0.084710082958626],
-       [ 0.6943189        , -0.6943189        , -0.1893212        ,
-         0.070754581824036],
-       [ 0.5088817        , -0.1893213        , -0.83976          ,
-         0.113928524977506],
-       [ 0.5088817        , -0.5088817        , -0.6943189        ,
-         0.084710082958626],
-       [ 0.5088817        , -0.6943189        , -0.5088818        ,
-         0.084710082958626],
-       [ 0.5088817        , -0.8397599        , -0.1893216        ,
-         0.113928524977506],
-       [ 0.1893213        , -0.1893213        , -0.963491         ,
-         0.140277060860624],
-       [ 0.1893213        , -0.5088817        , -0.83976          ,
-         0.113928524977506],
-       [ 0.1893213        , -0.6943189        , -0.6943189        ,
-         0.070754581824036],
-       [ 0.1893213        , -0.8397599        , -0.5088818        ,
-         0.113928524977506],
-       [ 0.1893213        , -0.963491         , -0.1893214        ,
-         0.140277060860624]]), 12: array([[ 0.9716377        ,  0.1672127        ,  0.1672126        ,
-         0.111153616891108],
-       [ 0.8722705        ,  0.1672127        ,  0.4595477        ,
-         0.087777830109962],
-       [ 0.8722705        ,  0.4595476        ,  0.1672128        ,
-         0.087777830109962],
-       [ 0.760021         ,  0.1672127        ,  0.6280191        ,
-         0.058649878263272],
-       [ 0.760021         ,  0.4595476        ,  0.4595476        ,
-         0.078982625710995],
-       [ 0.760021         ,  0.6280191        ,  0.1672126        ,
-         0.058649878263272],
-       [ 0.6280191        ,  0.1672127        ,  0.760021         ,
-         0.058649878263272],
-       [ 0.6280191        ,  0.4595476        ,  0.6280191        ,
-         0.040607116249727],
-       [ 0.6280191        ,  0.6280191        ,  0.4595476        ,
-         0.040607116249727],
-       [ 0.6280191        ,  0.760021         ,  0.1672126        ,
-         0.058649878263272],
-       [ 0.4595476        ,  0.1672127        ,  0.8722705        ,
-         0.087777830109962],
-       [ 0.4595476        ,  0.4595476        ,  0.760021         ,
-         0.078982625710995],
-       [ 0.4595476        ,  0.6280191        ,  0.6280191        ,
-         0.040607116249727],
-       [ 0.4595476        ,  0.760021         ,  0.4595476        ,
-         0.078982625710995],
-       [ 0.4595476        ,  0.8722705        ,  0.1672128        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.1672127        ,  0.9716377        ,
-         0.111153616891108],
-       [ 0.1672127        ,  0.4595476        ,  0.8722705        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.6280191        ,  0.760021         ,
-         0.058649878263272],
-       [ 0.1672127        ,  0.760021         ,  0.6280191        ,
-         0.058649878263272],
-       [ 0.1672127        ,  0.8722705        ,  0.4595477        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.9716377        ,  0.1672126        ,
-         0.111153616891108],
-       [-0.9716377        ,  0.1672127        ,  0.1672126        ,
-         0.111153616891108],
-       [-0.8722705        ,  0.1672127        ,  0.4595477        ,
-         0.087777830109962],
-       [-0.8722705        ,  0.4595476        ,  0.1672128        ,
-         0.087777830109962],
-       [-0.760021         ,  0.1672127        ,  0.6280191        ,
-         0.058649878263272],
-       [-0.760021         ,  0.4595476        ,  0.4595476        ,
-         0.078982625710995],
-       [-0.760021         ,  0.6280191        ,  0.1672126        ,
-         0.058649878263272],
-       [-0.6280191        ,  0.1672127        ,  0.760021         ,
-         0.058649878263272],
-       [-0.6280191        ,  0.4595476        ,  0.6280191        ,
-         0.040607116249727],
-       [-0.6280191        ,  0.6280191        ,  0.4595476        ,
-         0.040607116249727],
-       [-0.6280191        ,  0.760021         ,  0.1672126        ,
-         0.058649878263272],
-       [-0.4595476        ,  0.1672127        ,  0.8722705        ,
-         0.087777830109962],
-       [-0.4595476        ,  0.4595476        ,  0.760021         ,
-         0.078982625710995],
-       [-0.4595476        ,  0.6280191        ,  0.6280191        ,
-         0.040607116249727],
-       [-0.4595476        ,  0.760021         ,  0.4595476        ,
-         0.078982625710995],
-       [-0.4595476        ,  0.8722705        ,  0.1672128        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.1672127        ,  0.9716377        ,
-         0.111153616891108],
-       [-0.1672127        ,  0.4595476        ,  0.8722705        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.6280191        ,  0.760021         ,
-         0.058649878263272],
-       [-0.1672127        ,  0.760021         ,  0.6280191        ,
-         0.058649878263272],
-       [-0.1672127        ,  0.8722705        ,  0.4595477        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.9716377        ,  0.1672126        ,
-         0.111153616891108],
-       [-0.9716377        , -0.1672127        ,  0.1672126        ,
-         0.111153616891108],
-       [-0.8722705        , -0.1672127        ,  0.4595477        ,
-         0.087777830109962],
-       [-0.8722705        , -0.4595476        ,  0.1672128        ,
-         0.087777830109962],
-       [-0.760021         , -0.1672127        ,  0.6280191        ,
-         0.058649878263272],
-       [-0.760021         , -0.4595476        ,  0.4595476        ,
-         0.078982625710995],
-       [-0.760021         , -0.6280191        ,  0.1672126        ,
-         0.058649878263272],
-       [-0.6280191        , -0.1672127        ,  0.760021         ,
-         0.058649878263272],
-       [-0.6280191        , -0.4595476        ,  0.6280191        ,
-         0.040607116249727],
-       [-0.6280191        , -0.6280191        ,  0.4595476        ,
-         0.040607116249727],
-       [-0.6280191        , -0.760021         ,  0.1672126        ,
-         0.058649878263272],
-       [-0.4595476        , -0.1672127        ,  0.8722705        ,
-         0.087777830109962],
-       [-0.4595476        , -0.4595476        ,  0.760021         ,
-         0.078982625710995],
-       [-0.4595476        , -0.6280191        ,  0.6280191        ,
-         0.040607116249727],
-       [-0.4595476        , -0.760021         ,  0.4595476        ,
-         0.078982625710995],
-       [-0.4595476        , -0.8722705        ,  0.1672128        ,
-         0.087777830109962],
-       [-0.1672127        , -0.1672127        ,  0.9716377        ,
-         0.111153616891108],
-       [-0.1672127        , -0.4595476        ,  0.8722705        ,
-         0.087777830109962],
-       [-0.1672127        , -0.6280191        ,  0.760021         ,
-         0.058649878263272],
-       [-0.1672127        , -0.760021         ,  0.6280191        ,
-         0.058649878263272],
-       [-0.1672127        , -0.8722705        ,  0.4595477        ,
-         0.087777830109962],
-       [-0.1672127        , -0.9716377        ,  0.1672126        ,
-         0.111153616891108],
-       [ 0.9716377        , -0.1672127        ,  0.1672126        ,
-         0.111153616891108],
-       [ 0.8722705        , -0.1672127        ,  0.4595477        ,
-         0.087777830109962],
-       [ 0.8722705        , -0.4595476        ,  0.1672128        ,
-         0.087777830109962],
-       [ 0.760021         , -0.1672127        ,  0.6280191        ,
-         0.058649878263272],
-       [ 0.760021         , -0.4595476        ,  0.4595476        ,
-         0.078982625710995],
-       [ 0.760021         , -0.6280191        ,  0.1672126        ,
-         0.058649878263272],
-       [ 0.6280191        , -0.1672127        ,  0.760021         ,
-         0.058649878263272],
-       [ 0.6280191        , -0.4595476        ,  0.6280191        ,
-         0.040607116249727],
-       [ 0.6280191        , -0.6280191        ,  0.4595476        ,
-         0.040607116249727],
-       [ 0.6280191        , -0.760021         ,  0.1672126        ,
-         0.058649878263272],
-       [ 0.4595476        , -0.1672127        ,  0.8722705        ,
-         0.087777830109962],
-       [ 0.4595476        , -0.4595476        ,  0.760021         ,
-         0.078982625710995],
-       [ 0.4595476        , -0.6280191        ,  0.6280191        ,
-         0.040607116249727],
-       [ 0.4595476        , -0.760021         ,  0.4595476        ,
-         0.078982625710995],
-       [ 0.4595476        , -0.8722705        ,  0.1672128        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.1672127        ,  0.9716377        ,
-         0.111153616891108],
-       [ 0.1672127        , -0.4595476        ,  0.8722705        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.6280191        ,  0.760021         ,
-         0.058649878263272],
-       [ 0.1672127        , -0.760021         ,  0.6280191        ,
-         0.058649878263272],
-       [ 0.1672127        , -0.8722705        ,  0.4595477        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.9716377        ,  0.1672126        ,
-         0.111153616891108],
-       [ 0.9716377        ,  0.1672127        , -0.1672126        ,
-         0.111153616891108],
-       [ 0.8722705        ,  0.1672127        , -0.4595477        ,
-         0.087777830109962],
-       [ 0.8722705        ,  0.4595476        , -0.1672128        ,
-         0.087777830109962],
-       [ 0.760021         ,  0.1672127        , -0.6280191        ,
-         0.058649878263272],
-       [ 0.760021         ,  0.4595476        , -0.4595476        ,
-         0.078982625710995],
-       [ 0.760021         ,  0.6280191        , -0.1672126        ,
-         0.058649878263272],
-       [ 0.6280191        ,  0.1672127        , -0.760021         ,
-         0.058649878263272],
-       [ 0.6280191        ,  0.4595476        , -0.6280191        ,
-         0.040607116249727],
-       [ 0.6280191        ,  0.6280191        , -0.4595476        ,
-         0.040607116249727],
-       [ 0.6280191        ,  0.760021         , -0.1672126        ,
-         0.058649878263272],
-       [ 0.4595476        ,  0.1672127        , -0.8722705        ,
-         0.087777830109962],
-       [ 0.4595476        ,  0.4595476        , -0.760021         ,
-         0.078982625710995],
-       [ 0.4595476        ,  0.6280191        , -0.6280191        ,
-         0.040607116249727],
-       [ 0.4595476        ,  0.760021         , -0.4595476        ,
-         0.078982625710995],
-       [ 0.4595476        ,  0.8722705        , -0.1672128        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.1672127        , -0.9716377        ,
-         0.111153616891108],
-       [ 0.1672127        ,  0.4595476        , -0.8722705        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.6280191        , -0.760021         ,
-         0.058649878263272],
-       [ 0.1672127        ,  0.760021         , -0.6280191        ,
-         0.058649878263272],
-       [ 0.1672127        ,  0.8722705        , -0.4595477        ,
-         0.087777830109962],
-       [ 0.1672127        ,  0.9716377        , -0.1672126        ,
-         0.111153616891108],
-       [-0.9716377        ,  0.1672127        , -0.1672126        ,
-         0.111153616891108],
-       [-0.8722705        ,  0.1672127        , -0.4595477        ,
-         0.087777830109962],
-       [-0.8722705        ,  0.4595476        , -0.1672128        ,
-         0.087777830109962],
-       [-0.760021         ,  0.1672127        , -0.6280191        ,
-         0.058649878263272],
-       [-0.760021         ,  0.4595476        , -0.4595476        ,
-         0.078982625710995],
-       [-0.760021         ,  0.6280191        , -0.1672126        ,
-         0.058649878263272],
-       [-0.6280191        ,  0.1672127        , -0.760021         ,
-         0.058649878263272],
-       [-0.6280191        ,  0.4595476        , -0.6280191        ,
-         0.040607116249727],
-       [-0.6280191        ,  0.6280191        , -0.4595476        ,
-         0.040607116249727],
-       [-0.6280191        ,  0.760021         , -0.1672126        ,
-         0.058649878263272],
-       [-0.4595476        ,  0.1672127        , -0.8722705        ,
-         0.087777830109962],
-       [-0.4595476        ,  0.4595476        , -0.760021         ,
-         0.078982625710995],
-       [-0.4595476        ,  0.6280191        , -0.6280191        ,
-         0.040607116249727],
-       [-0.4595476        ,  0.760021         , -0.4595476        ,
-         0.078982625710995],
-       [-0.4595476        ,  0.8722705        , -0.1672128        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.1672127        , -0.9716377        ,
-         0.111153616891108],
-       [-0.1672127        ,  0.4595476        , -0.8722705        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.6280191        , -0.760021         ,
-         0.058649878263272],
-       [-0.1672127        ,  0.760021         , -0.6280191        ,
-         0.058649878263272],
-       [-0.1672127        ,  0.8722705        , -0.4595477        ,
-         0.087777830109962],
-       [-0.1672127        ,  0.9716377        , -0.1672126        ,
-         0.111153616891108],
-       [-0.9716377        , -0.1672127        , -0.1672126        ,
-         0.111153616891108],
-       [-0.8722705        , -0.1672127        , -0.4595477        ,
-         0.087777830109962],
-       [-0.8722705        , -0.4595476        , -0.1672128        ,
-         0.087777830109962],
-       [-0.760021         , -0.1672127        , -0.6280191        ,
-         0.058649878263272],
-       [-0.760021         , -0.4595476        , -0.4595476        ,
-         0.078982625710995],
-       [-0.760021         , -0.6280191        , -0.1672126        ,
-         0.058649878263272],
-       [-0.6280191        , -0.1672127        , -0.760021         ,
-         0.058649878263272],
-       [-0.6280191        , -0.4595476        , -0.6280191        ,
-         0.040607116249727],
-       [-0.6280191        , -0.6280191        , -0.4595476        ,
-         0.040607116249727],
-       [-0.6280191        , -0.760021         , -0.1672126        ,
-         0.058649878263272],
-       [-0.4595476        , -0.1672127        , -0.8722705        ,
-         0.087777830109962],
-       [-0.4595476        , -0.4595476        , -0.760021         ,
-         0.078982625710995],
-       [-0.4595476        , -0.6280191        , -0.6280191        ,
-         0.040607116249727],
-       [-0.4595476        , -0.760021         , -0.4595476        ,
-         0.078982625710995],
-       [-0.4595476        , -0.8722705        , -0.1672128        ,
-         0.087777830109962],
-       [-0.1672127        , -0.1672127        , -0.9716377        ,
-         0.111153616891108],
-       [-0.1672127        , -0.4595476        , -0.8722705        ,
-         0.087777830109962],
-       [-0.1672127        , -0.6280191        , -0.760021         ,
-         0.058649878263272],
-       [-0.1672127        , -0.760021         , -0.6280191        ,
-         0.058649878263272],
-       [-0.1672127        , -0.8722705        , -0.4595477        ,
-         0.087777830109962],
-       [-0.1672127        , -0.9716377        , -0.1672126        ,
-         0.111153616891108],
-       [ 0.9716377        , -0.1672127        , -0.1672126        ,
-         0.111153616891108],
-       [ 0.8722705        , -0.1672127        , -0.4595477        ,
-         0.087777830109962],
-       [ 0.8722705        , -0.4595476        , -0.1672128        ,
-         0.087777830109962],
-       [ 0.760021         , -0.1672127        , -0.6280191        ,
-         0.058649878263272],
-       [ 0.760021         , -0.4595476        , -0.4595476        ,
-         0.078982625710995],
-       [ 0.760021         , -0.6280191        , -0.1672126        ,
-         0.058649878263272],
-       [ 0.6280191        , -0.1672127        , -0.760021         ,
-         0.058649878263272],
-       [ 0.6280191        , -0.4595476        , -0.6280191        ,
-         0.040607116249727],
-       [ 0.6280191        , -0.6280191        , -0.4595476        ,
-         0.040607116249727],
-       [ 0.6280191        , -0.760021         , -0.1672126        ,
-         0.058649878263272],
-       [ 0.4595476        , -0.1672127        , -0.8722705        ,
-         0.087777830109962],
-       [ 0.4595476        , -0.4595476        , -0.760021         ,
-         0.078982625710995],
-       [ 0.4595476        , -0.6280191        , -0.6280191        ,
-         0.040607116249727],
-       [ 0.4595476        , -0.760021         , -0.4595476        ,
-         0.078982625710995],
-       [ 0.4595476        , -0.8722705        , -0.1672128        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.1672127        , -0.9716377        ,
-         0.111153616891108],
-       [ 0.1672127        , -0.4595476        , -0.8722705        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.6280191        , -0.760021         ,
-         0.058649878263272],
-       [ 0.1672127        , -0.760021         , -0.6280191        ,
-         0.058649878263272],
-       [ 0.1672127        , -0.8722705        , -0.4595477        ,
-         0.087777830109962],
-       [ 0.1672127        , -0.9716377        , -0.1672126        ,
-         0.111153616891108]]), 14: array([[ 0.9766272        ,  0.1519859        ,  0.1519858        ,
-         0.091101537670281],
-       [ 0.8936911        ,  0.1519859        ,  0.4221569        ,
-         0.076813194106179],
-       [ 0.8936911        ,  0.422157         ,  0.1519857        ,
-         0.076813194106179],
-       [ 0.8022262        ,  0.1519859        ,  0.5773503        ,
-         0.034792680070358],
-       [ 0.8022262        ,  0.422157         ,  0.422157         ,
-         0.061868543560439],
-       [ 0.8022262        ,  0.5773503        ,  0.1519859        ,
-         0.034792680070358],
-       [ 0.6988921        ,  0.1519859        ,  0.6988921        ,
-         0.063932750581617],
-       [ 0.6988921        ,  0.422157         ,  0.5773503        ,
-         0.038565806686066],
-       [ 0.6988921        ,  0.5773503        ,  0.422157         ,
-         0.038565806686066],
-       [ 0.6988921        ,  0.6988921        ,  0.1519856        ,
-         0.063932750581617],
-       [ 0.5773503        ,  0.1519859        ,  0.8022262        ,
-         0.034792680070358],
-       [ 0.5773503        ,  0.422157         ,  0.6988921        ,
-         0.038565806686066],
-       [ 0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.019057746182273],
-       [ 0.5773503        ,  0.6988921        ,  0.422157         ,
-         0.038565806686066],
-       [ 0.5773503        ,  0.8022262        ,  0.1519859        ,
-         0.034792680070358],
-       [ 0.422157         ,  0.1519859        ,  0.8936911        ,
-         0.076813194106179],
-       [ 0.422157         ,  0.422157         ,  0.8022262        ,
-         0.061868543560439],
-       [ 0.422157         ,  0.5773503        ,  0.6988921        ,
-         0.038565806686066],
-       [ 0.422157         ,  0.6988921        ,  0.5773502        ,
-         0.038565806686066],
-       [ 0.422157         ,  0.8022262        ,  0.422157         ,
-         0.061868543560439],
-       [ 0.422157         ,  0.8936911        ,  0.1519857        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.1519859        ,  0.9766271        ,
-         0.091101537670281],
-       [ 0.1519859        ,  0.422157         ,  0.8936911        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.5773503        ,  0.8022262        ,
-         0.034792680070358],
-       [ 0.1519859        ,  0.6988921        ,  0.6988921        ,
-         0.063932750581617],
-       [ 0.1519859        ,  0.8022262        ,  0.5773503        ,
-         0.034792680070358],
-       [ 0.1519859        ,  0.8936911        ,  0.4221569        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.9766272        ,  0.1519857        ,
-         0.091101537670281],
-       [-0.9766272        ,  0.1519859        ,  0.1519858        ,
-         0.091101537670281],
-       [-0.8936911        ,  0.1519859        ,  0.4221569        ,
-         0.076813194106179],
-       [-0.8936911        ,  0.422157         ,  0.1519857        ,
-         0.076813194106179],
-       [-0.8022262        ,  0.1519859        ,  0.5773503        ,
-         0.034792680070358],
-       [-0.8022262        ,  0.422157         ,  0.422157         ,
-         0.061868543560439],
-       [-0.8022262        ,  0.5773503        ,  0.1519859        ,
-         0.034792680070358],
-       [-0.6988921        ,  0.1519859        ,  0.6988921        ,
-         0.063932750581617],
-       [-0.6988921        ,  0.422157         ,  0.5773503        ,
-         0.038565806686066],
-       [-0.6988921        ,  0.5773503        ,  0.422157         ,
-         0.038565806686066],
-       [-0.6988921        ,  0.6988921        ,  0.1519856        ,
-         0.063932750581617],
-       [-0.5773503        ,  0.1519859        ,  0.8022262        ,
-         0.034792680070358],
-       [-0.5773503        ,  0.422157         ,  0.6988921        ,
-         0.038565806686066],
-       [-0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.019057746182273],
-       [-0.5773503        ,  0.6988921        ,  0.422157         ,
-         0.038565806686066],
-       [-0.5773503        ,  0.8022262        ,  0.1519859        ,
-         0.034792680070358],
-       [-0.422157         ,  0.1519859        ,  0.8936911        ,
-         0.076813194106179],
-       [-0.422157         ,  0.422157         ,  0.8022262        ,
-         0.061868543560439],
-       [-0.422157         ,  0.5773503        ,  0.6988921        ,
-         0.038565806686066],
-       [-0.422157         ,  0.6988921        ,  0.5773502        ,
-         0.038565806686066],
-       [-0.422157         ,  0.8022262        ,  0.422157         ,
-         0.061868543560439],
-       [-0.422157         ,  0.8936911        ,  0.1519857        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.1519859        ,  0.9766271        ,
-         0.091101537670281],
-       [-0.1519859        ,  0.422157         ,  0.8936911        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.5773503        ,  0.8022262        ,
-         0.034792680070358],
-       [-0.1519859        ,  0.6988921        ,  0.6988921        ,
-         0.063932750581617],
-       [-0.1519859        ,  0.8022262        ,  0.5773503        ,
-         0.034792680070358],
-       [-0.1519859        ,  0.8936911        ,  0.4221569        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.9766272        ,  0.1519857        ,
-         0.091101537670281],
-       [-0.9766272        , -0.1519859        ,  0.1519858        ,
-         0.091101537670281],
-       [-0.8936911        , -0.1519859        ,  0.4221569        ,
-         0.076813194106179],
-       [-0.8936911        , -0.422157         ,  0.1519857        ,
-         0.076813194106179],
-       [-0.8022262        , -0.1519859        ,  0.5773503        ,
-         0.034792680070358],
-       [-0.8022262        , -0.422157         ,  0.422157         ,
-         0.061868543560439],
-       [-0.8022262        , -0.5773503        ,  0.1519859        ,
-         0.034792680070358],
-       [-0.6988921        , -0.1519859        ,  0.6988921        ,
-         0.063932750581617],
-       [-0.6988921        , -0.422157         ,  0.5773503        ,
-         0.038565806686066],
-       [-0.6988921        , -0.5773503        ,  0.422157         ,
-         0.038565806686066],
-       [-0.6988921        , -0.6988921        ,  0.1519856        ,
-         0.063932750581617],
-       [-0.5773503        , -0.1519859        ,  0.8022262        ,
-         0.034792680070358],
-       [-0.5773503        , -0.422157         ,  0.6988921        ,
-         0.038565806686066],
-       [-0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.019057746182273],
-       [-0.5773503        , -0.6988921        ,  0.422157         ,
-         0.038565806686066],
-       [-0.5773503        , -0.8022262        ,  0.1519859        ,
-         0.034792680070358],
-       [-0.422157         , -0.1519859        ,  0.8936911        ,
-         0.076813194106179],
-       [-0.422157         , -0.422157         ,  0.8022262        ,
-         0.061868543560439],
-       [-0.422157         , -0.5773503        ,  0.6988921        ,
-         0.038565806686066],
-       [-0.422157         , -0.6988921        ,  0.5773502        ,
-         0.038565806686066],
-       [-0.422157         , -0.8022262        ,  0.422157         ,
-         0.061868543560439],
-       [-0.422157         , -0.8936911        ,  0.1519857        ,
-         0.076813194106179],
-       [-0.1519859        , -0.1519859        ,  0.9766271        ,
-         0.091101537670281],
-       [-0.1519859        , -0.422157         ,  0.8936911        ,
-         0.076813194106179],
-       [-0.1519859        , -0.5773503        ,  0.8022262        ,
-         0.034792680070358],
-       [-0.1519859        , -0.6988921        ,  0.6988921        ,
-         0.063932750581617],
-       [-0.1519859        , -0.8022262        ,  0.5773503        ,
-         0.034792680070358],
-       [-0.1519859        , -0.8936911        ,  0.4221569        ,
-         0.076813194106179],
-       [-0.1519859        , -0.9766272        ,  0.1519857        ,
-         0.091101537670281],
-       [ 0.9766272        , -0.1519859        ,  0.1519858        ,
-         0.091101537670281],
-       [ 0.8936911        , -0.1519859        ,  0.4221569        ,
-         0.076813194106179],
-       [ 0.8936911        , -0.422157         ,  0.1519857        ,
-         0.076813194106179],
-       [ 0.8022262        , -0.1519859        ,  0.5773503        ,
-         0.034792680070358],
-       [ 0.8022262        , -0.422157         ,  0.422157         ,
-         0.061868543560439],
-       [ 0.8022262        , -0.5773503        ,  0.1519859        ,
-         0.034792680070358],
-       [ 0.6988921        , -0.1519859        ,  0.6988921        ,
-         0.063932750581617],
-       [ 0.6988921        , -0.422157         ,  0.5773503        ,
-         0.038565806686066],
-       [ 0.6988921        , -0.5773503        ,  0.422157         ,
-         0.038565806686066],
-       [ 0.6988921        , -0.6988921        ,  0.1519856        ,
-         0.063932750581617],
-       [ 0.5773503        , -0.1519859        ,  0.8022262        ,
-         0.034792680070358],
-       [ 0.5773503        , -0.422157         ,  0.6988921        ,
-         0.038565806686066],
-       [ 0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.019057746182273],
-       [ 0.5773503        , -0.6988921        ,  0.422157         ,
-         0.038565806686066],
-       [ 0.5773503        , -0.8022262        ,  0.1519859        ,
-         0.034792680070358],
-       [ 0.422157         , -0.1519859        ,  0.8936911        ,
-         0.076813194106179],
-       [ 0.422157         , -0.422157         ,  0.8022262        ,
-         0.061868543560439],
-       [ 0.422157         , -0.5773503        ,  0.6988921        ,
-         0.038565806686066],
-       [ 0.422157         , -0.6988921        ,  0.5773502        ,
-         0.038565806686066],
-       [ 0.422157         , -0.8022262        ,  0.422157         ,
-         0.061868543560439],
-       [ 0.422157         , -0.8936911        ,  0.1519857        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.1519859        ,  0.9766271        ,
-         0.091101537670281],
-       [ 0.1519859        , -0.422157         ,  0.8936911        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.5773503        ,  0.8022262        ,
-         0.034792680070358],
-       [ 0.1519859        , -0.6988921        ,  0.6988921        ,
-         0.063932750581617],
-       [ 0.1519859        , -0.8022262        ,  0.5773503        ,
-         0.034792680070358],
-       [ 0.1519859        , -0.8936911        ,  0.4221569        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.9766272        ,  0.1519857        ,
-         0.091101537670281],
-       [ 0.9766272        ,  0.1519859        , -0.1519858        ,
-         0.091101537670281],
-       [ 0.8936911        ,  0.1519859        , -0.4221569        ,
-         0.076813194106179],
-       [ 0.8936911        ,  0.422157         , -0.1519857        ,
-         0.076813194106179],
-       [ 0.8022262        ,  0.1519859        , -0.5773503        ,
-         0.034792680070358],
-       [ 0.8022262        ,  0.422157         , -0.422157         ,
-         0.061868543560439],
-       [ 0.8022262        ,  0.5773503        , -0.1519859        ,
-         0.034792680070358],
-       [ 0.6988921        ,  0.1519859        , -0.6988921        ,
-         0.063932750581617],
-       [ 0.6988921        ,  0.422157         , -0.5773503        ,
-         0.038565806686066],
-       [ 0.6988921        ,  0.5773503        , -0.422157         ,
-         0.038565806686066],
-       [ 0.6988921        ,  0.6988921        , -0.1519856        ,
-         0.063932750581617],
-       [ 0.5773503        ,  0.1519859        , -0.8022262        ,
-         0.034792680070358],
-       [ 0.5773503        ,  0.422157         , -0.6988921        ,
-         0.038565806686066],
-       [ 0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.019057746182273],
-       [ 0.5773503        ,  0.6988921        , -0.422157         ,
-         0.038565806686066],
-       [ 0.5773503        ,  0.8022262        , -0.1519859        ,
-         0.034792680070358],
-       [ 0.422157         ,  0.1519859        , -0.8936911        ,
-         0.076813194106179],
-       [ 0.422157         ,  0.422157         , -0.8022262        ,
-         0.061868543560439],
-       [ 0.422157         ,  0.5773503        , -0.6988921        ,
-         0.038565806686066],
-       [ 0.422157         ,  0.6988921        , -0.5773502        ,
-         0.038565806686066],
-       [ 0.422157         ,  0.8022262        , -0.422157         ,
-         0.061868543560439],
-       [ 0.422157         ,  0.8936911        , -0.1519857        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.1519859        , -0.9766271        ,
-         0.091101537670281],
-       [ 0.1519859        ,  0.422157         , -0.8936911        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.5773503        , -0.8022262        ,
-         0.034792680070358],
-       [ 0.1519859        ,  0.6988921        , -0.6988921        ,
-         0.063932750581617],
-       [ 0.1519859        ,  0.8022262        , -0.5773503        ,
-         0.034792680070358],
-       [ 0.1519859        ,  0.8936911        , -0.4221569        ,
-         0.076813194106179],
-       [ 0.1519859        ,  0.9766272        , -0.1519857        ,
-         0.091101537670281],
-       [-0.9766272        ,  0.1519859        , -0.1519858        ,
-         0.091101537670281],
-       [-0.8936911        ,  0.1519859        , -0.4221569        ,
-         0.076813194106179],
-       [-0.8936911        ,  0.422157         , -0.1519857        ,
-         0.076813194106179],
-       [-0.8022262        ,  0.1519859        , -0.5773503        ,
-         0.034792680070358],
-       [-0.8022262        ,  0.422157         , -0.422157         ,
-         0.061868543560439],
-       [-0.8022262        ,  0.5773503        , -0.1519859        ,
-         0.034792680070358],
-       [-0.6988921        ,  0.1519859        , -0.6988921        ,
-         0.063932750581617],
-       [-0.6988921        ,  0.422157         , -0.5773503        ,
-         0.038565806686066],
-       [-0.6988921        ,  0.5773503        , -0.422157         ,
-         0.038565806686066],
-       [-0.6988921        ,  0.6988921        , -0.1519856        ,
-         0.063932750581617],
-       [-0.5773503        ,  0.1519859        , -0.8022262        ,
-         0.034792680070358],
-       [-0.5773503        ,  0.422157         , -0.6988921        ,
-         0.038565806686066],
-       [-0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.019057746182273],
-       [-0.5773503        ,  0.6988921        , -0.422157         ,
-         0.038565806686066],
-       [-0.5773503        ,  0.8022262        , -0.1519859        ,
-         0.034792680070358],
-       [-0.422157         ,  0.1519859        , -0.8936911        ,
-         0.076813194106179],
-       [-0.422157         ,  0.422157         , -0.8022262        ,
-         0.061868543560439],
-       [-0.422157         ,  0.5773503        , -0.6988921        ,
-         0.038565806686066],
-       [-0.422157         ,  0.6988921        , -0.5773502        ,
-         0.038565806686066],
-       [-0.422157         ,  0.8022262        , -0.422157         ,
-         0.061868543560439],
-       [-0.422157         ,  0.8936911        , -0.1519857        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.1519859        , -0.9766271        ,
-         0.091101537670281],
-       [-0.1519859        ,  0.422157         , -0.8936911        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.5773503        , -0.8022262        ,
-         0.034792680070358],
-       [-0.1519859        ,  0.6988921        , -0.6988921        ,
-         0.063932750581617],
-       [-0.1519859        ,  0.8022262        , -0.5773503        ,
-         0.034792680070358],
-       [-0.1519859        ,  0.8936911        , -0.4221569        ,
-         0.076813194106179],
-       [-0.1519859        ,  0.9766272        , -0.1519857        ,
-         0.091101537670281],
-       [-0.9766272        , -0.1519859        , -0.1519858        ,
-         0.091101537670281],
-       [-0.8936911        , -0.1519859        , -0.4221569        ,
-         0.076813194106179],
-       [-0.8936911        , -0.422157         , -0.1519857        ,
-         0.076813194106179],
-       [-0.8022262        , -0.1519859        , -0.5773503        ,
-         0.034792680070358],
-       [-0.8022262        , -0.422157         , -0.422157         ,
-         0.061868543560439],
-       [-0.8022262        , -0.5773503        , -0.1519859        ,
-         0.034792680070358],
-       [-0.6988921        , -0.1519859        , -0.6988921        ,
-         0.063932750581617],
-       [-0.6988921        , -0.422157         , -0.5773503        ,
-         0.038565806686066],
-       [-0.6988921        , -0.5773503        , -0.422157         ,
-         0.038565806686066],
-       [-0.6988921        , -0.6988921        , -0.1519856        ,
-         0.063932750581617],
-       [-0.5773503        , -0.1519859        , -0.8022262        ,
-         0.034792680070358],
-       [-0.5773503        , -0.422157         , -0.6988921        ,
-         0.038565806686066],
-       [-0.5773503        , -0.5773503        , -0.5773503        ,
-         0.019057746182273],
-       [-0.5773503        , -0.6988921        , -0.422157         ,
-         0.038565806686066],
-       [-0.5773503        , -0.8022262        , -0.1519859        ,
-         0.034792680070358],
-       [-0.422157         , -0.1519859        , -0.8936911        ,
-         0.076813194106179],
-       [-0.422157         , -0.422157         , -0.8022262        ,
-         0.061868543560439],
-       [-0.422157         , -0.5773503        , -0.6988921        ,
-         0.038565806686066],
-       [-0.422157         , -0.6988921        , -0.5773502        ,
-         0.038565806686066],
-       [-0.422157         , -0.8022262        , -0.422157         ,
-         0.061868543560439],
-       [-0.422157         , -0.8936911        , -0.1519857        ,
-         0.076813194106179],
-       [-0.1519859        , -0.1519859        , -0.9766271        ,
-         0.091101537670281],
-       [-0.1519859        , -0.422157         , -0.8936911        ,
-         0.076813194106179],
-       [-0.1519859        , -0.5773503        , -0.8022262        ,
-         0.034792680070358],
-       [-0.1519859        , -0.6988921        , -0.6988921        ,
-         0.063932750581617],
-       [-0.1519859        , -0.8022262        , -0.5773503        ,
-         0.034792680070358],
-       [-0.1519859        , -0.8936911        , -0.4221569        ,
-         0.076813194106179],
-       [-0.1519859        , -0.9766272        , -0.1519857        ,
-         0.091101537670281],
-       [ 0.9766272        , -0.1519859        , -0.1519858        ,
-         0.091101537670281],
-       [ 0.8936911        , -0.1519859        , -0.4221569        ,
-         0.076813194106179],
-       [ 0.8936911        , -0.422157         , -0.1519857        ,
-         0.076813194106179],
-       [ 0.8022262        , -0.1519859        , -0.5773503        ,
-         0.034792680070358],
-       [ 0.8022262        , -0.422157         , -0.422157         ,
-         0.061868543560439],
-       [ 0.8022262        , -0.5773503        , -0.1519859        ,
-         0.034792680070358],
-       [ 0.6988921        , -0.1519859        , -0.6988921        ,
-         0.063932750581617],
-       [ 0.6988921        , -0.422157         , -0.5773503        ,
-         0.038565806686066],
-       [ 0.6988921        , -0.5773503        , -0.422157         ,
-         0.038565806686066],
-       [ 0.6988921        , -0.6988921        , -0.1519856        ,
-         0.063932750581617],
-       [ 0.5773503        , -0.1519859        , -0.8022262        ,
-         0.034792680070358],
-       [ 0.5773503        , -0.422157         , -0.6988921        ,
-         0.038565806686066],
-       [ 0.5773503        , -0.5773503        , -0.5773503        ,
-         0.019057746182273],
-       [ 0.5773503        , -0.6988921        , -0.422157         ,
-         0.038565806686066],
-       [ 0.5773503        , -0.8022262        , -0.1519859        ,
-         0.034792680070358],
-       [ 0.422157         , -0.1519859        , -0.8936911        ,
-         0.076813194106179],
-       [ 0.422157         , -0.422157         , -0.8022262        ,
-         0.061868543560439],
-       [ 0.422157         , -0.5773503        , -0.6988921        ,
-         0.038565806686066],
-       [ 0.422157         , -0.6988921        , -0.5773502        ,
-         0.038565806686066],
-       [ 0.422157         , -0.8022262        , -0.422157         ,
-         0.061868543560439],
-       [ 0.422157         , -0.8936911        , -0.1519857        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.1519859        , -0.9766271        ,
-         0.091101537670281],
-       [ 0.1519859        , -0.422157         , -0.8936911        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.5773503        , -0.8022262        ,
-         0.034792680070358],
-       [ 0.1519859        , -0.6988921        , -0.6988921        ,
-         0.063932750581617],
-       [ 0.1519859        , -0.8022262        , -0.5773503        ,
-         0.034792680070358],
-       [ 0.1519859        , -0.8936911        , -0.4221569        ,
-         0.076813194106179],
-       [ 0.1519859        , -0.9766272        , -0.1519857        ,
-         0.091101537670281]]), 16: array([[ 0.9805009        ,  0.1389569        ,  0.1389569        ,
-         0.076948977605987],
-       [ 0.9092855        ,  0.1389569        ,  0.3922893        ,
-         0.06492037838973 ],
-       [ 0.9092855        ,  0.3922893        ,  0.1389569        ,
-         0.06492037838973 ],
-       [ 0.8319966        ,  0.1389569        ,  0.5370965        ,
-         0.035260603350204],
-       [ 0.8319966        ,  0.3922893        ,  0.3922892        ,
-         0.05280804944503 ],
-       [ 0.8319966        ,  0.5370966        ,  0.1389568        ,
-         0.035260603350204],
-       [ 0.7467506        ,  0.1389569        ,  0.6504264        ,
-         0.038336351401506],
-       [ 0.7467506        ,  0.3922893        ,  0.5370966        ,
-         0.024620507993437],
-       [ 0.7467506        ,  0.5370966        ,  0.3922893        ,
-         0.024620507993437],
-       [ 0.7467506        ,  0.6504264        ,  0.1389568        ,
-         0.038336351401506],
-       [ 0.6504264        ,  0.1389569        ,  0.7467506        ,
-         0.038336351401506],
-       [ 0.6504264        ,  0.3922893        ,  0.6504264        ,
-         0.058002800196659],
-       [ 0.6504264        ,  0.5370966        ,  0.5370966        ,
-         0.009563266080869],
-       [ 0.6504264        ,  0.6504264        ,  0.3922893        ,
-         0.058002800196659],
-       [ 0.6504264        ,  0.7467506        ,  0.1389568        ,
-         0.038336351401506],
-       [ 0.5370966        ,  0.1389569        ,  0.8319966        ,
-         0.035260603350204],
-       [ 0.5370966        ,  0.3922893        ,  0.7467506        ,
-         0.024620507993437],
-       [ 0.5370966        ,  0.5370966        ,  0.6504264        ,
-         0.009563266080869],
-       [ 0.5370966        ,  0.6504264        ,  0.5370966        ,
-         0.009563266080869],
-       [ 0.5370966        ,  0.7467506        ,  0.3922893        ,
-         0.024620507993437],
-       [ 0.5370966        ,  0.8319966        ,  0.1389568        ,
-         0.035260603350204],
-       [ 0.3922893        ,  0.1389569        ,  0.9092855        ,
-         0.06492037838973 ],
-       [ 0.3922893        ,  0.3922893        ,  0.8319966        ,
-         0.05280804944503 ],
-       [ 0.3922893        ,  0.5370966        ,  0.7467506        ,
-         0.024620507993437],
-       [ 0.3922893        ,  0.6504264        ,  0.6504264        ,
-         0.058002800196659],
-       [ 0.3922893        ,  0.7467506        ,  0.5370966        ,
-         0.024620507993437],
-       [ 0.3922893        ,  0.8319966        ,  0.3922893        ,
-         0.05280804944503 ],
-       [ 0.3922893        ,  0.9092855        ,  0.138957         ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.1389569        ,  0.9805009        ,
-         0.076948977605987],
-       [ 0.1389569        ,  0.3922893        ,  0.9092855        ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.5370966        ,  0.8319966        ,
-         0.035260603350204],
-       [ 0.1389569        ,  0.6504264        ,  0.7467506        ,
-         0.038336351401506],
-       [ 0.1389569        ,  0.7467506        ,  0.6504264        ,
-         0.038336351401506],
-       [ 0.1389569        ,  0.8319966        ,  0.5370966        ,
-         0.035260603350204],
-       [ 0.1389569        ,  0.9092855        ,  0.3922893        ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.9805009        ,  0.138957         ,
-         0.076948977605987],
-       [-0.9805009        ,  0.1389569        ,  0.1389569        ,
-         0.076948977605987],
-       [-0.9092855        ,  0.1389569        ,  0.3922893        ,
-         0.06492037838973 ],
-       [-0.9092855        ,  0.3922893        ,  0.1389569        ,
-         0.06492037838973 ],
-       [-0.8319966        ,  0.1389569        ,  0.5370965        ,
-         0.035260603350204],
-       [-0.8319966        ,  0.3922893        ,  0.3922892        ,
-         0.05280804944503 ],
-       [-0.8319966        ,  0.5370966        ,  0.1389568        ,
-         0.035260603350204],
-       [-0.7467506        ,  0.1389569        ,  0.6504264        ,
-         0.038336351401506],
-       [-0.7467506        ,  0.3922893        ,  0.5370966        ,
-         0.024620507993437],
-       [-0.7467506        ,  0.5370966        ,  0.3922893        ,
-         0.024620507993437],
-       [-0.7467506        ,  0.6504264        ,  0.1389568        ,
-         0.038336351401506],
-       [-0.6504264        ,  0.1389569        ,  0.7467506        ,
-         0.038336351401506],
-       [-0.6504264        ,  0.3922893        ,  0.6504264        ,
-         0.058002800196659],
-       [-0.6504264        ,  0.5370966        ,  0.5370966        ,
-         0.009563266080869],
-       [-0.6504264        ,  0.6504264        ,  0.3922893        ,
-         0.058002800196659],
-       [-0.6504264        ,  0.7467506        ,  0.1389568        ,
-         0.038336351401506],
-       [-0.5370966        ,  0.1389569        ,  0.8319966        ,
-         0.035260603350204],
-       [-0.5370966        ,  0.3922893        ,  0.7467506        ,
-         0.024620507993437],
-       [-0.5370966        ,  0.5370966        ,  0.6504264        ,
-         0.009563266080869],
-       [-0.5370966        ,  0.6504264        ,  0.5370966        ,
-         0.009563266080869],
-       [-0.5370966        ,  0.7467506        ,  0.3922893        ,
-         0.024620507993437],
-       [-0.5370966        ,  0.8319966        ,  0.1389568        ,
-         0.035260603350204],
-       [-0.3922893        ,  0.1389569        ,  0.9092855        ,
-         0.06492037838973 ],
-       [-0.3922893        ,  0.3922893        ,  0.8319966        ,
-         0.05280804944503 ],
-       [-0.3922893        ,  0.5370966        ,  0.7467506        ,
-         0.024620507993437],
-       [-0.3922893        ,  0.6504264        ,  0.6504264        ,
-         0.058002800196659],
-       [-0.3922893        ,  0.7467506        ,  0.5370966        ,
-         0.024620507993437],
-       [-0.3922893        ,  0.8319966        ,  0.3922893        ,
-         0.05280804944503 ],
-       [-0.3922893        ,  0.9092855        ,  0.138957         ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.1389569        ,  0.9805009        ,
-         0.076948977605987],
-       [-0.1389569        ,  0.3922893        ,  0.9092855        ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.5370966        ,  0.8319966        ,
-         0.035260603350204],
-       [-0.1389569        ,  0.6504264        ,  0.7467506        ,
-         0.038336351401506],
-       [-0.1389569        ,  0.7467506        ,  0.6504264        ,
-         0.038336351401506],
-       [-0.1389569        ,  0.8319966        ,  0.5370966        ,
-         0.035260603350204],
-       [-0.1389569        ,  0.9092855        ,  0.3922893        ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.9805009        ,  0.138957         ,
-         0.076948977605987],
-       [-0.9805009        , -0.1389569        ,  0.1389569        ,
-         0.076948977605987],
-       [-0.9092855        , -0.1389569        ,  0.3922893        ,
-         0.06492037838973 ],
-       [-0.9092855        , -0.3922893        ,  0.1389569        ,
-         0.06492037838973 ],
-       [-0.8319966        , -0.1389569        ,  0.5370965        ,
-         0.035260603350204],
-       [-0.8319966        , -0.3922893        ,  0.3922892        ,
-         0.05280804944503 ],
-       [-0.8319966        , -0.5370966        ,  0.1389568        ,
-         0.035260603350204],
-       [-0.7467506        , -0.1389569        ,  0.6504264        ,
-         0.038336351401506],
-       [-0.7467506        , -0.3922893        ,  0.5370966        ,
-         0.024620507993437],
-       [-0.7467506        , -0.5370966        ,  0.3922893        ,
-         0.024620507993437],
-       [-0.7467506        , -0.6504264        ,  0.1389568        ,
-         0.038336351401506],
-       [-0.6504264        , -0.1389569        ,  0.7467506        ,
-         0.038336351401506],
-       [-0.6504264        , -0.3922893        ,  0.6504264        ,
-         0.058002800196659],
-       [-0.6504264        , -0.5370966        ,  0.5370966        ,
-         0.009563266080869],
-       [-0.6504264        , -0.6504264        ,  0.3922893        ,
-         0.058002800196659],
-       [-0.6504264        , -0.7467506        ,  0.1389568        ,
-         0.038336351401506],
-       [-0.5370966        , -0.1389569        ,  0.8319966        ,
-         0.035260603350204],
-       [-0.5370966        , -0.3922893        ,  0.7467506        ,
-         0.024620507993437],
-       [-0.5370966        , -0.5370966        ,  0.6504264        ,
-         0.009563266080869],
-       [-0.5370966        , -0.6504264        ,  0.5370966        ,
-         0.009563266080869],
-       [-0.5370966        , -0.7467506        ,  0.3922893        ,
-         0.024620507993437],
-       [-0.5370966        , -0.8319966        ,  0.1389568        ,
-         0.035260603350204],
-       [-0.3922893        , -0.1389569        ,  0.9092855        ,
-         0.06492037838973 ],
-       [-0.3922893        , -0.3922893        ,  0.8319966        ,
-         0.05280804944503 ],
-       [-0.3922893        , -0.5370966        ,  0.7467506        ,
-         0.024620507993437],
-       [-0.3922893        , -0.6504264        ,  0.6504264        ,
-         0.058002800196659],
-       [-0.3922893        , -0.7467506        ,  0.5370966        ,
-         0.024620507993437],
-       [-0.3922893        , -0.8319966        ,  0.3922893        ,
-         0.05280804944503 ],
-       [-0.3922893        , -0.9092855        ,  0.138957         ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.1389569        ,  0.9805009        ,
-         0.076948977605987],
-       [-0.1389569        , -0.3922893        ,  0.9092855        ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.5370966        ,  0.8319966        ,
-         0.035260603350204],
-       [-0.1389569        , -0.6504264        ,  0.7467506        ,
-         0.038336351401506],
-       [-0.1389569        , -0.7467506        ,  0.6504264        ,
-         0.038336351401506],
-       [-0.1389569        , -0.8319966        ,  0.5370966        ,
-         0.035260603350204],
-       [-0.1389569        , -0.9092855        ,  0.3922893        ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.9805009        ,  0.138957         ,
-         0.076948977605987],
-       [ 0.9805009        , -0.1389569        ,  0.1389569        ,
-         0.076948977605987],
-       [ 0.9092855        , -0.1389569        ,  0.3922893        ,
-         0.06492037838973 ],
-       [ 0.9092855        , -0.3922893        ,  0.1389569        ,
-         0.06492037838973 ],
-       [ 0.8319966        , -0.1389569        ,  0.5370965        ,
-         0.035260603350204],
-       [ 0.8319966        , -0.3922893        ,  0.3922892        ,
-         0.05280804944503 ],
-       [ 0.8319966        , -0.5370966        ,  0.1389568        ,
-         0.035260603350204],
-       [ 0.7467506        , -0.1389569        ,  0.6504264        ,
-         0.038336351401506],
-       [ 0.7467506        , -0.3922893        ,  0.5370966        ,
-         0.024620507993437],
-       [ 0.7467506        , -0.5370966        ,  0.3922893        ,
-         0.024620507993437],
-       [ 0.7467506        , -0.6504264        ,  0.1389568        ,
-         0.038336351401506],
-       [ 0.6504264        , -0.1389569        ,  0.7467506        ,
-         0.038336351401506],
-       [ 0.6504264        , -0.3922893        ,  0.6504264        ,
-         0.058002800196659],
-       [ 0.6504264        , -0.5370966        ,  0.5370966        ,
-         0.009563266080869],
-       [ 0.6504264        , -0.6504264        ,  0.3922893        ,
-         0.058002800196659],
-       [ 0.6504264        , -0.7467506        ,  0.1389568        ,
-         0.038336351401506],
-       [ 0.5370966        , -0.1389569        ,  0.8319966        ,
-         0.035260603350204],
-       [ 0.5370966        , -0.3922893        ,  0.7467506        ,
-         0.024620507993437],
-       [ 0.5370966        , -0.5370966        ,  0.6504264        ,
-         0.009563266080869],
-       [ 0.5370966        , -0.6504264        ,  0.5370966        ,
-         0.009563266080869],
-       [ 0.5370966        , -0.7467506        ,  0.3922893        ,
-         0.024620507993437],
-       [ 0.5370966        , -0.8319966        ,  0.1389568        ,
-         0.035260603350204],
-       [ 0.3922893        , -0.1389569        ,  0.9092855        ,
-         0.06492037838973 ],
-       [ 0.3922893        , -0.3922893        ,  0.8319966        ,
-         0.05280804944503 ],
-       [ 0.3922893        , -0.5370966        ,  0.7467506        ,
-         0.024620507993437],
-       [ 0.3922893        , -0.6504264        ,  0.6504264        ,
-         0.058002800196659],
-       [ 0.3922893        , -0.7467506        ,  0.5370966        ,
-         0.024620507993437],
-       [ 0.3922893        , -0.8319966        ,  0.3922893        ,
-         0.05280804944503 ],
-       [ 0.3922893        , -0.9092855        ,  0.138957         ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.1389569        ,  0.9805009        ,
-         0.076948977605987],
-       [ 0.1389569        , -0.3922893        ,  0.9092855        ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.5370966        ,  0.8319966        ,
-         0.035260603350204],
-       [ 0.1389569        , -0.6504264        ,  0.7467506        ,
-         0.038336351401506],
-       [ 0.1389569        , -0.7467506        ,  0.6504264        ,
-         0.038336351401506],
-       [ 0.1389569        , -0.8319966        ,  0.5370966        ,
-         0.035260603350204],
-       [ 0.1389569        , -0.9092855        ,  0.3922893        ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.9805009        ,  0.138957         ,
-         0.076948977605987],
-       [ 0.9805009        ,  0.1389569        , -0.1389569        ,
-         0.076948977605987],
-       [ 0.9092855        ,  0.1389569        , -0.3922893        ,
-         0.06492037838973 ],
-       [ 0.9092855        ,  0.3922893        , -0.1389569        ,
-         0.06492037838973 ],
-       [ 0.8319966        ,  0.1389569        , -0.5370965        ,
-         0.035260603350204],
-       [ 0.8319966        ,  0.3922893        , -0.3922892        ,
-         0.05280804944503 ],
-       [ 0.8319966        ,  0.5370966        , -0.1389568        ,
-         0.035260603350204],
-       [ 0.7467506        ,  0.1389569        , -0.6504264        ,
-         0.038336351401506],
-       [ 0.7467506        ,  0.3922893        , -0.5370966        ,
-         0.024620507993437],
-       [ 0.7467506        ,  0.5370966        , -0.3922893        ,
-         0.024620507993437],
-       [ 0.7467506        ,  0.6504264        , -0.1389568        ,
-         0.038336351401506],
-       [ 0.6504264        ,  0.1389569        , -0.7467506        ,
-         0.038336351401506],
-       [ 0.6504264        ,  0.3922893        , -0.6504264        ,
-         0.058002800196659],
-       [ 0.6504264        ,  0.5370966        , -0.5370966        ,
-         0.009563266080869],
-       [ 0.6504264        ,  0.6504264        , -0.3922893        ,
-         0.058002800196659],
-       [ 0.6504264        ,  0.7467506        , -0.1389568        ,
-         0.038336351401506],
-       [ 0.5370966        ,  0.1389569        , -0.8319966        ,
-         0.035260603350204],
-       [ 0.5370966        ,  0.3922893        , -0.7467506        ,
-         0.024620507993437],
-       [ 0.5370966        ,  0.5370966        , -0.6504264        ,
-         0.009563266080869],
-       [ 0.5370966        ,  0.6504264        , -0.5370966        ,
-         0.009563266080869],
-       [ 0.5370966        ,  0.7467506        , -0.3922893        ,
-         0.024620507993437],
-       [ 0.5370966        ,  0.8319966        , -0.1389568        ,
-         0.035260603350204],
-       [ 0.3922893        ,  0.1389569        , -0.9092855        ,
-         0.06492037838973 ],
-       [ 0.3922893        ,  0.3922893        , -0.8319966        ,
-         0.05280804944503 ],
-       [ 0.3922893        ,  0.5370966        , -0.7467506        ,
-         0.024620507993437],
-       [ 0.3922893        ,  0.6504264        , -0.6504264        ,
-         0.058002800196659],
-       [ 0.3922893        ,  0.7467506        , -0.5370966        ,
-         0.024620507993437],
-       [ 0.3922893        ,  0.8319966        , -0.3922893        ,
-         0.05280804944503 ],
-       [ 0.3922893        ,  0.9092855        , -0.138957         ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.1389569        , -0.9805009        ,
-         0.076948977605987],
-       [ 0.1389569        ,  0.3922893        , -0.9092855        ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.5370966        , -0.8319966        ,
-         0.035260603350204],
-       [ 0.1389569        ,  0.6504264        , -0.7467506        ,
-         0.038336351401506],
-       [ 0.1389569        ,  0.7467506        , -0.6504264        ,
-         0.038336351401506],
-       [ 0.1389569        ,  0.8319966        , -0.5370966        ,
-         0.035260603350204],
-       [ 0.1389569        ,  0.9092855        , -0.3922893        ,
-         0.06492037838973 ],
-       [ 0.1389569        ,  0.9805009        , -0.138957         ,
-         0.076948977605987],
-       [-0.9805009        ,  0.1389569        , -0.1389569        ,
-         0.076948977605987],
-       [-0.9092855        ,  0.1389569        , -0.3922893        ,
-         0.06492037838973 ],
-       [-0.9092855        ,  0.3922893        , -0.1389569        ,
-         0.06492037838973 ],
-       [-0.8319966        ,  0.1389569        , -0.5370965        ,
-         0.035260603350204],
-       [-0.8319966        ,  0.3922893        , -0.3922892        ,
-         0.05280804944503 ],
-       [-0.8319966        ,  0.5370966        , -0.1389568        ,
-         0.035260603350204],
-       [-0.7467506        ,  0.1389569        , -0.6504264        ,
-         0.038336351401506],
-       [-0.7467506        ,  0.3922893        , -0.5370966        ,
-         0.024620507993437],
-       [-0.7467506        ,  0.5370966        , -0.3922893        ,
-         0.024620507993437],
-       [-0.7467506        ,  0.6504264        , -0.1389568        ,
-         0.038336351401506],
-       [-0.6504264        ,  0.1389569        , -0.7467506        ,
-         0.038336351401506],
-       [-0.6504264        ,  0.3922893        , -0.6504264        ,
-         0.058002800196659],
-       [-0.6504264        ,  0.5370966        , -0.5370966        ,
-         0.009563266080869],
-       [-0.6504264        ,  0.6504264        , -0.3922893        ,
-         0.058002800196659],
-       [-0.6504264        ,  0.7467506        , -0.1389568        ,
-         0.038336351401506],
-       [-0.5370966        ,  0.1389569        , -0.8319966        ,
-         0.035260603350204],
-       [-0.5370966        ,  0.3922893        , -0.7467506        ,
-         0.024620507993437],
-       [-0.5370966        ,  0.5370966        , -0.6504264        ,
-         0.009563266080869],
-       [-0.5370966        ,  0.6504264        , -0.5370966        ,
-         0.009563266080869],
-       [-0.5370966        ,  0.7467506        , -0.3922893        ,
-         0.024620507993437],
-       [-0.5370966        ,  0.8319966        , -0.1389568        ,
-         0.035260603350204],
-       [-0.3922893        ,  0.1389569        , -0.9092855        ,
-         0.06492037838973 ],
-       [-0.3922893        ,  0.3922893        , -0.8319966        ,
-         0.05280804944503 ],
-       [-0.3922893        ,  0.5370966        , -0.7467506        ,
-         0.024620507993437],
-       [-0.3922893        ,  0.6504264        , -0.6504264        ,
-         0.058002800196659],
-       [-0.3922893        ,  0.7467506        , -0.5370966        ,
-         0.024620507993437],
-       [-0.3922893        ,  0.8319966        , -0.3922893        ,
-         0.05280804944503 ],
-       [-0.3922893        ,  0.9092855        , -0.138957         ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.1389569        , -0.9805009        ,
-         0.076948977605987],
-       [-0.1389569        ,  0.3922893        , -0.9092855        ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.5370966        , -0.8319966        ,
-         0.035260603350204],
-       [-0.1389569        ,  0.6504264        , -0.7467506        ,
-         0.038336351401506],
-       [-0.1389569        ,  0.7467506        , -0.6504264        ,
-         0.038336351401506],
-       [-0.1389569        ,  0.8319966        , -0.5370966        ,
-         0.035260603350204],
-       [-0.1389569        ,  0.9092855        , -0.3922893        ,
-         0.06492037838973 ],
-       [-0.1389569        ,  0.9805009        , -0.138957         ,
-         0.076948977605987],
-       [-0.9805009        , -0.1389569        , -0.1389569        ,
-         0.076948977605987],
-       [-0.9092855        , -0.1389569        , -0.3922893        ,
-         0.06492037838973 ],
-       [-0.9092855        , -0.3922893        , -0.1389569        ,
-         0.06492037838973 ],
-       [-0.8319966        , -0.1389569        , -0.5370965        ,
-         0.035260603350204],
-       [-0.8319966        , -0.3922893        , -0.3922892        ,
-         0.05280804944503 ],
-       [-0.8319966        , -0.5370966        , -0.1389568        ,
-         0.035260603350204],
-       [-0.7467506        , -0.1389569        , -0.6504264        ,
-         0.038336351401506],
-       [-0.7467506        , -0.3922893        , -0.5370966        ,
-         0.024620507993437],
-       [-0.7467506        , -0.5370966        , -0.3922893        ,
-         0.024620507993437],
-       [-0.7467506        , -0.6504264        , -0.1389568        ,
-         0.038336351401506],
-       [-0.6504264        , -0.1389569        , -0.7467506        ,
-         0.038336351401506],
-       [-0.6504264        , -0.3922893        , -0.6504264        ,
-         0.058002800196659],
-       [-0.6504264        , -0.5370966        , -0.5370966        ,
-         0.009563266080869],
-       [-0.6504264        , -0.6504264        , -0.3922893        ,
-         0.058002800196659],
-       [-0.6504264        , -0.7467506        , -0.1389568        ,
-         0.038336351401506],
-       [-0.5370966        , -0.1389569        , -0.8319966        ,
-         0.035260603350204],
-       [-0.5370966        , -0.3922893        , -0.7467506        ,
-         0.024620507993437],
-       [-0.5370966        , -0.5370966        , -0.6504264        ,
-         0.009563266080869],
-       [-0.5370966        , -0.6504264        , -0.5370966        ,
-         0.009563266080869],
-       [-0.5370966        , -0.7467506        , -0.3922893        ,
-         0.024620507993437],
-       [-0.5370966        , -0.8319966        , -0.1389568        ,
-         0.035260603350204],
-       [-0.3922893        , -0.1389569        , -0.9092855        ,
-         0.06492037838973 ],
-       [-0.3922893        , -0.3922893        , -0.8319966        ,
-         0.05280804944503 ],
-       [-0.3922893        , -0.5370966        , -0.7467506        ,
-         0.024620507993437],
-       [-0.3922893        , -0.6504264        , -0.6504264        ,
-         0.058002800196659],
-       [-0.3922893        , -0.7467506        , -0.5370966        ,
-         0.024620507993437],
-       [-0.3922893        , -0.8319966        , -0.3922893        ,
-         0.05280804944503 ],
-       [-0.3922893        , -0.9092855        , -0.138957         ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.1389569        , -0.9805009        ,
-         0.076948977605987],
-       [-0.1389569        , -0.3922893        , -0.9092855        ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.5370966        , -0.8319966        ,
-         0.035260603350204],
-       [-0.1389569        , -0.6504264        , -0.7467506        ,
-         0.038336351401506],
-       [-0.1389569        , -0.7467506        , -0.6504264        ,
-         0.038336351401506],
-       [-0.1389569        , -0.8319966        , -0.5370966        ,
-         0.035260603350204],
-       [-0.1389569        , -0.9092855        , -0.3922893        ,
-         0.06492037838973 ],
-       [-0.1389569        , -0.9805009        , -0.138957         ,
-         0.076948977605987],
-       [ 0.9805009        , -0.1389569        , -0.1389569        ,
-         0.076948977605987],
-       [ 0.9092855        , -0.1389569        , -0.3922893        ,
-         0.06492037838973 ],
-       [ 0.9092855        , -0.3922893        , -0.1389569        ,
-         0.06492037838973 ],
-       [ 0.8319966        , -0.1389569        , -0.5370965        ,
-         0.035260603350204],
-       [ 0.8319966        , -0.3922893        , -0.3922892        ,
-         0.05280804944503 ],
-       [ 0.8319966        , -0.5370966        , -0.1389568        ,
-         0.035260603350204],
-       [ 0.7467506        , -0.1389569        , -0.6504264        ,
-         0.038336351401506],
-       [ 0.7467506        , -0.3922893        , -0.5370966        ,
-         0.024620507993437],
-       [ 0.7467506        , -0.5370966        , -0.3922893        ,
-         0.024620507993437],
-       [ 0.7467506        , -0.6504264        , -0.1389568        ,
-         0.038336351401506],
-       [ 0.6504264        , -0.1389569        , -0.7467506        ,
-         0.038336351401506],
-       [ 0.6504264        , -0.3922893        , -0.6504264        ,
-         0.058002800196659],
-       [ 0.6504264        , -0.5370966        , -0.5370966        ,
-         0.009563266080869],
-       [ 0.6504264        , -0.6504264        , -0.3922893        ,
-         0.058002800196659],
-       [ 0.6504264        , -0.7467506        , -0.1389568        ,
-         0.038336351401506],
-       [ 0.5370966        , -0.1389569        , -0.8319966        ,
-         0.035260603350204],
-       [ 0.5370966        , -0.3922893        , -0.7467506        ,
-         0.024620507993437],
-       [ 0.5370966        , -0.5370966        , -0.6504264        ,
-         0.009563266080869],
-       [ 0.5370966        , -0.6504264        , -0.5370966        ,
-         0.009563266080869],
-       [ 0.5370966        , -0.7467506        , -0.3922893        ,
-         0.024620507993437],
-       [ 0.5370966        , -0.8319966        , -0.1389568        ,
-         0.035260603350204],
-       [ 0.3922893        , -0.1389569        , -0.9092855        ,
-         0.06492037838973 ],
-       [ 0.3922893        , -0.3922893        , -0.8319966        ,
-         0.05280804944503 ],
-       [ 0.3922893        , -0.5370966        , -0.7467506        ,
-         0.024620507993437],
-       [ 0.3922893        , -0.6504264        , -0.6504264        ,
-         0.058002800196659],
-       [ 0.3922893        , -0.7467506        , -0.5370966        ,
-         0.024620507993437],
-       [ 0.3922893        , -0.8319966        , -0.3922893        ,
-         0.05280804944503 ],
-       [ 0.3922893        , -0.9092855        , -0.138957         ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.1389569        , -0.9805009        ,
-         0.076948977605987],
-       [ 0.1389569        , -0.3922893        , -0.9092855        ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.5370966        , -0.8319966        ,
-         0.035260603350204],
-       [ 0.1389569        , -0.6504264        , -0.7467506        ,
-         0.038336351401506],
-       [ 0.1389569        , -0.7467506        , -0.6504264        ,
-         0.038336351401506],
-       [ 0.1389569        , -0.8319966        , -0.5370966        ,
-         0.035260603350204],
-       [ 0.1389569        , -0.9092855        , -0.3922893        ,
-         0.06492037838973 ],
-       [ 0.1389569        , -0.9805009        , -0.138957         ,
-         0.076948977605987]]), 18: array([[ 0.9831277        ,  0.1293445        ,  0.1293446        ,
-         0.066389148092885],
-       [ 0.920768         ,  0.1293445        ,  0.3680438        ,
-         0.059081965312738],
-       [ 0.920768         ,  0.3680438        ,  0.1293446        ,
-         0.059081965312738],
-       [ 0.8538662        ,  0.1293445        ,  0.5041651        ,
-         0.010509777649508],
-       [ 0.8538662        ,  0.3680438        ,  0.3680438        ,
-         0.066548659319586],
-       [ 0.8538662        ,  0.5041652        ,  0.1293443        ,
-         0.010509777649508],
-       [ 0.7812562        ,  0.1293445        ,  0.6106625        ,
-         0.061562541759612],
-       [ 0.7812562        ,  0.3680438        ,  0.5041651        ,
-         0.014513573842363],
-       [ 0.7812562        ,  0.5041652        ,  0.3680438        ,
-         0.014513573842363],
-       [ 0.7812562        ,  0.6106626        ,  0.1293442        ,
-         0.061562541759612],
-       [ 0.7011669        ,  0.1293445        ,  0.7011669        ,
-         0.006683734027089],
-       [ 0.7011669        ,  0.3680438        ,  0.6106626        ,
-         0.024606133532727],
-       [ 0.7011669        ,  0.5041652        ,  0.5041652        ,
-         0.021453314371936],
-       [ 0.7011669        ,  0.6106626        ,  0.3680438        ,
-         0.024606133532727],
-       [ 0.7011669        ,  0.7011669        ,  0.1293448        ,
-         0.006683734027089],
-       [ 0.6106626        ,  0.1293445        ,  0.7812561        ,
-         0.061562541759612],
-       [ 0.6106626        ,  0.3680438        ,  0.7011668        ,
-         0.024606133532727],
-       [ 0.6106626        ,  0.5041652        ,  0.6106625        ,
-         0.021975935592906],
-       [ 0.6106626        ,  0.6106626        ,  0.504165         ,
-         0.021975935592906],
-       [ 0.6106626        ,  0.7011669        ,  0.3680438        ,
-         0.024606133532727],
-       [ 0.6106626        ,  0.7812562        ,  0.1293441        ,
-         0.061562541759612],
-       [ 0.5041652        ,  0.1293445        ,  0.8538662        ,
-         0.010509777649508],
-       [ 0.5041652        ,  0.3680438        ,  0.7812562        ,
-         0.014513573842363],
-       [ 0.5041652        ,  0.5041652        ,  0.7011669        ,
-         0.021453314371936],
-       [ 0.5041652        ,  0.6106626        ,  0.6106625        ,
-         0.021975935592906],
-       [ 0.5041652        ,  0.7011669        ,  0.5041652        ,
-         0.021453314371936],
-       [ 0.5041652        ,  0.7812562        ,  0.3680438        ,
-         0.014513573842363],
-       [ 0.5041652        ,  0.8538662        ,  0.1293443        ,
-         0.010509777649508],
-       [ 0.3680438        ,  0.1293445        ,  0.920768         ,
-         0.059081965312738],
-       [ 0.3680438        ,  0.3680438        ,  0.8538662        ,
-         0.066548659319586],
-       [ 0.3680438        ,  0.5041652        ,  0.7812562        ,
-         0.014513573842363],
-       [ 0.3680438        ,  0.6106626        ,  0.7011668        ,
-         0.024606133532727],
-       [ 0.3680438        ,  0.7011669        ,  0.6106626        ,
-         0.024606133532727],
-       [ 0.3680438        ,  0.7812562        ,  0.5041651        ,
-         0.014513573842363],
-       [ 0.3680438        ,  0.8538662        ,  0.3680438        ,
-         0.066548659319586],
-       [ 0.3680438        ,  0.920768         ,  0.1293445        ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.1293445        ,  0.9831277        ,
-         0.066389148092885],
-       [ 0.1293445        ,  0.3680438        ,  0.920768         ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.5041652        ,  0.8538662        ,
-         0.010509777649508],
-       [ 0.1293445        ,  0.6106626        ,  0.7812562        ,
-         0.061562541759612],
-       [ 0.1293445        ,  0.7011669        ,  0.7011669        ,
-         0.006683734027089],
-       [ 0.1293445        ,  0.7812562        ,  0.6106625        ,
-         0.061562541759612],
-       [ 0.1293445        ,  0.8538662        ,  0.5041651        ,
-         0.010509777649508],
-       [ 0.1293445        ,  0.920768         ,  0.3680438        ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.9831277        ,  0.1293445        ,
-         0.066389148092885],
-       [-0.9831277        ,  0.1293445        ,  0.1293446        ,
-         0.066389148092885],
-       [-0.920768         ,  0.1293445        ,  0.3680438        ,
-         0.059081965312738],
-       [-0.920768         ,  0.3680438        ,  0.1293446        ,
-         0.059081965312738],
-       [-0.8538662        ,  0.1293445        ,  0.5041651        ,
-         0.010509777649508],
-       [-0.8538662        ,  0.3680438        ,  0.3680438        ,
-         0.066548659319586],
-       [-0.8538662        ,  0.5041652        ,  0.1293443        ,
-         0.010509777649508],
-       [-0.7812562        ,  0.1293445        ,  0.6106625        ,
-         0.061562541759612],
-       [-0.7812562        ,  0.3680438        ,  0.5041651        ,
-         0.014513573842363],
-       [-0.7812562        ,  0.5041652        ,  0.3680438        ,
-         0.014513573842363],
-       [-0.7812562        ,  0.6106626        ,  0.1293442        ,
-         0.061562541759612],
-       [-0.7011669        ,  0.1293445        ,  0.7011669        ,
-         0.006683734027089],
-       [-0.7011669        ,  0.3680438        ,  0.6106626        ,
-         0.024606133532727],
-       [-0.7011669        ,  0.5041652        ,  0.5041652        ,
-         0.021453314371936],
-       [-0.7011669        ,  0.6106626        ,  0.3680438        ,
-         0.024606133532727],
-       [-0.7011669        ,  0.7011669        ,  0.1293448        ,
-         0.006683734027089],
-       [-0.6106626        ,  0.1293445        ,  0.7812561        ,
-         0.061562541759612],
-       [-0.6106626        ,  0.3680438        ,  0.7011668        ,
-         0.024606133532727],
-       [-0.6106626        ,  0.5041652        ,  0.6106625        ,
-         0.021975935592906],
-       [-0.6106626        ,  0.6106626        ,  0.504165         ,
-         0.021975935592906],
-       [-0.6106626        ,  0.7011669        ,  0.3680438        ,
-         0.024606133532727],
-       [-0.6106626        ,  0.7812562        ,  0.1293441        ,
-         0.061562541759612],
-       [-0.5041652        ,  0.1293445        ,  0.8538662        ,
-         0.010509777649508],
-       [-0.5041652        ,  0.3680438        ,  0.7812562        ,
-         0.014513573842363],
-       [-0.5041652        ,  0.5041652        ,  0.7011669        ,
-         0.021453314371936],
-       [-0.5041652        ,  0.6106626        ,  0.6106625        ,
-         0.021975935592906],
-       [-0.5041652        ,  0.7011669        ,  0.5041652        ,
-         0.021453314371936],
-       [-0.5041652        ,  0.7812562        ,  0.3680438        ,
-         0.014513573842363],
-       [-0.5041652        ,  0.8538662        ,  0.1293443        ,
-         0.010509777649508],
-       [-0.3680438        ,  0.1293445        ,  0.920768         ,
-         0.059081965312738],
-       [-0.3680438        ,  0.3680438        ,  0.8538662        ,
-         0.066548659319586],
-       [-0.3680438        ,  0.5041652        ,  0.7812562        ,
-         0.014513573842363],
-       [-0.3680438        ,  0.6106626        ,  0.7011668        ,
-         0.024606133532727],
-       [-0.3680438        ,  0.7011669        ,  0.6106626        ,
-         0.024606133532727],
-       [-0.3680438        ,  0.7812562        ,  0.5041651        ,
-         0.014513573842363],
-       [-0.3680438        ,  0.8538662        ,  0.3680438        ,
-         0.066548659319586],
-       [-0.3680438        ,  0.920768         ,  0.1293445        ,
-         0.059081965312738],
-       [-0.1293445        ,  0.1293445        ,  0.9831277        ,
-         0.066389148092885],
-       [-0.1293445        ,  0.3680438        ,  0.920768         ,
-         0.059081965312738],
-       [-0.1293445        ,  0.5041652        ,  0.8538662        ,
-         0.010509777649508],
-       [-0.1293445        ,  0.6106626        ,  0.7812562        ,
-         0.061562541759612],
-       [-0.1293445        ,  0.7011669        ,  0.7011669        ,
-         0.006683734027089],
-       [-0.1293445        ,  0.7812562        ,  0.6106625        ,
-         0.061562541759612],
-       [-0.1293445        ,  0.8538662        ,  0.5041651        ,
-         0.010509777649508],
-       [-0.1293445        ,  0.920768         ,  0.3680438        ,
-         0.059081965312738],
-       [-0.1293445        ,  0.9831277        ,  0.1293445        ,
-         0.066389148092885],
-       [-0.9831277        , -0.1293445        ,  0.1293446        ,
-         0.066389148092885],
-       [-0.920768         , -0.1293445        ,  0.3680438        ,
-         0.059081965312738],
-       [-0.920768         , -0.3680438        ,  0.1293446        ,
-         0.059081965312738],
-       [-0.8538662        , -0.1293445        ,  0.5041651        ,
-         0.010509777649508],
-       [-0.8538662        , -0.3680438        ,  0.3680438        ,
-         0.066548659319586],
-       [-0.8538662        , -0.5041652        ,  0.1293443        ,
-         0.010509777649508],
-       [-0.7812562        , -0.1293445        ,  0.6106625        ,
-         0.061562541759612],
-       [-0.7812562        , -0.3680438        ,  0.5041651        ,
-         0.014513573842363],
-       [-0.7812562        , -0.5041652        ,  0.3680438        ,
-         0.014513573842363],
-       [-0.7812562        , -0.6106626        ,  0.1293442        ,
-         0.061562541759612],
-       [-0.7011669        , -0.1293445        ,  0.7011669        ,
-         0.006683734027089],
-       [-0.7011669        , -0.3680438        ,  0.6106626        ,
-         0.024606133532727],
-       [-0.7011669        , -0.5041652        ,  0.5041652        ,
-         0.021453314371936],
-       [-0.7011669        , -0.6106626        ,  0.3680438        ,
-         0.024606133532727],
-       [-0.7011669        , -0.7011669        ,  0.1293448        ,
-         0.006683734027089],
-       [-0.6106626        , -0.1293445        ,  0.7812561        ,
-         0.061562541759612],
-       [-0.6106626        , -0.3680438        ,  0.7011668        ,
-         0.024606133532727],
-       [-0.6106626        , -0.5041652        ,  0.6106625        ,
-         0.021975935592906],
-       [-0.6106626        , -0.6106626        ,  0.504165         ,
-         0.021975935592906],
-       [-0.6106626        , -0.7011669        ,  0.3680438        ,
-         0.024606133532727],
-       [-0.6106626        , -0.7812562        ,  0.1293441        ,
-         0.061562541759612],
-       [-0.5041652        , -0.1293445        ,  0.8538662        ,
-         0.010509777649508],
-       [-0.5041652        , -0.3680438        ,  0.7812562        ,
-         0.014513573842363],
-       [-0.5041652        , -0.5041652        ,  0.7011669        ,
-         0.021453314371936],
-       [-0.5041652        , -0.6106626        ,  0.6106625        ,
-         0.021975935592906],
-       [-0.5041652        , -0.7011669        ,  0.5041652        ,
-         0.021453314371936],
-       [-0.5041652        , -0.7812562        ,  0.3680438        ,
-         0.014513573842363],
-       [-0.5041652        , -0.8538662        ,  0.1293443        ,
-         0.010509777649508],
-       [-0.3680438        , -0.1293445        ,  0.920768         ,
-         0.059081965312738],
-       [-0.3680438        , -0.3680438        ,  0.8538662        ,
-         0.066548659319586],
-       [-0.3680438        , -0.5041652        ,  0.7812562        ,
-         0.014513573842363],
-       [-0.3680438        , -0.6106626        ,  0.7011668        ,
-         0.024606133532727],
-       [-0.3680438        , -0.7011669        ,  0.6106626        ,
-         0.024606133532727],
-       [-0.3680438        , -0.7812562        ,  0.5041651        ,
-         0.014513573842363],
-       [-0.3680438        , -0.8538662        ,  0.3680438        ,
-         0.066548659319586],
-       [-0.3680438        , -0.920768         ,  0.1293445        ,
-         0.059081965312738],
-       [-0.1293445        , -0.1293445        ,  0.9831277        ,
-         0.066389148092885],
-       [-0.1293445        , -0.3680438        ,  0.920768         ,
-         0.059081965312738],
-       [-0.1293445        , -0.5041652        ,  0.8538662        ,
-         0.010509777649508],
-       [-0.1293445        , -0.6106626        ,  0.7812562        ,
-         0.061562541759612],
-       [-0.1293445        , -0.7011669        ,  0.7011669        ,
-         0.006683734027089],
-       [-0.1293445        , -0.7812562        ,  0.6106625        ,
-         0.061562541759612],
-       [-0.1293445        , -0.8538662        ,  0.5041651        ,
-         0.010509777649508],
-       [-0.1293445        , -0.920768         ,  0.3680438        ,
-         0.059081965312738],
-       [-0.1293445        , -0.9831277        ,  0.1293445        ,
-         0.066389148092885],
-       [ 0.9831277        , -0.1293445        ,  0.1293446        ,
-         0.066389148092885],
-       [ 0.920768         , -0.1293445        ,  0.3680438        ,
-         0.059081965312738],
-       [ 0.920768         , -0.3680438        ,  0.1293446        ,
-         0.059081965312738],
-       [ 0.8538662        , -0.1293445        ,  0.5041651        ,
-         0.010509777649508],
-       [ 0.8538662        , -0.3680438        ,  0.3680438        ,
-         0.066548659319586],
-       [ 0.8538662        , -0.5041652        ,  0.1293443        ,
-         0.010509777649508],
-       [ 0.7812562        , -0.1293445        ,  0.6106625        ,
-         0.061562541759612],
-       [ 0.7812562        , -0.3680438        ,  0.5041651        ,
-         0.014513573842363],
-       [ 0.7812562        , -0.5041652        ,  0.3680438        ,
-         0.014513573842363],
-       [ 0.7812562        , -0.6106626        ,  0.1293442        ,
-         0.061562541759612],
-       [ 0.7011669        , -0.1293445        ,  0.7011669        ,
-         0.006683734027089],
-       [ 0.7011669        , -0.3680438        ,  0.6106626        ,
-         0.024606133532727],
-       [ 0.7011669        , -0.5041652        ,  0.5041652        ,
-         0.021453314371936],
-       [ 0.7011669        , -0.6106626        ,  0.3680438        ,
-         0.024606133532727],
-       [ 0.7011669        , -0.7011669        ,  0.1293448        ,
-         0.006683734027089],
-       [ 0.6106626        , -0.1293445        ,  0.7812561        ,
-         0.061562541759612],
-       [ 0.6106626        , -0.3680438        ,  0.7011668        ,
-         0.024606133532727],
-       [ 0.6106626        , -0.5041652        ,  0.6106625        ,
-         0.021975935592906],
-       [ 0.6106626        , -0.6106626        ,  0.504165         ,
-         0.021975935592906],
-       [ 0.6106626        , -0.7011669        ,  0.3680438        ,
-         0.024606133532727],
-       [ 0.6106626        , -0.7812562        ,  0.1293441        ,
-         0.061562541759612],
-       [ 0.5041652        , -0.1293445        ,  0.8538662        ,
-         0.010509777649508],
-       [ 0.5041652        , -0.3680438        ,  0.7812562        ,
-         0.014513573842363],
-       [ 0.5041652        , -0.5041652        ,  0.7011669        ,
-         0.021453314371936],
-       [ 0.5041652        , -0.6106626        ,  0.6106625        ,
-         0.021975935592906],
-       [ 0.5041652        , -0.7011669        ,  0.5041652        ,
-         0.021453314371936],
-       [ 0.5041652        , -0.7812562        ,  0.3680438        ,
-         0.014513573842363],
-       [ 0.5041652        , -0.8538662        ,  0.1293443        ,
-         0.010509777649508],
-       [ 0.3680438        , -0.1293445        ,  0.920768         ,
-         0.059081965312738],
-       [ 0.3680438        , -0.3680438        ,  0.8538662        ,
-         0.066548659319586],
-       [ 0.3680438        , -0.5041652        ,  0.7812562        ,
-         0.014513573842363],
-       [ 0.3680438        , -0.6106626        ,  0.7011668        ,
-         0.024606133532727],
-       [ 0.3680438        , -0.7011669        ,  0.6106626        ,
-         0.024606133532727],
-       [ 0.3680438        , -0.7812562        ,  0.5041651        ,
-         0.014513573842363],
-       [ 0.3680438        , -0.8538662        ,  0.3680438        ,
-         0.066548659319586],
-       [ 0.3680438        , -0.920768         ,  0.1293445        ,
-         0.059081965312738],
-       [ 0.1293445        , -0.1293445        ,  0.9831277        ,
-         0.066389148092885],
-       [ 0.1293445        , -0.3680438        ,  0.920768         ,
-         0.059081965312738],
-       [ 0.1293445        , -0.5041652        ,  0.8538662        ,
-         0.010509777649508],
-       [ 0.1293445        , -0.6106626        ,  0.7812562        ,
-         0.061562541759612],
-       [ 0.1293445        , -0.7011669        ,  0.7011669        ,
-         0.006683734027089],
-       [ 0.1293445        , -0.7812562        ,  0.6106625        ,
-         0.061562541759612],
-       [ 0.1293445        , -0.8538662        ,  0.5041651        ,
-         0.010509777649508],
-       [ 0.1293445        , -0.920768         ,  0.3680438        ,
-         0.059081965312738],
-       [ 0.1293445        , -0.9831277        ,  0.1293445        ,
-         0.066389148092885],
-       [ 0.9831277        ,  0.1293445        , -0.1293446        ,
-         0.066389148092885],
-       [ 0.920768         ,  0.1293445        , -0.3680438        ,
-         0.059081965312738],
-       [ 0.920768         ,  0.3680438        , -0.1293446        ,
-         0.059081965312738],
-       [ 0.8538662        ,  0.1293445        , -0.5041651        ,
-         0.010509777649508],
-       [ 0.8538662        ,  0.3680438        , -0.3680438        ,
-         0.066548659319586],
-       [ 0.8538662        ,  0.5041652        , -0.1293443        ,
-         0.010509777649508],
-       [ 0.7812562        ,  0.1293445        , -0.6106625        ,
-         0.061562541759612],
-       [ 0.7812562        ,  0.3680438        , -0.5041651        ,
-         0.014513573842363],
-       [ 0.7812562        ,  0.5041652        , -0.3680438        ,
-         0.014513573842363],
-       [ 0.7812562        ,  0.6106626        , -0.1293442        ,
-         0.061562541759612],
-       [ 0.7011669        ,  0.1293445        , -0.7011669        ,
-         0.006683734027089],
-       [ 0.7011669        ,  0.3680438        , -0.6106626        ,
-         0.024606133532727],
-       [ 0.7011669        ,  0.5041652        , -0.5041652        ,
-         0.021453314371936],
-       [ 0.7011669        ,  0.6106626        , -0.3680438        ,
-         0.024606133532727],
-       [ 0.7011669        ,  0.7011669        , -0.1293448        ,
-         0.006683734027089],
-       [ 0.6106626        ,  0.1293445        , -0.7812561        ,
-         0.061562541759612],
-       [ 0.6106626        ,  0.3680438        , -0.7011668        ,
-         0.024606133532727],
-       [ 0.6106626        ,  0.5041652        , -0.6106625        ,
-         0.021975935592906],
-       [ 0.6106626        ,  0.6106626        , -0.504165         ,
-         0.021975935592906],
-       [ 0.6106626        ,  0.7011669        , -0.3680438        ,
-         0.024606133532727],
-       [ 0.6106626        ,  0.7812562        , -0.1293441        ,
-         0.061562541759612],
-       [ 0.5041652        ,  0.1293445        , -0.8538662        ,
-         0.010509777649508],
-       [ 0.5041652        ,  0.3680438        , -0.7812562        ,
-         0.014513573842363],
-       [ 0.5041652        ,  0.5041652        , -0.7011669        ,
-         0.021453314371936],
-       [ 0.5041652        ,  0.6106626        , -0.6106625        ,
-         0.021975935592906],
-       [ 0.5041652        ,  0.7011669        , -0.5041652        ,
-         0.021453314371936],
-       [ 0.5041652        ,  0.7812562        , -0.3680438        ,
-         0.014513573842363],
-       [ 0.5041652        ,  0.8538662        , -0.1293443        ,
-         0.010509777649508],
-       [ 0.3680438        ,  0.1293445        , -0.920768         ,
-         0.059081965312738],
-       [ 0.3680438        ,  0.3680438        , -0.8538662        ,
-         0.066548659319586],
-       [ 0.3680438        ,  0.5041652        , -0.7812562        ,
-         0.014513573842363],
-       [ 0.3680438        ,  0.6106626        , -0.7011668        ,
-         0.024606133532727],
-       [ 0.3680438        ,  0.7011669        , -0.6106626        ,
-         0.024606133532727],
-       [ 0.3680438        ,  0.7812562        , -0.5041651        ,
-         0.014513573842363],
-       [ 0.3680438        ,  0.8538662        , -0.3680438        ,
-         0.066548659319586],
-       [ 0.3680438        ,  0.920768         , -0.1293445        ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.1293445        , -0.9831277        ,
-         0.066389148092885],
-       [ 0.1293445        ,  0.3680438        , -0.920768         ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.5041652        , -0.8538662        ,
-         0.010509777649508],
-       [ 0.1293445        ,  0.6106626        , -0.7812562        ,
-         0.061562541759612],
-       [ 0.1293445        ,  0.7011669        , -0.7011669        ,
-         0.006683734027089],
-       [ 0.1293445        ,  0.7812562        , -0.6106625        ,
-         0.061562541759612],
-       [ 0.1293445        ,  0.8538662        , -0.5041651        ,
-         0.010509777649508],
-       [ 0.1293445        ,  0.920768         , -0.3680438        ,
-         0.059081965312738],
-       [ 0.1293445        ,  0.9831277        , -0.1293445        ,
-         0.066389148092885],
-       [-0.9831277        ,  0.1293445        , -0.1293446        ,
-         0.066389148092885],
-       [-0.920768         ,  0.1293445        , -0.3680438        ,
-         0.059081965312738],
-       [-0.920768         ,  0.3680438        , -0.1293446        ,
-         0.059081965312738],
-       [-0.8538662        ,  0.1293445        , -0.5041651        ,
-         0.010509777649508],
-       [-0.8538662        ,  0.3680438        , -0.3680438        ,
-         0.066548659319586],
-       [-0.8538662        ,  0.5041652        , -0.1293443        ,
-         0.010509777649508],
-       [-0.7812562        ,  0.1293445        , -0.6106625        ,
-         0.061562541759612],
-       [-0.7812562        ,  0.3680438        , -0.5041651        ,
-         0.014513573842363],
-       [-0.7812562        ,  0.5041652        , -0.3680438        ,
-         0.014513573842363],
-       [-0.7812562        ,  0.6106626        , -0.1293442        ,
-         0.061562541759612],
-       [-0.7011669        ,  0.1293445        , -0.7011669        ,
-         0.006683734027089],
-       [-0.7011669        ,  0.3680438        , -0.6106626        ,
-         0.024606133532727],
-       [-0.7011669        ,  0.5041652        , -0.5041652        ,
-         0.021453314371936],
-       [-0.7011669        ,  0.6106626        , -0.3680438        ,
-         0.024606133532727],
-       [-0.7011669        ,  0.7011669        , -0.1293448        ,
-         0.006683734027089],
-       [-0.6106626        ,  0.1293445        , -0.7812561        ,
-         0.061562541759612],
-       [-0.6106626        ,  0.3680438        , -0.7011668        ,
-         0.024606133532727],
-       [-0.6106626        ,  0.5041652        , -0.6106625        ,
-         0.021975935592906],
-       [-0.6106626        ,  0.6106626        , -0.504165         ,
-         0.021975935592906],
-       [-0.6106626        ,  0.7011669        , -0.3680438        ,
-         0.024606133532727],
-       [-0.6106626        ,  0.7812562        , -0.1293441        ,
-         0.061562541759612],
-       [-0.5041652        ,  0.1293445        , -0.8538662        ,
-         0.010509777649508],
-       [-0.5041652        ,  0.3680438        , -0.7812562        ,
-         0.014513573842363],
-       [-0.5041652        ,  0.5041652        , -0.7011669        ,
-         0.021453314371936],
-       [-0.5041652        ,  0.6106626        , -0.6106625        ,
-         0.021975935592906],
-       [-0.5041652        ,  0.7011669        , -0.5041652        ,
-         0.021453314371936],
-       [-0.5041652        ,  0.7812562        , -0.3680438        ,
-         0.014513573842363],
-       [-0.5041652        ,  0.8538662        , -0.1293443        ,
-         0.010509777649508],
-       [-0.3680438        ,  0.1293445        , -0.920768         ,
-         0.059081965312738],
-       [-0.3680438        ,  0.3680438        , -0.8538662        ,
-         0.066548659319586],
-       [-0.3680438        ,  0.5041652        , -0.7812562        ,
-         0.014513573842363],
-       [-0.3680438        ,  0.6106626        , -0.7011668        ,
-         0.024606133532727],
-       [-0.3680438        ,  0.7011669        , -0.6106626        ,
-         0.024606133532727],
-       [-0.3680438        ,  0.7812562        , -0.5041651        ,
-         0.014513573842363],
-       [-0.3680438        ,  0.8538662        , -0.3680438        ,
-         0.066548659319586],
-       [-0.3680438        ,  0.920768         , -0.1293445        ,
-         0.059081965312738],
-       [-0.1293445        ,  0.1293445        , -0.9831277        ,
-         0.066389148092885],
-       [-0.1293445        ,  0.3680438        , -0.920768         ,
-         0.059081965312738],
-       [-0.1293445        ,  0.5041652        , -0.8538662        ,
-         0.010509777649508],
-       [-0.1293445        ,  0.6106626        , -0.7812562        ,
-         0.061562541759612],
-       [-0.1293445        ,  0.7011669        , -0.7011669        ,
-         0.006683734027089],
-       [-0.1293445        ,  0.7812562        , -0.6106625        ,
-         0.061562541759612],
-       [-0.1293445        ,  0.8538662        , -0.5041651        ,
-         0.010509777649508],
-       [-0.1293445        ,  0.920768         , -0.3680438        ,
-         0.059081965312738],
-       [-0.1293445        ,  0.9831277        , -0.1293445        ,
-         0.066389148092885],
-       [-0.9831277        , -0.1293445        , -0.1293446        ,
-         0.066389148092885],
-       [-0.920768         , -0.1293445        , -0.3680438        ,
-         0.059081965312738],
-       [-0.920768         , -0.3680438        , -0.1293446        ,
-         0.059081965312738],
-       [-0.8538662        , -0.1293445        , -0.5041651        ,
-         0.010509777649508],
-       [-0.8538662        , -0.3680438        , -0.3680438        ,
-         0.066548659319586],
-       [-0.8538662        , -0.5041652        , -0.1293443        ,
-         0.010509777649508],
-       [-0.7812562        , -0.1293445        , -0.6106625        ,
-         0.061562541759612],
-       [-0.7812562        , -0.3680438        , -0.5041651        ,
-         0.014513573842363],
-       [-0.7812562        , -0.5041652        , -0.3680438        ,
-         0.014513573842363],
-       [-0.7812562        , -0.6106626        , -0.1293442        ,
-         0.061562541759612],
-       [-0.7011669        , -0.1293445        , -0.7011669        ,
-         0.006683734027089],
-       [-0.7011669        , -0.3680438        , -0.6106626        ,
-         0.024606133532727],
-       [-0.7011669        , -0.5041652        , -0.5041652        ,
-         0.021453314371936],
-       [-0.7011669        , -0.6106626        , -0.3680438        ,
-         0.024606133532727],
-       [-0.7011669        , -0.7011669        , -0.1293448        ,
-         0.006683734027089],
-       [-0.6106626        , -0.1293445        , -0.7812561        ,
-         0.061562541759612],
-       [-0.6106626        , -0.3680438        , -0.7011668        ,
-         0.024606133532727],
-       [-0.6106626        , -0.5041652        , -0.6106625        ,
-         0.021975935592906],
-       [-0.6106626        , -0.6106626        , -0.504165         ,
-         0.021975935592906],
-       [-0.6106626        , -0.7011669        , -0.3680438        ,
-         0.024606133532727],
-       [-0.6106626        , -0.7812562        , -0.1293441        ,
-         0.061562541759612],
-       [-0.5041652        , -0.1293445        , -0.8538662        ,
-         0.010509777649508],
-       [-0.5041652        , -0.3680438        , -0.7812562        ,
-         0.014513573842363],
-       [-0.5041652        , -0.5041652        , -0.7011669        ,
-         0.021453314371936],
-       [-0.5041652        , -0.6106626        , -0.6106625        ,
-         0.021975935592906],
-       [-0.5041652        , -0.7011669        , -0.5041652        ,
-         0.021453314371936],
-       [-0.5041652        , -0.7812562        , -0.3680438        ,
-         0.014513573842363],
-       [-0.5041652        , -0.8538662        , -0.1293443        ,
-         0.010509777649508],
-       [-0.3680438        , -0.1293445        , -0.920768         ,
-         0.059081965312738],
-       [-0.3680438        , -0.3680438        , -0.8538662        ,
-         0.066548659319586],
-       [-0.3680438        , -0.5041652        , -0.7812562        ,
-         0.014513573842363],
-       [-0.3680438        , -0.6106626        , -0.7011668        ,
-         0.024606133532727],
-       [-0.3680438        , -0.7011669        , -0.6106626        ,
-         0.024606133532727],
-       [-0.3680438        , -0.7812562        , -0.5041651        ,
-         0.014513573842363],
-       [-0.3680438        , -0.8538662        , -0.3680438        ,
-         0.066548659319586],
-       [-0.3680438        , -0.920768         , -0.1293445        ,
-         0.059081965312738],
-       [-0.1293445        , -0.1293445        , -0.9831277        ,
-         0.066389148092885],
-       [-0.1293445        , -0.3680438        , -0.920768         ,
-         0.059081965312738],
-       [-0.1293445        , -0.5041652        , -0.8538662        ,
-         0.010509777649508],
-       [-0.1293445        , -0.6106626        , -0.7812562        ,
-         0.061562541759612],
-       [-0.1293445        , -0.7011669        , -0.7011669        ,
-         0.006683734027089],
-       [-0.1293445        , -0.7812562        , -0.6106625        ,
-         0.061562541759612],
-       [-0.1293445        , -0.8538662        , -0.5041651        ,
-         0.010509777649508],
-       [-0.1293445        , -0.920768         , -0.3680438        ,
-         0.059081965312738],
-       [-0.1293445        , -0.9831277        , -0.1293445        ,
-         0.066389148092885],
-       [ 0.9831277        , -0.1293445        , -0.1293446        ,
-         0.066389148092885],
-       [ 0.920768         , -0.1293445        , -0.3680438        ,
-         0.059081965312738],
-       [ 0.920768         , -0.3680438        , -0.1293446        ,
-         0.059081965312738],
-       [ 0.8538662        , -0.1293445        , -0.5041651        ,
-         0.010509777649508],
-       [ 0.8538662        , -0.3680438        , -0.3680438        ,
-         0.066548659319586],
-       [ 0.8538662        , -0.5041652        , -0.1293443        ,
-         0.010509777649508],
-       [ 0.7812562        , -0.1293445        , -0.6106625        ,
-         0.061562541759612],
-       [ 0.7812562        , -0.3680438        , -0.5041651        ,
-         0.014513573842363],
-       [ 0.7812562        , -0.5041652        , -0.3680438        ,
-         0.014513573842363],
-       [ 0.7812562        , -0.6106626        , -0.1293442        ,
-         0.061562541759612],
-       [ 0.7011669        , -0.1293445        , -0.7011669        ,
-         0.006683734027089],
-       [ 0.7011669        , -0.3680438        , -0.6106626        ,
-         0.024606133532727],
-       [ 0.7011669        , -0.5041652        , -0.5041652        ,
-         0.021453314371936],
-       [ 0.7011669        , -0.6106626        , -0.3680438        ,
-         0.024606133532727],
-       [ 0.7011669        , -0.7011669        , -0.1293448        ,
-         0.006683734027089],
-       [ 0.6106626        , -0.1293445        , -0.7812561        ,
-         0.061562541759612],
-       [ 0.6106626        , -0.3680438        , -0.7011668        ,
-         0.024606133532727],
-       [ 0.6106626        , -0.5041652        , -0.6106625        ,
-         0.021975935592906],
-       [ 0.6106626        , -0.6106626        , -0.504165         ,
-         0.021975935592906],
-       [ 0.6106626        , -0.7011669        , -0.3680438        ,
-         0.024606133532727],
-       [ 0.6106626        , -0.7812562        , -0.1293441        ,
-         0.061562541759612],
-       [ 0.5041652        , -0.1293445        , -0.8538662        ,
-         0.010509777649508],
-       [ 0.5041652        , -0.3680438        , -0.7812562        ,
-         0.014513573842363],
-       [ 0.5041652        , -0.5041652        , -0.7011669        ,
-         0.021453314371936],
-       [ 0.5041652        , -0.6106626        , -0.6106625        ,
-         0.021975935592906],
-       [ 0.5041652        , -0.7011669        , -0.5041652        ,
-         0.021453314371936],
-       [ 0.5041652        , -0.7812562        , -0.3680438        ,
-         0.014513573842363],
-       [ 0.5041652        , -0.8538662        , -0.1293443        ,
-         0.010509777649508],
-       [ 0.3680438        , -0.1293445        , -0.920768         ,
-         0.059081965312738],
-       [ 0.3680438        , -0.3680438        , -0.8538662        ,
-         0.066548659319586],
-       [ 0.3680438        , -0.5041652        , -0.7812562        ,
-         0.014513573842363],
-       [ 0.3680438        , -0.6106626        , -0.7011668        ,
-         0.024606133532727],
-       [ 0.3680438        , -0.7011669        , -0.6106626        ,
-         0.024606133532727],
-       [ 0.3680438        , -0.7812562        , -0.5041651        ,
-         0.014513573842363],
-       [ 0.3680438        , -0.8538662        , -0.3680438        ,
-         0.066548659319586],
-       [ 0.3680438        , -0.920768         , -0.1293445        ,
-         0.059081965312738],
-       [ 0.1293445        , -0.1293445        , -0.9831277        ,
-         0.066389148092885],
-       [ 0.1293445        , -0.3680438        , -0.920768         ,
-         0.059081965312738],
-       [ 0.1293445        , -0.5041652        , -0.8538662        ,
-         0.010509777649508],
-       [ 0.1293445        , -0.6106626        , -0.7812562        ,
-         0.061562541759612],
-       [ 0.1293445        , -0.7011669        , -0.7011669        ,
-         0.006683734027089],
-       [ 0.1293445        , -0.7812562        , -0.6106625        ,
-         0.061562541759612],
-       [ 0.1293445        , -0.8538662        , -0.5041651        ,
-         0.010509777649508],
-       [ 0.1293445        , -0.920768         , -0.3680438        ,
-         0.059081965312738],
-       [ 0.1293445        , -0.9831277        , -0.1293445        ,
-         0.066389148092885]]), 20: array([[ 0.9853475        ,  0.1206033        ,  0.1206031        ,
-         0.060388158260582],
-       [ 0.9298639        ,  0.1206033        ,  0.3475744        ,
-         0.054292697596663],
-       [ 0.9298639        ,  0.3475743        ,  0.1206035        ,
-         0.054292697596663],
-       [ 0.8708526        ,  0.1206033        ,  0.4765193        ,
-         0.022782777847022],
-       [ 0.8708526        ,  0.3475743        ,  0.3475743        ,
-         0.042764226377752],
-       [ 0.8708526        ,  0.4765193        ,  0.1206034        ,
-         0.022782777847022],
-       [ 0.8075404        ,  0.1206033        ,  0.5773502        ,
-         0.047443217021681],
-       [ 0.8075404        ,  0.3475743        ,  0.4765192        ,
-         0.003731398725247],
-       [ 0.8075404        ,  0.4765193        ,  0.3475742        ,
-         0.003731398725247],
-       [ 0.8075404        ,  0.5773503        ,  0.1206032        ,
-         0.047443217021681],
-       [ 0.7388226        ,  0.1206033        ,  0.6630204        ,
-         0.010165427546721],
-       [ 0.7388226        ,  0.3475743        ,  0.5773503        ,
-         0.059373695282411],
-       [ 0.7388226        ,  0.4765193        ,  0.4765193        ,
-         0.014665320498354],
-       [ 0.7388226        ,  0.5773503        ,  0.3475743        ,
-         0.059373695282411],
-       [ 0.7388226        ,  0.6630204        ,  0.1206031        ,
-         0.010165427546721],
-       [ 0.6630204        ,  0.1206033        ,  0.7388226        ,
-         0.010165427546721],
-       [ 0.6630204        ,  0.3475743        ,  0.6630204        ,
-         0.014665320498354],
-       [ 0.6630204        ,  0.4765193        ,  0.5773503        ,
-         0.004854517836557],
-       [ 0.6630204        ,  0.5773503        ,  0.4765193        ,
-         0.004854517836557],
-       [ 0.6630204        ,  0.6630204        ,  0.3475742        ,
-         0.014665320498354],
-       [ 0.6630204        ,  0.7388226        ,  0.1206032        ,
-         0.010165427546721],
-       [ 0.5773503        ,  0.1206033        ,  0.8075404        ,
-         0.047443217021681],
-       [ 0.5773503        ,  0.3475743        ,  0.7388226        ,
-         0.059373695282411],
-       [ 0.5773503        ,  0.4765193        ,  0.6630204        ,
-         0.004854517836557],
-       [ 0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.01787301701253 ],
-       [ 0.5773503        ,  0.6630204        ,  0.4765193        ,
-         0.004854517836557],
-       [ 0.5773503        ,  0.7388226        ,  0.3475743        ,
-         0.059373695282411],
-       [ 0.5773503        ,  0.8075404        ,  0.1206032        ,
-         0.047443217021681],
-       [ 0.4765193        ,  0.1206033        ,  0.8708526        ,
-         0.022782777847022],
-       [ 0.4765193        ,  0.3475743        ,  0.8075404        ,
-         0.003731398725247],
-       [ 0.4765193        ,  0.4765193        ,  0.7388226        ,
-         0.014665320498354],
-       [ 0.4765193        ,  0.5773503        ,  0.6630204        ,
-         0.004854517836557],
-       [ 0.4765193        ,  0.6630204        ,  0.5773503        ,
-         0.004854517836557],
-       [ 0.4765193        ,  0.7388226        ,  0.4765193        ,
-         0.014665320498354],
-       [ 0.4765193        ,  0.8075404        ,  0.3475743        ,
-         0.003731398725247],
-       [ 0.4765193        ,  0.8708526        ,  0.1206035        ,
-         0.022782777847022],
-       [ 0.3475743        ,  0.1206033        ,  0.9298639        ,
-         0.054292697596663],
-       [ 0.3475743        ,  0.3475743        ,  0.8708526        ,
-         0.042764226377752],
-       [ 0.3475743        ,  0.4765193        ,  0.8075404        ,
-         0.003731398725247],
-       [ 0.3475743        ,  0.5773503        ,  0.7388226        ,
-         0.059373695282411],
-       [ 0.3475743        ,  0.6630204        ,  0.6630204        ,
-         0.014665320498354],
-       [ 0.3475743        ,  0.7388226        ,  0.5773503        ,
-         0.059373695282411],
-       [ 0.3475743        ,  0.8075404        ,  0.4765192        ,
-         0.003731398725247],
-       [ 0.3475743        ,  0.8708526        ,  0.3475743        ,
-         0.042764226377752],
-       [ 0.3475743        ,  0.9298639        ,  0.1206035        ,
-         0.054292697596663],
-       [ 0.1206033        ,  0.1206033        ,  0.9853475        ,
-         0.060388158260582],
-       [ 0.1206033        ,  0.3475743        ,  0.9298639        ,
-         0.054292697596663],
-       [ 0.1206033        ,  0.4765193        ,  0.8708526        ,
-         0.022782777847022],
-       [ 0.1206033        ,  0.5773503        ,  0.8075404        ,
-         0.047443217021681],
-       [ 0.1206033        ,  0.6630204        ,  0.7388225        ,
-         0.010165427546721],
-       [ 0.1206033        ,  0.7388226        ,  0.6630204        ,
-         0.010165427546721],
-       [ 0.1206033        ,  0.8075404        ,  0.5773503        ,
-         0.047443217021681],
-       [ 0.1206033        ,  0.8708526        ,  0.4765193        ,
-         0.022782777847022],
-       [ 0.1206033        ,  0.9298639        ,  0.3475744        ,
-         0.054292697596663],
-       [-0.9853475        ,  0.1206033        ,  0.1206031        ,
-         0.060388158260582],
-       [-0.9298639        ,  0.1206033        ,  0.3475744        ,
-         0.054292697596663],
-       [-0.9298639        ,  0.3475743        ,  0.1206035        ,
-         0.054292697596663],
-       [-0.8708526        ,  0.1206033        ,  0.4765193        ,
-         0.022782777847022],
-       [-0.8708526        ,  0.3475743        ,  0.3475743        ,
-         0.042764226377752],
-       [-0.8708526        ,  0.4765193        ,  0.1206034        ,
-         0.022782777847022],
-       [-0.8075404        ,  0.1206033        ,  0.5773502        ,
-         0.047443217021681],
-       [-0.8075404        ,  0.3475743        ,  0.4765192        ,
-         0.003731398725247],
-       [-0.8075404        ,  0.4765193        ,  0.3475742        ,
-         0.003731398725247],
-       [-0.8075404        ,  0.5773503        ,  0.1206032        ,
-         0.047443217021681],
-       [-0.7388226        ,  0.1206033        ,  0.6630204        ,
-         0.010165427546721],
-       [-0.7388226        ,  0.3475743        ,  0.5773503        ,
-         0.059373695282411],
-       [-0.7388226        ,  0.4765193        ,  0.4765193        ,
-         0.014665320498354],
-       [-0.7388226        ,  0.5773503        ,  0.3475743        ,
-         0.059373695282411],
-       [-0.7388226        ,  0.6630204        ,  0.1206031        ,
-         0.010165427546721],
-       [-0.6630204        ,  0.1206033        ,  0.7388226        ,
-         0.010165427546721],
-       [-0.6630204        ,  0.3475743        ,  0.6630204        ,
-         0.014665320498354],
-       [-0.6630204        ,  0.4765193        ,  0.5773503        ,
-         0.004854517836557],
-       [-0.6630204        ,  0.5773503        ,  0.4765193        ,
-         0.004854517836557],
-       [-0.6630204        ,  0.6630204        ,  0.3475742        ,
-         0.014665320498354],
-       [-0.6630204        ,  0.7388226        ,  0.1206032        ,
-         0.010165427546721],
-       [-0.5773503        ,  0.1206033        ,  0.8075404        ,
-         0.047443217021681],
-       [-0.5773503        ,  0.3475743        ,  0.7388226        ,
-         0.059373695282411],
-       [-0.5773503        ,  0.4765193        ,  0.6630204        ,
-         0.004854517836557],
-       [-0.5773503        ,  0.5773503        ,  0.5773503        ,
-         0.01787301701253 ],
-       [-0.5773503        ,  0.6630204        ,  0.4765193        ,
-         0.004854517836557],
-       [-0.5773503        ,  0.7388226        ,  0.3475743        ,
-         0.059373695282411],
-       [-0.5773503        ,  0.8075404        ,  0.1206032        ,
-         0.047443217021681],
-       [-0.4765193        ,  0.1206033        ,  0.8708526        ,
-         0.022782777847022],
-       [-0.4765193        ,  0.3475743        ,  0.8075404        ,
-         0.003731398725247],
-       [-0.4765193        ,  0.4765193        ,  0.7388226        ,
-         0.014665320498354],
-       [-0.4765193        ,  0.5773503        ,  0.6630204        ,
-         0.004854517836557],
-       [-0.4765193        ,  0.6630204        ,  0.5773503        ,
-         0.004854517836557],
-       [-0.4765193        ,  0.7388226        ,  0.4765193        ,
-         0.014665320498354],
-       [-0.4765193        ,  0.8075404        ,  0.3475743        ,
-         0.003731398725247],
-       [-0.4765193        ,  0.8708526        ,  0.1206035        ,
-         0.022782777847022],
-       [-0.3475743        ,  0.1206033        ,  0.9298639        ,
-         0.054292697596663],
-       [-0.3475743        ,  0.3475743        ,  0.8708526        ,
-         0.042764226377752],
-       [-0.3475743        ,  0.4765193        ,  0.8075404        ,
-         0.003731398725247],
-       [-0.3475743        ,  0.5773503        ,  0.7388226        ,
-         0.059373695282411],
-       [-0.3475743        ,  0.6630204        ,  0.6630204        ,
-         0.014665320498354],
-       [-0.3475743        ,  0.7388226        ,  0.5773503        ,
-         0.059373695282411],
-       [-0.3475743        ,  0.8075404        ,  0.4765192        ,
-         0.003731398725247],
-       [-0.3475743        ,  0.8708526        ,  0.3475743        ,
-         0.042764226377752],
-       [-0.3475743        ,  0.9298639        ,  0.1206035        ,
-         0.054292697596663],
-       [-0.1206033        ,  0.1206033        ,  0.9853475        ,
-         0.060388158260582],
-       [-0.1206033        ,  0.3475743        ,  0.9298639        ,
-         0.054292697596663],
-       [-0.1206033        ,  0.4765193        ,  0.8708526        ,
-         0.022782777847022],
-       [-0.1206033        ,  0.5773503        ,  0.8075404        ,
-         0.047443217021681],
-       [-0.1206033        ,  0.6630204        ,  0.7388225        ,
-         0.010165427546721],
-       [-0.1206033        ,  0.7388226        ,  0.6630204        ,
-         0.010165427546721],
-       [-0.1206033        ,  0.8075404        ,  0.5773503        ,
-         0.047443217021681],
-       [-0.1206033        ,  0.8708526        ,  0.4765193        ,
-         0.022782777847022],
-       [-0.1206033        ,  0.9298639        ,  0.3475744        ,
-         0.054292697596663],
-       [-0.9853475        , -0.1206033        ,  0.1206031        ,
-         0.060388158260582],
-       [-0.9298639        , -0.1206033        ,  0.3475744        ,
-         0.054292697596663],
-       [-0.9298639        , -0.3475743        ,  0.1206035        ,
-         0.054292697596663],
-       [-0.8708526        , -0.1206033        ,  0.4765193        ,
-         0.022782777847022],
-       [-0.8708526        , -0.3475743        ,  0.3475743        ,
-         0.042764226377752],
-       [-0.8708526        , -0.4765193        ,  0.1206034        ,
-         0.022782777847022],
-       [-0.8075404        , -0.1206033        ,  0.5773502        ,
-         0.047443217021681],
-       [-0.8075404        , -0.3475743        ,  0.4765192        ,
-         0.003731398725247],
-       [-0.8075404        , -0.4765193        ,  0.3475742        ,
-         0.003731398725247],
-       [-0.8075404        , -0.5773503        ,  0.1206032        ,
-         0.047443217021681],
-       [-0.7388226        , -0.1206033        ,  0.6630204        ,
-         0.010165427546721],
-       [-0.7388226        , -0.3475743        ,  0.5773503        ,
-         0.059373695282411],
-       [-0.7388226        , -0.4765193        ,  0.4765193        ,
-         0.014665320498354],
-       [-0.7388226        , -0.5773503        ,  0.3475743        ,
-         0.059373695282411],
-       [-0.7388226        , -0.6630204        ,  0.1206031        ,
-         0.010165427546721],
-       [-0.6630204        , -0.1206033        ,  0.7388226        ,
-         0.010165427546721],
-       [-0.6630204        , -0.3475743        ,  0.6630204        ,
-         0.014665320498354],
-       [-0.6630204        , -0.4765193        ,  0.5773503        ,
-         0.004854517836557],
-       [-0.6630204        , -0.5773503        ,  0.4765193        ,
-         0.004854517836557],
-       [-0.6630204        , -0.6630204        ,  0.3475742        ,
-         0.014665320498354],
-       [-0.6630204        , -0.7388226        ,  0.1206032        ,
-         0.010165427546721],
-       [-0.5773503        , -0.1206033        ,  0.8075404        ,
-         0.047443217021681],
-       [-0.5773503        , -0.3475743        ,  0.7388226        ,
-         0.059373695282411],
-       [-0.5773503        , -0.4765193        ,  0.6630204        ,
-         0.004854517836557],
-       [-0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.01787301701253 ],
-       [-0.5773503        , -0.6630204        ,  0.4765193        ,
-         0.004854517836557],
-       [-0.5773503        , -0.7388226        ,  0.3475743        ,
-         0.059373695282411],
-       [-0.5773503        , -0.8075404        ,  0.1206032        ,
-         0.047443217021681],
-       [-0.4765193        , -0.1206033        ,  0.8708526        ,
-         0.022782777847022],
-       [-0.4765193        , -0.3475743        ,  0.8075404        ,
-         0.003731398725247],
-       [-0.4765193        , -0.4765193        ,  0.7388226        ,
-         0.014665320498354],
-       [-0.4765193        , -0.5773503        ,  0.6630204        ,
-         0.004854517836557],
-       [-0.4765193        , -0.6630204        ,  0.5773503        ,
-         0.004854517836557],
-       [-0.4765193        , -0.7388226        ,  0.4765193        ,
-         0.014665320498354],
-       [-0.4765193        , -0.8075404        ,  0.3475743        ,
-         0.003731398725247],
-       [-0.4765193        , -0.8708526        ,  0.1206035        ,
-         0.022782777847022],
-       [-0.3475743        , -0.1206033        ,  0.9298639        ,
-         0.054292697596663],
-       [-0.3475743        , -0.3475743        ,  0.8708526        ,
-         0.042764226377752],
-       [-0.3475743        , -0.4765193        ,  0.8075404        ,
-         0.003731398725247],
-       [-0.3475743        , -0.5773503        ,  0.7388226        ,
-         0.059373695282411],
-       [-0.3475743        , -0.6630204        ,  0.6630204        ,
-         0.014665320498354],
-       [-0.3475743        , -0.7388226        ,  0.5773503        ,
-         0.059373695282411],
-       [-0.3475743        , -0.8075404        ,  0.4765192        ,
-         0.003731398725247],
-       [-0.3475743        , -0.8708526        ,  0.3475743        ,
-         0.042764226377752],
-       [-0.3475743        , -0.9298639        ,  0.1206035        ,
-         0.054292697596663],
-       [-0.1206033        , -0.1206033        ,  0.9853475        ,
-         0.060388158260582],
-       [-0.1206033        , -0.3475743        ,  0.9298639        ,
-         0.054292697596663],
-       [-0.1206033        , -0.4765193        ,  0.8708526        ,
-         0.022782777847022],
-       [-0.1206033        , -0.5773503        ,  0.8075404        ,
-         0.047443217021681],
-       [-0.1206033        , -0.6630204        ,  0.7388225        ,
-         0.010165427546721],
-       [-0.1206033        , -0.7388226        ,  0.6630204        ,
-         0.010165427546721],
-       [-0.1206033        , -0.8075404        ,  0.5773503        ,
-         0.047443217021681],
-       [-0.1206033        , -0.8708526        ,  0.4765193        ,
-         0.022782777847022],
-       [-0.1206033        , -0.9298639        ,  0.3475744        ,
-         0.054292697596663],
-       [ 0.9853475        , -0.1206033        ,  0.1206031        ,
-         0.060388158260582],
-       [ 0.9298639        , -0.1206033        ,  0.3475744        ,
-         0.054292697596663],
-       [ 0.9298639        , -0.3475743        ,  0.1206035        ,
-         0.054292697596663],
-       [ 0.8708526        , -0.1206033        ,  0.4765193        ,
-         0.022782777847022],
-       [ 0.8708526        , -0.3475743        ,  0.3475743        ,
-         0.042764226377752],
-       [ 0.8708526        , -0.4765193        ,  0.1206034        ,
-         0.022782777847022],
-       [ 0.8075404        , -0.1206033        ,  0.5773502        ,
-         0.047443217021681],
-       [ 0.8075404        , -0.3475743        ,  0.4765192        ,
-         0.003731398725247],
-       [ 0.8075404        , -0.4765193        ,  0.3475742        ,
-         0.003731398725247],
-       [ 0.8075404        , -0.5773503        ,  0.1206032        ,
-         0.047443217021681],
-       [ 0.7388226        , -0.1206033        ,  0.6630204        ,
-         0.010165427546721],
-       [ 0.7388226        , -0.3475743        ,  0.5773503        ,
-         0.059373695282411],
-       [ 0.7388226        , -0.4765193        ,  0.4765193        ,
-         0.014665320498354],
-       [ 0.7388226        , -0.5773503        ,  0.3475743        ,
-         0.059373695282411],
-       [ 0.7388226        , -0.6630204        ,  0.1206031        ,
-         0.010165427546721],
-       [ 0.6630204        , -0.1206033        ,  0.7388226        ,
-         0.010165427546721],
-       [ 0.6630204        , -0.3475743        ,  0.6630204        ,
-         0.014665320498354],
-       [ 0.6630204        , -0.4765193        ,  0.5773503        ,
-         0.004854517836557],
-       [ 0.6630204        , -0.5773503        ,  0.4765193        ,
-         0.004854517836557],
-       [ 0.6630204        , -0.6630204        ,  0.3475742        ,
-         0.014665320498354],
-       [ 0.6630204        , -0.7388226        ,  0.1206032        ,
-         0.010165427546721],
-       [ 0.5773503        , -0.1206033        ,  0.8075404        ,
-         0.047443217021681],
-       [ 0.5773503        , -0.3475743        ,  0.7388226        ,
-         0.059373695282411],
-       [ 0.5773503        , -0.4765193        ,  0.6630204        ,
-         0.004854517836557],
-       [ 0.5773503        , -0.5773503        ,  0.5773503        ,
-         0.01787301701253 ],
-       [ 0.5773503        , -0.6630204        ,  0.4765193        ,
-         0.004854517836557],
-       [ 0.5773503        , -0.7388226        ,  0.3475743        ,
-         0.059373695282411],
-       [ 0.5773503        , -0.8075404        ,  0.1206032        ,
-         0.047443217021681],
-       [ 0.4765193        , -0.1206033        ,  0.8708526        ,
-         0.022782777847022],
-       [ 0.4765193        , -0.3475743        ,  0.8075404        ,
-         0.003731398725247],
-       [ 0.4765193        , -0.4765193        ,  0.7388226        ,
-         0.014665320498354],
-       [ 0.4765193        , -0.5773503        ,  0.6630204        ,
-         0.004854517836557],
-       [ 0.4765193        , -0.6630204        ,  0.5773503        ,
-         0.004854517836557],
-       [ 0.4765193        , -0.7388226        ,  0.4765193        ,
-         0.014665320498354],
-       [ 0.4765193        , -0.8075404        ,  0.3475743        ,
-         0.003731398725247],
-       [ 0.4765193        , -0.8708526        ,  0.1206035        ,
-         0.022782777847022],
-       [ 0.3475743        , -0.1206033        ,  0.9298639        ,
-         0.054292697596663],
-       [ 0.3475743        , -0.3475743        ,  0.8708526        ,
-         0.042764226377752],
-       [ 0.3475743        , -0.4765193        ,  0.8075404        ,
-         0.003731398725247],
-       [ 0.3475743        , -0.5773503        ,  0.7388226        ,
-         0.059373695282411],
-       [ 0.3475743        , -0.6630204        ,  0.6630204        ,
-         0.014665320498354],
-       [ 0.3475743        , -0.7388226        ,  0.5773503        ,
-         0.059373695282411],
-       [ 0.3475743        , -0.8075404        ,  0.4765192        ,
-         0.003731398725247],
-       [ 0.3475743        , -0.8708526        ,  0.3475743        ,
-         0.042764226377752],
-       [ 0.3475743        , -0.9298639        ,  0.1206035        ,
-         0.054292697596663],
-       [ 0.1206033        , -0.1206033        ,  0.9853475        ,
-         0.060388158260582],
-       [ 0.1206033        , -0.3475743        ,  0.9298639        ,
-         0.054292697596663],
-       [ 0.1206033        , -0.4765193        ,  0.8708526        ,
-         0.022782777847022],
-       [ 0.1206033        , -0.5773503        ,  0.8075404        ,
-         0.047443217021681],
-       [ 0.1206033        , -0.6630204        ,  0.7388225        ,
-         0.010165427546721],
-       [ 0.1206033        , -0.7388226        ,  0.6630204        ,
-         0.010165427546721],
-       [ 0.1206033        , -0.8075404        ,  0.5773503        ,
-         0.047443217021681],
-       [ 0.1206033        , -0.8708526        ,  0.4765193        ,
-         0.022782777847022],
-       [ 0.1206033        , -0.9298639        ,  0.3475744        ,
-         0.054292697596663],
-       [ 0.9853475        ,  0.1206033        , -0.1206031        ,
-         0.060388158260582],
-       [ 0.9298639        ,  0.1206033        , -0.3475744        ,
-         0.054292697596663],
-       [ 0.9298639        ,  0.3475743        , -0.1206035        ,
-         0.054292697596663],
-       [ 0.8708526        ,  0.1206033        , -0.4765193        ,
-         0.022782777847022],
-       [ 0.8708526        ,  0.3475743        , -0.3475743        ,
-         0.042764226377752],
-       [ 0.8708526        ,  0.4765193        , -0.1206034        ,
-         0.022782777847022],
-       [ 0.8075404        ,  0.1206033        , -0.5773502        ,
-         0.047443217021681],
-       [ 0.8075404        ,  0.3475743        , -0.4765192        ,
-         0.003731398725247],
-       [ 0.8075404        ,  0.4765193        , -0.3475742        ,
-         0.003731398725247],
-       [ 0.8075404        ,  0.5773503        , -0.1206032        ,
-         0.047443217021681],
-       [ 0.7388226        ,  0.1206033        , -0.6630204        ,
-         0.010165427546721],
-       [ 0.7388226        ,  0.3475743        , -0.5773503        ,
-         0.059373695282411],
-       [ 0.7388226        ,  0.4765193        , -0.4765193        ,
-         0.014665320498354],
-       [ 0.7388226        ,  0.5773503        , -0.3475743        ,
-         0.059373695282411],
-       [ 0.7388226        ,  0.6630204        , -0.1206031        ,
-         0.010165427546721],
-       [ 0.6630204        ,  0.1206033        , -0.7388226        ,
-         0.010165427546721],
-       [ 0.6630204        ,  0.3475743        , -0.6630204        ,
-         0.014665320498354],
-       [ 0.6630204        ,  0.4765193        , -0.5773503        ,
-         0.004854517836557],
-       [ 0.6630204        ,  0.5773503        , -0.4765193        ,
-         0.004854517836557],
-       [ 0.6630204        ,  0.6630204        , -0.3475742        ,
-         0.014665320498354],
-       [ 0.6630204        ,  0.7388226        , -0.1206032        ,
-         0.010165427546721],
-       [ 0.5773503        ,  0.1206033        , -0.8075404        ,
-         0.047443217021681],
-       [ 0.5773503        ,  0.3475743        , -0.7388226        ,
-         0.059373695282411],
-       [ 0.5773503        ,  0.4765193        , -0.6630204        ,
-         0.004854517836557],
-       [ 0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.01787301701253 ],
-       [ 0.5773503        ,  0.6630204        , -0.4765193        ,
-         0.004854517836557],
-       [ 0.5773503        ,  0.7388226        , -0.3475743        ,
-         0.059373695282411],
-       [ 0.5773503        ,  0.8075404        , -0.1206032        ,
-         0.047443217021681],
-       [ 0.4765193        ,  0.1206033        , -0.8708526        ,
-         0.022782777847022],
-       [ 0.4765193        ,  0.3475743        , -0.8075404        ,
-         0.003731398725247],
-       [ 0.4765193        ,  0.4765193        , -0.7388226        ,
-         0.014665320498354],
-       [ 0.4765193        ,  0.5773503        , -0.6630204        ,
-         0.004854517836557],
-       [ 0.4765193        ,  0.6630204        , -0.5773503        ,
-         0.004854517836557],
-       [ 0.4765193        ,  0.7388226        , -0.4765193        ,
-         0.014665320498354],
-       [ 0.4765193        ,  0.8075404        , -0.3475743        ,
-         0.003731398725247],
-       [ 0.4765193        ,  0.8708526        , -0.1206035        ,
-         0.022782777847022],
-       [ 0.3475743        ,  0.1206033        , -0.9298639        ,
-         0.054292697596663],
-       [ 0.3475743        ,  0.3475743        , -0.8708526        ,
-         0.042764226377752],
-       [ 0.3475743        ,  0.4765193        , -0.8075404        ,
-         0.003731398725247],
-       [ 0.3475743        ,  0.5773503        , -0.7388226        ,
-         0.059373695282411],
-       [ 0.3475743        ,  0.6630204        , -0.6630204        ,
-         0.014665320498354],
-       [ 0.3475743        ,  0.7388226        , -0.5773503        ,
-         0.059373695282411],
-       [ 0.3475743        ,  0.8075404        , -0.4765192        ,
-         0.003731398725247],
-       [ 0.3475743        ,  0.8708526        , -0.3475743        ,
-         0.042764226377752],
-       [ 0.3475743        ,  0.9298639        , -0.1206035        ,
-         0.054292697596663],
-       [ 0.1206033        ,  0.1206033        , -0.9853475        ,
-         0.060388158260582],
-       [ 0.1206033        ,  0.3475743        , -0.9298639        ,
-         0.054292697596663],
-       [ 0.1206033        ,  0.4765193        , -0.8708526        ,
-         0.022782777847022],
-       [ 0.1206033        ,  0.5773503        , -0.8075404        ,
-         0.047443217021681],
-       [ 0.1206033        ,  0.6630204        , -0.7388225        ,
-         0.010165427546721],
-       [ 0.1206033        ,  0.7388226        , -0.6630204        ,
-         0.010165427546721],
-       [ 0.1206033        ,  0.8075404        , -0.5773503        ,
-         0.047443217021681],
-       [ 0.1206033        ,  0.8708526        , -0.4765193        ,
-         0.022782777847022],
-       [ 0.1206033        ,  0.9298639        , -0.3475744        ,
-         0.054292697596663],
-       [-0.9853475        ,  0.1206033        , -0.1206031        ,
-         0.060388158260582],
-       [-0.9298639        ,  0.1206033        , -0.3475744        ,
-         0.054292697596663],
-       [-0.9298639        ,  0.3475743        , -0.1206035        ,
-         0.054292697596663],
-       [-0.8708526        ,  0.1206033        , -0.4765193        ,
-         0.022782777847022],
-       [-0.8708526        ,  0.3475743        , -0.3475743        ,
-         0.042764226377752],
-       [-0.8708526        ,  0.4765193        , -0.1206034        ,
-         0.022782777847022],
-       [-0.8075404        ,  0.1206033        , -0.5773502        ,
-         0.047443217021681],
-       [-0.8075404        ,  0.3475743        , -0.4765192        ,
-         0.003731398725247],
-       [-0.8075404        ,  0.4765193        , -0.3475742        ,
-         0.003731398725247],
-       [-0.8075404        ,  0.5773503        , -0.1206032        ,
-         0.047443217021681],
-       [-0.7388226        ,  0.1206033        , -0.6630204        ,
-         0.010165427546721],
-       [-0.7388226        ,  0.3475743        , -0.5773503        ,
-         0.059373695282411],
-       [-0.7388226        ,  0.4765193        , -0.4765193        ,
-         0.014665320498354],
-       [-0.7388226        ,  0.5773503        , -0.3475743        ,
-         0.059373695282411],
-       [-0.7388226        ,  0.6630204        , -0.1206031        ,
-         0.010165427546721],
-       [-0.6630204        ,  0.1206033        , -0.7388226        ,
-         0.010165427546721],
-       [-0.6630204        ,  0.3475743        , -0.6630204        ,
-         0.014665320498354],
-       [-0.6630204        ,  0.4765193        , -0.5773503        ,
-         0.004854517836557],
-       [-0.6630204        ,  0.5773503        , -0.4765193        ,
-         0.004854517836557],
-       [-0.6630204        ,  0.6630204        , -0.3475742        ,
-         0.014665320498354],
-       [-0.6630204        ,  0.7388226        , -0.1206032        ,
-         0.010165427546721],
-       [-0.5773503        ,  0.1206033        , -0.8075404        ,
-         0.047443217021681],
-       [-0.5773503        ,  0.3475743        , -0.7388226        ,
-         0.059373695282411],
-       [-0.5773503        ,  0.4765193        , -0.6630204        ,
-         0.004854517836557],
-       [-0.5773503        ,  0.5773503        , -0.5773503        ,
-         0.01787301701253 ],
-       [-0.5773503        ,  0.6630204        , -0.4765193        ,
-         0.004854517836557],
-       [-0.5773503        ,  0.7388226        , -0.3475743        ,
-         0.059373695282411],
-       [-0.5773503        ,  0.8075404        , -0.1206032        ,
-         0.047443217021681],
-       [-0.4765193        ,  0.1206033        , -0.8708526        ,
-         0.022782777847022],
-       [-0.4765193        ,  0.3475743        , -0.8075404        ,
-         0.003731398725247],
-       [-0.4765193        ,  0.4765193        , -0.7388226        ,
-         0.014665320498354],
-       [-0.4765193        ,  0.5773503        , -0.6630204        ,
-         0.004854517836557],
-       [-0.4765193        ,  0.6630204        , -0.5773503        ,
-         0.004854517836557],
-       [-0.4765193        ,  0.7388226        , -0.4765193        ,
-         0.014665320498354],
-       [-0.4765193        ,  0.8075404        , -0.3475743        ,
-         0.003731398725247],
-       [-0.4765193        ,  0.8708526        , -0.1206035        ,
-         0.022782777847022],
-       [-0.3475743        ,  0.1206033        , -0.9298639        ,
-         0.054292697596663],
-       [-0.3475743        ,  0.3475743        , -0.8708526        ,
-         0.042764226377752],
-       [-0.3475743        ,  0.4765193        , -0.8075404        ,
-         0.003731398725247],
-       [-0.3475743        ,  0.5773503        , -0.7388226        ,
-         0.059373695282411],
-       [-0.3475743        ,  0.6630204        , -0.6630204        ,
-         0.014665320498354],
-       [-0.3475743        ,  0.7388226        , -0.5773503        ,
-         0.059373695282411],
-       [-0.3475743        ,  0.8075404        , -0.4765192        ,
-         0.003731398725247],
-       [-0.3475743        ,  0.8708526        , -0.3475743        ,
-         0.042764226377752],
-       [-0.3475743        ,  0.9298639        , -0.1206035        ,
-         0.054292697596663],
-       [-0.1206033        ,  0.1206033        , -0.9853475        ,
-         0.060388158260582],
-       [-0.1206033        ,  0.3475743        , -0.9298639        ,
-         0.054292697596663],
-       [-0.1206033        ,  0.4765193        , -0.8708526        ,
-         0.022782777847022],
-       [-0.1206033        ,  0.5773503        , -0.8075404        ,
-         0.047443217021681],
-       [-0.1206033        ,  0.6630204        , -0.7388225        ,
-         0.010165427546721],
-       [-0.1206033        ,  0.7388226        , -0.6630204        ,
-         0.010165427546721],
-       [-0.1206033        ,  0.8075404        , -0.5773503        ,
-         0.047443217021681],
-       [-0.1206033        ,  0.8708526        , -0.4765193        ,
-         0.022782777847022],
-       [-0.1206033        ,  0.9298639        , -0.3475744        ,
-         0.054292697596663],
-       [-0.9853475        , -0.1206033        , -0.1206031        ,
-         0.060388158260582],
-       [-0.9298639        , -0.1206033        , -0.3475744        ,
-         0.054292697596663],
-       [-0.9298639        , -0.3475743        , -0.1206035        ,
-         0.054292697596663],
-       [-0.8708526        , -0.1206033        , -0.4765193        ,
-         0.022782777847022],
-       [-0.8708526        , -0.3475743        , -0.3475743        ,
-         0.042764226377752],
-       [-0.8708526        , -0.4765193        , -0.1206034        ,
-         0.022782777847022],
-       [-0.8075404        , -0.1206033        , -0.5773502        ,
-         0.047443217021681],
-       [-0.8075404        , -0.3475743        , -0.4765192        ,
-         0.003731398725247],
-       [-0.8075404        , -0.4765193        , -0.3475742        ,
-         0.003731398725247],
-       [-0.8075404        , -0.5773503        , -0.1206032        ,
-         0.047443217021681],
-       [-0.7388226        , -0.1206033        , -0.6630204        ,
-         0.010165427546721],
-       [-0.7388226        , -0.3475743        , -0.5773503        ,
-         0.059373695282411],
-       [-0.7388226        , -0.4765193        , -0.4765193        ,
-         0.014665320498354],
-       [-0.7388226        , -0.5773503        , -0.3475743        ,
-         0.059373695282411],
-       [-0.7388226        , -0.6630204        , -0.1206031        ,
-         0.010165427546721],
-       [-0.6630204        , -0.1206033        , -0.7388226        ,
-         0.010165427546721],
-       [-0.6630204        , -0.3475743        , -0.6630204        ,
-         0.014665320498354],
-       [-0.6630204        , -0.4765193        , -0.5773503        ,
-         0.004854517836557],
-       [-0.6630204        , -0.5773503        , -0.4765193        ,
-         0.004854517836557],
-       [-0.6630204        , -0.6630204        , -0.3475742        ,
-         0.014665320498354],
-       [-0.6630204        , -0.7388226        , -0.1206032        ,
-         0.010165427546721],
-       [-0.5773503        , -0.1206033        , -0.8075404        ,
-         0.047443217021681],
-       [-0.5773503        , -0.3475743        , -0.7388226        ,
-         0.059373695282411],
-       [-0.5773503        , -0.4765193        , -0.6630204        ,
-         0.004854517836557],
-       [-0.5773503        , -0.5773503        , -0.5773503        ,
-         0.01787301701253 ],
-       [-0.5773503        , -0.6630204        , -0.4765193        ,
-         0.004854517836557],
-       [-0.5773503        , -0.7388226        , -0.3475743        ,
-         0.059373695282411],
-       [-0.5773503        , -0.8075404        , -0.1206032        ,
-         0.047443217021681],
-       [-0.4765193        , -0.1206033        , -0.8708526        ,
-         0.022782777847022],
-       [-0.4765193        , -0.3475743        , -0.8075404        ,
-         0.003731398725247],
-       [-0.4765193        , -0.4765193        , -0.7388226        ,
-         0.014665320498354],
-       [-0.4765193        , -0.5773503        , -0.6630204        ,
-         0.004854517836557],
-       [-0.4765193        , -0.6630204        , -0.5773503        ,
-         0.004854517836557],
-       [-0.4765193        , -0.7388226        , -0.4765193        ,
-         0.014665320498354],
-       [-0.4765193        , -0.8075404        , -0.3475743        ,
-         0.003731398725247],
-       [-0.4765193        , -0.8708526        , -0.1206035        ,
-         0.022782777847022],
-       [-0.3475743        , -0.1206033        , -0.9298639        ,
-         0.054292697596663],
-       [-0.3475743        , -0.3475743        , -0.8708526        ,
-         0.042764226377752],
-       [-0.3475743        , -0.4765193        , -0.8075404        ,
-         0.003731398725247],
-       [-0.3475743        , -0.5773503        , -0.7388226        ,
-         0.059373695282411],
-       [-0.3475743        , -0.6630204        , -0.6630204        ,
-         0.014665320498354],
-       [-0.3475743        , -0.7388226        , -0.5773503        ,
-         0.059373695282411],
-       [-0.3475743        , -0.8075404        , -0.4765192        ,
-         0.003731398725247],
-       [-0.3475743        , -0.8708526        , -0.3475743        ,
-         0.042764226377752],
-       [-0.3475743        , -0.9298639        , -0.1206035        ,
-         0.054292697596663],
-       [-0.1206033        , -0.1206033        , -0.9853475        ,
-         0.060388158260582],
-       [-0.1206033        , -0.3475743        , -0.9298639        ,
-         0.054292697596663],
-       [-0.1206033        , -0.4765193        , -0.8708526        ,
-         0.022782777847022],
-       [-0.1206033        , -0.5773503        , -0.8075404        ,
-         0.047443217021681],
-       [-0.1206033        , -0.6630204        , -0.7388225        ,
-         0.010165427546721],
-       [-0.1206033        , -0.7388226        , -0.6630204        ,
-         0.010165427546721],
-       [-0.1206033        , -0.8075404        , -0.5773503        ,
-         0.047443217021681],
-       [-0.1206033        , -0.8708526        , -0.4765193        ,
-         0.022782777847022],
-       [-0.1206033        , -0.9298639        , -0.3475744        ,
-         0.054292697596663],
-       [ 0.9853475        , -0.1206033        , -0.1206031        ,
-         0.060388158260582],
-       [ 0.9298639        , -0.1206033        , -0.3475744        ,
-         0.054292697596663],
-       [ 0.9298639        , -0.3475743        , -0.1206035        ,
-         0.054292697596663],
-       [ 0.8708526        , -0.1206033        , -0.4765193        ,
-         0.022782777847022],
-       [ 0.8708526        , -0.3475743        , -0.3475743        ,
-         0.042764226377752],
-       [ 0.8708526        , -0.4765193        , -0.1206034        ,
-         0.022782777847022],
-       [ 0.8075404        , -0.1206033        , -0.5773502        ,
-         0.047443217021681],
-       [ 0.8075404        , -0.3475743        , -0.4765192        ,
-         0.003731398725247],
-       [ 0.8075404        , -0.4765193        , -0.3475742        ,
-         0.003731398725247],
-       [ 0.8075404        , -0.5773503        , -0.1206032        ,
-         0.047443217021681],
-       [ 0.7388226        , -0.1206033        , -0.6630204        ,
-         0.010165427546721],
-       [ 0.7388226        , -0.3475743        , -0.5773503        ,
-         0.059373695282411],
-       [ 0.7388226        , -0.4765193        , -0.4765193        ,
-         0.014665320498354],
-       [ 0.7388226        , -0.5773503        , -0.3475743        ,
-         0.059373695282411],
-       [ 0.7388226        , -0.6630204        , -0.1206031        ,
-         0.010165427546721],
-       [ 0.6630204        , -0.1206033        , -0.7388226        ,
-         0.010165427546721],
-       [ 0.6630204        , -0.3475743        , -0.6630204        ,
-         0.014665320498354],
-       [ 0.6630204        , -0.4765193        , -0.5773503        ,
-         0.004854517836557],
-       [ 0.6630204        , -0.5773503        , -0.4765193        ,
-         0.004854517836557],
-       [ 0.6630204        , -0.6630204        , -0.3475742        ,
-         0.014665320498354],
-       [ 0.6630204        , -0.7388226        , -0.1206032        ,
-         0.010165427546721],
-       [ 0.5773503        , -0.1206033        , -0.8075404        ,
-         0.047443217021681],
-       [ 0.5773503        , -0.3475743        , -0.7388226        ,
-         0.059373695282411],
-       [ 0.5773503        , -0.4765193        , -0.6630204        ,
-         0.004854517836557],
-       [ 0.5773503        , -0.5773503        , -0.5773503        ,
-         0.01787301701253 ],
-       [ 0.5773503        , -0.6630204        , -0.4765193        ,
-         0.004854517836557],
-       [ 0.5773503        , -0.7388226        , -0.3475743        ,
-         0.059373695282411],
-       [ 0.5773503        , -0.8075404        , -0.1206032        ,
-         0.047443217021681],
-       [ 0.4765193        , -0.1206033        , -0.8708526        ,
-         0.022782777847022],
-       [ 0.4765193        , -0.3475743        , -0.8075404        ,
-         0.003731398725247],
-       [ 0.4765193        , -0.4765193        , -0.7388226        ,
-         0.014665320498354],
-       [ 0.4765193        , -0.5773503        , -0.6630204        ,
-         0.004854517836557],
-       [ 0.4765193        , -0.6630204        , -0.5773503        ,
-         0.004854517836557],
-       [ 0.4765193        , -0.7388226        , -0.4765193        ,
-         0.014665320498354],
-       [ 0.4765193        , -0.8075404        , -0.3475743        ,
-         0.003731398725247],
-       [ 0.4765193        , -0.8708526        , -0.1206035        ,
-         0.022782777847022],
-       [ 0.3475743        , -0.1206033        , -0.9298639        ,
-         0.054292697596663],
-       [ 0.3475743        , -0.3475743        , -0.8708526        ,
-         0.042764226377752],
-       [ 0.3475743        , -0.4765193        , -0.8075404        ,
-         0.003731398725247],
-       [ 0.3475743        , -0.5773503        , -0.7388226        ,
-         0.059373695282411],
-       [ 0.3475743        , -0.6630204        , -0.6630204        ,
-         0.014665320498354],
-       [ 0.3475743        , -0.7388226        , -0.5773503        ,
-         0.059373695282411],
-       [ 0.3475743        , -0.8075404        , -0.4765192        ,
-         0.003731398725247],
-       [ 0.3475743        , -0.8708526        , -0.3475743        ,
-         0.042764226377752],
-       [ 0.3475743        , -0.9298639        , -0.1206035        ,
-         0.054292697596663],
-       [ 0.1206033        , -0.1206033        , -0.9853475        ,
-         0.060388158260582],
-       [ 0.1206033        , -0.3475743        , -0.9298639        ,
-         0.054292697596663],
-       [ 0.1206033        , -0.4765193        , -0.8708526        ,
-         0.022782777847022],
-       [ 0.1206033        , -0.5773503        , -0.8075404        ,
-         0.047443217021681],
-       [ 0.1206033        , -0.6630204        , -0.7388225        ,
-         0.010165427546721],
-       [ 0.1206033        , -0.7388226        , -0.6630204        ,
-         0.010165427546721],
-       [ 0.1206033        , -0.8075404        , -0.5773503        ,
-         0.047443217021681],
-       [ 0.1206033        , -0.8708526        , -0.4765193        ,
-         0.022782777847022],
-       [ 0.1206033        , -0.9298639        , -0.3475744        ,
-         0.054292697596663]])})
+    """Returns the dictionary {order: xyzw} of Levelsymmetric quadratures."""
+    return TableArchive(resource(__package__, "writtendict.npz"))
@@ -1,6 +1,6 @@
 """Monte Carlo Quadrature uses random quadrature points and equal
 weights to integrate a function."""
-from numpy import pi, ones, inf
+from numpy import pi, ones, inf, asarray, maximum
 from numpy.random import randn
 from numpy.linalg import norm
 from sphericalquadpy.quadrature.quadrature import Quadrature
@@ -19,6 +19,19 @@ class MonteCarlo(Quadrature):
         """For MonteCarlo, order = nq"""
         return order, order
 
+    def getcorrespondingorder(self, nquadpoints_desired):
+        """For MonteCarlo, order = nq"""
+        return max(int(nquadpoints_desired), 0)
+
+    def nqbyorders(self, orders):
+        """For MonteCarlo, order = nq"""
+        orders = asarray(orders)
+        return orders, orders
+
+    def getcorrespondingorders(self, nquadpoints_desired):
+        """For MonteCarlo, order = nq"""
+        return maximum(asarray(nquadpoints_desired).astype(int), 0)
+
     def computequadpoints(self, order):
         """Random points on the sphere can be generated
         by normalizing normally distributed points on the sphere."""